@@ -0,0 +1,68 @@
+"""
+Background execution for work that should not hold a request thread.
+
+Jobs run on a small process-wide thread pool that is created on first use,
+so it is never inherited across a fork.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the executor for the current process, creating it if needed."""
+    global _executor, _executor_pid
+
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BACKGROUND_WORKERS,
+                thread_name_prefix="te-background",
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def submit(fn: Callable, *args, **kwargs) -> Future:
+    """Schedule `fn` on the background executor and log unhandled failures."""
+    future = get_executor().submit(fn, *args, **kwargs)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def queue_depth() -> int:
+    """Number of submitted jobs that have not started yet."""
+    executor = _executor
+    if executor is None or _executor_pid != os.getpid():
+        return 0
+    return executor._work_queue.qsize()
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop accepting jobs and optionally wait for running ones to finish."""
+    global _executor, _executor_pid
+
+    with _lock:
+        if _executor is not None and _executor_pid == os.getpid():
+            _executor.shutdown(wait=wait)
+        _executor = None
+        _executor_pid = None
+
+
+def _log_failure(future: Future) -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background job failed: %s", exc, exc_info=exc)
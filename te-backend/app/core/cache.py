@@ -0,0 +1,63 @@
+"""
+In-process caches for data that changes rarely.
+
+Each cache is stamped with a version number stored in the `cache_versions`
+collection. Writers bump the version, which drops the local copy immediately
+and tells other workers to reload on their next version check.
+"""
+
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+from pymongo.database import Database
+
+from app.core.settings import settings
+
+T = TypeVar("T")
+
+
+def read_version(db: Database, key: str) -> int:
+    version = db.cache_versions.find_one({"_id": key}, {"version": 1})
+    return version["version"] if version else 0
+
+
+def bump_version(db: Database, key: str) -> None:
+    db.cache_versions.update_one({"_id": key}, {"$inc": {"version": 1}}, upsert=True)
+
+
+class VersionedCache(Generic[T]):
+    """Hold a value built by `loader` until the stored version changes."""
+
+    def __init__(self, key: str, loader: Callable[[Database], T]):
+        self.key = key
+        self.loader = loader
+        self._lock = threading.Lock()
+        # (version, value, checked_at), replaced as a whole so that the
+        # lock-free read below never sees a value from a different state
+        self._entry: Optional[tuple[int, T, float]] = None
+
+    def get(self, db: Database) -> T:
+        entry = self._entry
+        if (
+            entry is not None
+            and time.monotonic() - entry[2] < settings.CACHE_VERSION_CHECK_SECONDS
+        ):
+            return entry[1]
+
+        with self._lock:
+            # Read the version before loading so a concurrent write is never missed
+            version = read_version(db, self.key)
+            entry = self._entry
+            if entry is not None and entry[0] == version:
+                value = entry[1]
+            else:
+                value = self.loader(db)
+            self._entry = (version, value, time.monotonic())
+            return value
+
+    def invalidate(self, db: Database) -> None:
+        """Bump the shared version and drop this worker's copy."""
+        bump_version(db, self.key)
+        with self._lock:
+            self._entry = None
@@ -0,0 +1,62 @@
+"""
+Per-request context.
+
+The request middleware puts a `RequestContext` in a context variable for
+the duration of each request, and code further down (dependencies, the
+MongoDB command listener) records into it. The object is mutated rather
+than replaced: sync endpoints and dependencies run in worker threads on a
+copy of the context, so only changes to the shared object reach the
+middleware.
+"""
+
+import threading
+from contextvars import ContextVar, Token
+from typing import Optional
+
+
+class RequestContext:
+    __slots__ = ("request_id", "role", "db_queries", "db_time", "_lock")
+
+    def __init__(self, request_id: str) -> None:
+        self.request_id = request_id
+        self.role = "anonymous"
+        self.db_queries = 0
+        self.db_time = 0.0  # Seconds spent in MongoDB commands
+        # Commands of one request can finish on several threads at once
+        self._lock = threading.Lock()
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar(
+    "request_context", default=None
+)
+
+
+def start_request(request_id: str) -> tuple[RequestContext, Token]:
+    """Create the context for a new request; pass the token to `end_request`."""
+    context = RequestContext(request_id)
+    return context, _request_context.set(context)
+
+
+def end_request(token: Token) -> None:
+    _request_context.reset(token)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """The current request's context, or None outside of a request."""
+    return _request_context.get()
+
+
+def record_db_command(duration: float) -> None:
+    """Attribute a MongoDB command to the current request, if any."""
+    context = _request_context.get()
+    if context is not None:
+        with context._lock:
+            context.db_queries += 1
+            context.db_time += duration
+
+
+def set_user_role(role: str) -> None:
+    """Record the authenticated user's role for the current request."""
+    context = _request_context.get()
+    if context is not None:
+        context.role = role
@@ -0,0 +1,117 @@
+"""
+Structured, non-blocking logging.
+
+`configure_logging` routes every log record through a `QueueHandler`: the
+calling thread (often the event loop) only enqueues the record, and a
+`QueueListener` thread formats it as one JSON object per line and writes it
+out. Records are stamped with the current request id when they are created,
+so lines emitted on behalf of a request can be correlated.
+
+The writer thread does not survive a fork, so a forked worker (see
+gunicorn.conf.py) starts its own.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+import orjson
+
+from app.core import context
+
+# Attributes every LogRecord has; anything else was passed in `extra=`
+_RECORD_ATTRIBUTES = set(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+_traceback_formatter = logging.Formatter()
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the id of the request they were logged in."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_context = context.get_request_context()
+        record.request_id = request_context.request_id if request_context else None
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default prepare() formats the whole record on the calling thread.
+        # Only render the traceback here, so the record does not keep frames
+        # alive in the queue, and leave the rest to the listener thread.
+        if record.exc_info:
+            record.exc_text = record.exc_text or _traceback_formatter.formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: int | str = logging.INFO) -> None:
+    """Send all logging through a background JSON writer. Safe to call twice."""
+    global _listener
+
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter())
+
+    queue_handler = _DeferredFormatQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    os.register_at_fork(after_in_child=_restart_listener)
+
+
+def _restart_listener() -> None:
+    global _listener
+
+    if _listener is not None:
+        _listener = QueueListener(
+            _listener.queue, *_listener.handlers, respect_handler_level=True
+        )
+        _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
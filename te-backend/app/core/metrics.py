@@ -0,0 +1,391 @@
+"""
+In-process metrics.
+
+A small thread-safe registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format by the `/metrics` endpoint. Metrics
+are per process. With several workers (see gunicorn.conf.py) each worker
+also writes a snapshot of its series to METRICS_MULTIPROC_DIR, and
+`/metrics` merges every worker's snapshot whichever worker answers it.
+"""
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Iterator, Optional
+
+import anyio.to_thread
+
+import app.core.background as background
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _render(name: str, type: str, documentation: str, samples) -> str:
+    lines = [f"# HELP {name} {_escape(documentation)}", f"# TYPE {name} {type}"]
+    for sample_name, labels, value in samples:
+        lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines)
+
+
+class Metric(ABC):
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    @abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        ...
+
+    def render(self) -> str:
+        return _render(self.name, self.type, self.documentation, self.samples())
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield f"{self.name}_total", self._labels(key), value
+
+
+class Gauge(Metric):
+    """A value that goes up and down, or is read from a callback on render."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        function: Optional[Callable[[], float]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+        self._function = function
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> Iterator[Sample]:
+        if self._function is not None:
+            yield self.name, {}, self._function()
+            return
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            yield self.name, self._labels(key), value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            series = [
+                (key, list(counts), total)
+                for key, (counts, total) in self._series.items()
+            ]
+        for key, counts, total in series:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    cumulative,
+                )
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, total
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def metrics(self) -> list[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self.metrics()) + "\n"
+
+
+REGISTRY = Registry()
+
+
+# ============= Application Metrics =============
+
+HTTP_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template, status code and user role.",
+        ("method", "route", "status", "role"),
+    )
+)
+
+MONGODB_COMMAND_DURATION = REGISTRY.register(
+    Histogram(
+        "mongodb_command_duration_seconds",
+        "MongoDB command latency as reported by the driver.",
+        ("command",),
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    )
+)
+
+MONGODB_COMMAND_FAILURES = REGISTRY.register(
+    Counter(
+        "mongodb_command_failures",
+        "MongoDB commands that returned an error.",
+        ("command",),
+    )
+)
+
+MONGODB_POOL_CHECKOUT_WAIT = REGISTRY.register(
+    Histogram(
+        "mongodb_pool_checkout_wait_seconds",
+        "Time spent waiting to check a connection out of the MongoDB pool.",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+    )
+)
+
+MONGODB_POOL_CHECKOUT_FAILURES = REGISTRY.register(
+    Counter(
+        "mongodb_pool_checkout_failures",
+        "Connection checkouts that failed (timeout = the pool was exhausted).",
+        ("reason",),
+    )
+)
+
+MONGODB_POOL_CONNECTIONS = REGISTRY.register(
+    Gauge(
+        "mongodb_pool_connections",
+        "Open connections in the MongoDB pool, per server.",
+        ("address",),
+    )
+)
+
+MONGODB_POOL_CHECKED_OUT = REGISTRY.register(
+    Gauge(
+        "mongodb_pool_connections_in_use",
+        "Connections checked out of the MongoDB pool, per server.",
+        ("address",),
+    )
+)
+
+MONGODB_POOL_WAITING = REGISTRY.register(
+    Gauge(
+        "mongodb_pool_checkouts_waiting",
+        "Threads waiting for a MongoDB connection (the pool is saturated when > 0).",
+    )
+)
+
+MONGODB_POOL_MAX_SIZE = REGISTRY.register(
+    Gauge("mongodb_pool_max_size", "Configured maximum size of each MongoDB pool.")
+)
+
+THREADPOOL_BORROWED = REGISTRY.register(
+    Gauge(
+        "threadpool_tokens_in_use",
+        "Worker threads busy running sync endpoints and dependencies.",
+    )
+)
+
+THREADPOOL_TOTAL = REGISTRY.register(
+    Gauge("threadpool_tokens_total", "Size of the sync endpoint thread pool.")
+)
+
+THREADPOOL_WAITING = REGISTRY.register(
+    Gauge(
+        "threadpool_tasks_waiting",
+        "Sync calls queued for a worker thread (the pool is saturated when > 0).",
+    )
+)
+
+BCRYPT_IN_PROGRESS = REGISTRY.register(
+    Gauge(
+        "bcrypt_operations_in_progress",
+        "Password hashes and verifications running or waiting for CPU.",
+    )
+)
+
+BCRYPT_DURATION = REGISTRY.register(
+    Histogram(
+        "bcrypt_operation_duration_seconds",
+        "Time spent hashing or verifying a password.",
+        ("operation",),
+    )
+)
+
+
+BACKGROUND_JOBS_QUEUED = REGISTRY.register(
+    Gauge(
+        "background_jobs_queued",
+        "Background jobs waiting for a worker.",
+        function=background.queue_depth,
+    )
+)
+
+
+def collect_threadpool_stats() -> None:
+    """Sample the sync endpoint thread pool. Must run on the event loop."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    THREADPOOL_BORROWED.set(limiter.borrowed_tokens)
+    THREADPOOL_TOTAL.set(limiter.total_tokens)
+    THREADPOOL_WAITING.set(limiter.statistics().tasks_waiting)
+
+
+# ============= Multi-process =============
+
+
+def _snapshot_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"worker-{pid}.json")
+
+
+def write_snapshot(directory: str) -> None:
+    """Write this process's series to `directory`, replacing its last snapshot."""
+    snapshot = [
+        {
+            "name": metric.name,
+            "type": metric.type,
+            "documentation": metric.documentation,
+            "samples": list(metric.samples()),
+        }
+        for metric in REGISTRY.metrics()
+    ]
+    path = _snapshot_path(directory, os.getpid())
+    with open(f"{path}.tmp", "w") as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+    os.replace(f"{path}.tmp", path)  # Readers never see a partial file
+
+
+def remove_snapshot(directory: str, pid: int) -> None:
+    """Drop an exited worker's snapshot so its series stop being reported."""
+    path = _snapshot_path(directory, pid)
+    for candidate in (path, f"{path}.tmp"):
+        try:
+            os.remove(candidate)
+        except FileNotFoundError:
+            pass
+
+
+def render_snapshots(directory: str) -> str:
+    """
+    Every worker's series in the text format, each labelled with the `worker`
+    pid that produced it. This process's snapshot is refreshed first; the
+    others are at most METRICS_PUBLISH_SECONDS old.
+    """
+    write_snapshot(directory)
+
+    merged: dict[str, tuple[str, str, list[Sample]]] = {}
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith("worker-") and filename.endswith(".json")):
+            continue
+        worker = filename[len("worker-") : -len(".json")]
+        try:
+            with open(os.path.join(directory, filename)) as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        except (OSError, ValueError):
+            continue  # Removed by the master after the worker exited
+        for metric in snapshot:
+            _, _, samples = merged.setdefault(
+                metric["name"], (metric["type"], metric["documentation"], [])
+            )
+            samples.extend(
+                (name, {**labels, "worker": worker}, value)
+                for name, labels, value in metric["samples"]
+            )
+
+    return (
+        "\n".join(
+            _render(name, type, documentation, samples)
+            for name, (type, documentation, samples) in merged.items()
+        )
+        + "\n"
+    )
@@ -0,0 +1,178 @@
+"""
+Request middleware.
+
+A single pure-ASGI middleware that replaces the per-request
+`@app.middleware("http")` layers. `BaseHTTPMiddleware` runs every request
+in an extra task and re-wraps the response body stream; this works on the
+raw ASGI messages instead, so streaming responses pass through untouched.
+"""
+
+import logging
+import random
+import re
+import time
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import context
+from app.core.metrics import HTTP_REQUEST_DURATION
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+}
+
+
+class RequestMiddleware:
+    """
+    Times, logs and records metrics for every HTTP request, and adds security
+    headers to responses. Latency is recorded by route template (not raw
+    path) so that requests to the same endpoint share a series.
+
+    Each request gets an id (the caller's `X-Request-ID` when it is sane, a
+    new one otherwise) that is echoed back and attached to every log record
+    emitted while handling it. Errors and slow requests are always logged;
+    other requests are logged at `success_sample_rate`.
+
+    CORS preflights are left to `CORSMiddleware` when CORS is enabled. Any
+    other OPTIONS request is answered here, so it never reaches routing or
+    authentication.
+
+    With `debug`, responses carry the request's MongoDB query count and time
+    in `X-DB-Queries` and `Server-Timing` headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        cors_enabled: bool = False,
+        debug: bool = False,
+        success_sample_rate: float = 1.0,
+        slow_request_ms: int = 1000,
+    ) -> None:
+        self.app = app
+        self.cors_enabled = cors_enabled
+        self.debug = debug
+        self.success_sample_rate = success_sample_rate
+        self.slow_request_seconds = slow_request_ms / 1000
+
+    def _is_cors_preflight(self, scope: Scope) -> bool:
+        headers = Headers(scope=scope)
+        return "origin" in headers and "access-control-request-method" in headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        if not _REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid4().hex
+        request_context, context_token = context.start_request(request_id)
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.update(SECURITY_HEADERS)
+                headers[REQUEST_ID_HEADER] = request_id
+                if self.debug:
+                    headers.update(_db_timing_headers(request_context, start_time))
+            await send(message)
+
+        try:
+            if scope["method"] == "OPTIONS" and not (
+                self.cors_enabled and self._is_cors_preflight(scope)
+            ):
+                response = Response(
+                    status_code=200,
+                    headers={"Allow": "GET, POST, PUT, DELETE, PATCH, OPTIONS"},
+                )
+                await response(scope, receive, send_with_headers)
+            else:
+                await self.app(scope, receive, send_with_headers)
+        finally:
+            process_time = time.perf_counter() - start_time
+            route = _route_template(scope)
+            HTTP_REQUEST_DURATION.observe(
+                process_time,
+                method=scope["method"],
+                route=route,
+                status=status_code,
+                role=request_context.role,
+            )
+            self._log_request(
+                scope, route, status_code, process_time, request_context
+            )
+            context.end_request(context_token)
+
+    def _log_request(
+        self,
+        scope: Scope,
+        route: str,
+        status_code: int,
+        process_time: float,
+        request_context: context.RequestContext,
+    ) -> None:
+        slow = process_time >= self.slow_request_seconds
+        if status_code >= 500:
+            level = logging.ERROR
+        elif slow:
+            level = logging.WARNING
+        elif status_code >= 400 or random.random() < self.success_sample_rate:
+            level = logging.INFO
+        else:
+            return
+
+        logger.log(
+            level,
+            "%s %s %s",
+            scope["method"],
+            scope["path"],
+            status_code,
+            extra={
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route,
+                "status": status_code,
+                "duration_ms": round(process_time * 1000, 2),
+                "db_queries": request_context.db_queries,
+                "db_ms": round(request_context.db_time * 1000, 2),
+                "role": request_context.role,
+                "slow": slow,
+            },
+        )
+
+
+def _db_timing_headers(
+    request_context: context.RequestContext, start_time: float
+) -> dict[str, str]:
+    db_ms = request_context.db_time * 1000
+    total_ms = (time.perf_counter() - start_time) * 1000
+    return {
+        "X-DB-Queries": str(request_context.db_queries),
+        "Server-Timing": (
+            f'db;dur={db_ms:.1f};desc="{request_context.db_queries} queries", '
+            f"app;dur={total_ms:.1f}"
+        ),
+    }
+
+
+def _route_template(scope: Scope) -> str:
+    """Path template of the matched route (e.g. /api/v1/users/{user_id})."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
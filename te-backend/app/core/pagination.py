@@ -0,0 +1,166 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are addressed by an opaque cursor holding the sort key values of the
+last item on the previous page. The next page is fetched with a range
+filter on those values instead of `.skip()`, so every page costs the same
+index seek no matter how deep it is. Sorts always end on `_id` so that
+the keys are unique.
+"""
+
+import base64
+from typing import Any, NamedTuple, Optional
+
+import bson
+from bson.errors import BSONError
+from fastapi import HTTPException, status
+from pymongo.collection import Collection
+
+Sort = list[tuple[str, int]]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Page(NamedTuple):
+    items: list[dict]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode sort key values (ObjectIds, datetimes, strings...) as a URL-safe token."""
+    return base64.urlsafe_b64encode(bson.encode({"k": values})).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        return bson.decode(base64.urlsafe_b64decode(cursor.encode("ascii")))["k"]
+    except (BSONError, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def next_cursor_headers(next_cursor: Optional[str]) -> dict[str, str]:
+    """Response headers advertising the next page, for list-shaped responses."""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+
+def with_id_tiebreak(sort: Sort) -> Sort:
+    """Append `_id` to a sort so that sort keys are unique."""
+    if sort and sort[-1][0] == "_id":
+        return list(sort)
+    direction = sort[-1][1] if sort else 1
+    return [*sort, ("_id", direction)]
+
+
+def _get_path(document: dict, path: str) -> Any:
+    value = document
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def cursor_for(document: dict, sort: Sort) -> str:
+    """Cursor pointing just after `document` in `sort` order."""
+    return encode_cursor([_get_path(document, field) for field, _ in sort])
+
+
+def keyset_filter(sort: Sort, values: list[Any]) -> dict:
+    """
+    Filter matching documents strictly after `values` in `sort` order:
+    (a > x) or (a == x and b > y) or ...
+    """
+    if len(values) != len(sort):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[i]}
+        clauses.append(clause)
+
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def paginate_query(query: dict, sort: Sort, cursor: Optional[str]) -> dict:
+    """Combine a query with the keyset filter for `cursor`, if any."""
+    if not cursor:
+        return query
+    after = keyset_filter(sort, decode_cursor(cursor))
+    return {"$and": [query, after]} if query else after
+
+
+def paginate(
+    collection: Collection,
+    query: dict,
+    *,
+    sort: Sort,
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: Optional[dict] = None,
+) -> Page:
+    """Fetch one page of `collection` and the cursor for the page after it."""
+    sort = with_id_tiebreak(sort)
+    documents = list(
+        collection.find(paginate_query(query, sort, cursor), projection)
+        .sort(sort)
+        .limit(limit + 1)
+    )
+
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = cursor_for(documents[-1], sort)
+
+    return Page(items=documents, next_cursor=next_cursor)
+
+
+class CountedPage(NamedTuple):
+    items: list[dict]
+    next_cursor: Optional[str]
+    total: int
+
+
+def paginate_with_total(
+    collection: Collection,
+    query: dict,
+    *,
+    sort: Sort,
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: Optional[dict] = None,
+) -> CountedPage:
+    """
+    Fetch one page and the total number of documents matching `query` in a
+    single aggregation. The leading `$match` and `$sort` run before the
+    `$facet`, so they use the same index as `paginate`; the facet then
+    takes the page after `cursor` and counts the whole match.
+    """
+    sort = with_id_tiebreak(sort)
+    items: list[dict] = []
+    if cursor:
+        items.append({"$match": keyset_filter(sort, decode_cursor(cursor))})
+    items.append({"$limit": limit + 1})
+    if projection:
+        items.append({"$project": projection})
+
+    result = next(
+        collection.aggregate(
+            [
+                {"$match": query},
+                {"$sort": dict(sort)},
+                {"$facet": {"items": items, "total": [{"$count": "total"}]}},
+            ]
+        )
+    )
+
+    documents = result["items"]
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = cursor_for(documents[-1], sort)
+
+    total = result["total"][0]["total"] if result["total"] else 0
+    return CountedPage(items=documents, next_cursor=next_cursor, total=total)
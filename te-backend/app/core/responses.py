@@ -0,0 +1,38 @@
+"""
+Fast JSON responses.
+
+`ORJSONResponse` is the application's default response class. It encodes
+with orjson and understands ObjectIds and pydantic models on top of what
+orjson handles natively (datetimes, enums, UUIDs, dataclasses), so documents
+that come straight out of MongoDB can be returned without walking them in
+Python first. Returning a response instance from a handler also skips
+FastAPI's response-model validation, which is what the trusted list
+endpoints want.
+"""
+
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize `content` to JSON bytes (datetimes as ISO 8601, ObjectIds as hex)."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,8 +1,11 @@
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 
 import app.ents.user.crud as user_crud
 import app.ents.user.models as user_models
+from app.core.metrics import BCRYPT_DURATION, BCRYPT_IN_PROGRESS
 from app.core.settings import settings
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -62,15 +65,29 @@ def generate_password_reset_token(
     return encoded_jwt
 
 
+@contextmanager
+def _bcrypt_operation(operation: str):
+    """Track bcrypt work in flight; hashes are CPU-bound and queue up under load."""
+    BCRYPT_IN_PROGRESS.inc()
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        BCRYPT_IN_PROGRESS.dec()
+        BCRYPT_DURATION.observe(time.perf_counter() - start_time, operation=operation)
+
+
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    with _bcrypt_operation("hash"):
+        return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Checks if `plain_password` is `hashed_password`.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    with _bcrypt_operation("verify"):
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 def verify_password_reset_token(token: str) -> Optional[dict[str, Optional[str]]]:
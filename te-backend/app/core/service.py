@@ -1,12 +1,14 @@
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+# The Google client libraries are slow to import and only needed by file
+# storage and exports, so they are imported on first use, not at startup
 from app.core.settings import settings
 
 
-def get_drive_service():
+def get_service_account_credentials(scopes: list[str] | None = None):
     """
-    Get Google Drive service using credentials from environment variables.
+    Build service account credentials from environment variables.
     """
+    from google.oauth2 import service_account
+
     credentials_info = {
         "type": settings.GOOGLE_TYPE,
         "project_id": settings.GOOGLE_PROJECT_ID,
@@ -20,7 +22,31 @@ def get_drive_service():
         "client_x509_cert_url": settings.GOOGLE_CLIENT_X509_CERT_URL,
         "universe_domain": settings.GOOGLE_UNIVERSE_DOMAIN
     }
-    
-    creds = service_account.Credentials.from_service_account_info(credentials_info)
+
+    return service_account.Credentials.from_service_account_info(
+        credentials_info, scopes=scopes
+    )
+
+
+def get_drive_service():
+    """
+    Get Google Drive service using credentials from environment variables.
+    """
+    from googleapiclient.discovery import build
+
+    creds = get_service_account_credentials()
     drive_service = build("drive", "v3", credentials=creds)
     return drive_service
+
+
+def get_sheets_service():
+    """
+    Get Google Sheets service using credentials from environment variables.
+    """
+    from googleapiclient.discovery import build
+
+    creds = get_service_account_credentials(
+        scopes=["https://www.googleapis.com/auth/spreadsheets"]
+    )
+    sheets_service = build("sheets", "v4", credentials=creds)
+    return sheets_service
@@ -20,6 +20,13 @@ class Settings(BaseSettings):
     SERVER_HOST: str
     DOMAIN: str
     PORT: int = 8000
+    DEBUG: bool = False  # Adds X-DB-Queries / Server-Timing headers to responses
+
+    # Request logging: errors and slow requests are always logged, other
+    # responses are sampled at this rate (0.0 - 1.0)
+    LOG_LEVEL: str = "INFO"
+    LOG_SUCCESS_SAMPLE_RATE: float = 1.0
+    LOG_SLOW_REQUEST_MS: int = 1000
 
     SECRET_KEY: str
     AUTHJWT_SECRET_KEY: str
@@ -77,12 +84,63 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     MONGODB_URI: str
     MONGODB_DB_NAME: str
+    MONGODB_SLOW_COMMAND_MS: int = 100  # Commands slower than this are logged
+    # Connection pool, per worker process. Keep the maximum at least the sync
+    # endpoint thread pool size (40) plus BACKGROUND_WORKERS, so threads do
+    # not queue for a connection (see the mongodb_pool_* metrics).
+    MONGODB_MAX_POOL_SIZE: int = 50
+    MONGODB_MIN_POOL_SIZE: int = 5  # Kept open to avoid TLS handshakes on bursts
+    MONGODB_MAX_IDLE_TIME_MS: int = 300_000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 5000  # Fail instead of queueing forever
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 10000
+    # Wire compression, in order of preference; the server picks the first it
+    # supports. zstd needs zstandard (installed), snappy needs python-snappy.
+    MONGODB_COMPRESSORS: str = "zstd,zlib"
+    MONGODB_READ_PREFERENCE: str = "primary"
+    # Reads routed as analytics (admin dashboards, statistics, exports; see
+    # app/database/routing.py). Max staleness is -1 (no limit) or >= 90.
+    MONGODB_ANALYTICS_READ_PREFERENCE: str = "secondaryPreferred"
+    MONGODB_ANALYTICS_MAX_STALENESS_SECONDS: int = -1
+    MONGODB_ANALYTICS_READ_CONCERN: str = "local"
 
     # Google Drive
     GDRIVE_RESUMES: str
     GDRIVE_OTHER_FILES: str
     GDRIVE_LESSONS: str
 
+    # File storage ("gdrive" in production, "local" for development and tests)
+    FILE_STORAGE_BACKEND: str = "gdrive"
+    LOCAL_STORAGE_DIR: str = "storage"
+    DRIVE_UPLOAD_CHUNK_SIZE: int = 2 * 1024 * 1024  # Must be a multiple of 256 KB
+
+    # Background uploads
+    UPLOAD_SPOOL_DIR: Optional[str] = None  # Defaults to a directory in the system temp dir
+    BACKGROUND_WORKERS: int = 4
+    # Upload/export jobs not updated for this long were left behind by a
+    # stopped process; startup requeues or fails them
+    BACKGROUND_JOB_STALE_SECONDS: int = 900
+
+    # In-process caches re-check their version stamp at most this often
+    CACHE_VERSION_CHECK_SECONDS: float = 5.0
+
+    # Production server (gunicorn.conf.py)
+    WEB_CONCURRENCY: Optional[int] = None  # Worker processes; overrides the two below
+    WORKERS_PER_CORE: float = 1.0
+    MAX_WORKERS: int = 8
+    SERVER_BACKLOG: int = 2048  # Pending connections the listen socket queues
+    # Longer than the proxy's idle timeout, so the proxy closes idle connections
+    SERVER_KEEPALIVE_SECONDS: int = 75
+    SERVER_TIMEOUT_SECONDS: int = 60  # Silent workers are restarted after this
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30  # In-flight requests get this long
+    SERVER_MAX_REQUESTS: int = 0  # Recycle a worker after this many requests (0: never)
+    # With several workers, each one writes its metrics here and /metrics
+    # reports all of them (gunicorn.conf.py sets a default under /dev/shm)
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_PUBLISH_SECONDS: float = 5.0
+    # Bearer token scrapers must send to /metrics; unset disables the endpoint
+    METRICS_TOKEN: Optional[SecretStr] = None
+
     # Google Drive Service Account Credentials
     GOOGLE_TYPE: str = "service_account"
     GOOGLE_PROJECT_ID: Optional[str] = None
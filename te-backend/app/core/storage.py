@@ -0,0 +1,107 @@
+"""
+File storage backends.
+
+Uploaded files live in Google Drive in production. The local backend keeps
+files on disk so uploads can be exercised without Drive credentials.
+"""
+
+import shutil
+from pathlib import Path
+from typing import Callable, Optional
+from uuid import uuid4
+
+import app.core.service as service
+from app.core.settings import settings
+
+ProgressCallback = Callable[[float], None]
+
+
+class GoogleDriveStorage:
+    """Store files in Google Drive using resumable, chunked uploads."""
+
+    def upload(
+        self,
+        path: str,
+        *,
+        name: str,
+        parent: str,
+        mimetype: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> dict:
+        from googleapiclient.http import MediaFileUpload
+
+        drive_service = service.get_drive_service()
+        media = MediaFileUpload(
+            path,
+            mimetype=mimetype,
+            chunksize=settings.DRIVE_UPLOAD_CHUNK_SIZE,
+            resumable=True,
+        )
+        request = drive_service.files().create(
+            body={"name": name, "parents": [parent]},
+            media_body=media,
+            fields="id,name,webContentLink",
+        )
+
+        response = None
+        while response is None:
+            upload_status, response = request.next_chunk()
+            if upload_status and progress:
+                progress(upload_status.progress())
+
+        return {
+            "id": response.get("id"),
+            "name": response.get("name"),
+            "link": response.get("webContentLink"),
+        }
+
+
+class LocalStorage:
+    """Store files under a local directory (development and tests)."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def upload(
+        self,
+        path: str,
+        *,
+        name: str,
+        parent: str,
+        mimetype: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> dict:
+        file_id = uuid4().hex
+        destination = self.root / parent / file_id
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, destination)
+
+        if progress:
+            progress(1.0)
+
+        return {
+            "id": file_id,
+            "name": name,
+            "link": destination.resolve().as_uri(),
+        }
+
+
+_storage = None
+
+
+def get_storage():
+    """Return the configured storage backend."""
+    global _storage
+
+    if _storage is None:
+        if settings.FILE_STORAGE_BACKEND == "local":
+            _storage = LocalStorage(settings.LOCAL_STORAGE_DIR)
+        else:
+            _storage = GoogleDriveStorage()
+    return _storage
+
+
+def set_storage(storage) -> None:
+    """Override the storage backend (e.g. with a LocalStorage in tests)."""
+    global _storage
+    _storage = storage
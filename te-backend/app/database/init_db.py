@@ -4,6 +4,7 @@ import app.ents.user.schema as user_schema
 from app.core.security import get_password_hash
 from app.core.settings import settings
 from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError
 
 logger = logging.getLogger(__name__)
 
@@ -24,17 +25,35 @@ def init_db(db: Database) -> None:
         )
         return
 
-    admin_user = privileged_users_collection.find_one({"username": admin_username})
-    if not admin_user:
-        admin_data = {
-            "username": admin_username,
-            "lead_token": admin_token,
-            "password": get_password_hash(admin_token),
-            "role": user_schema.UserRoles.admin.value,
-            "company_id": None,
-            "is_active": True,
-        }
-        result = privileged_users_collection.insert_one(admin_data)
-        logger.info("✓ Admin created: %s (ID: %s)", admin_username, result.inserted_id)
+    # Only hash the token (deliberately slow) when the admin has to be created
+    existing = privileged_users_collection.find_one(
+        {"username": admin_username}, {"_id": 1}
+    )
+    if existing:
+        logger.info("✓ Admin user already exists: %s", admin_username)
+        return
+
+    admin_data = {
+        "lead_token": admin_token,
+        "password": get_password_hash(admin_token),
+        "role": user_schema.UserRoles.admin.value,
+        "company_id": None,
+        "is_active": True,
+    }
+    # Every worker seeds on startup: the upsert (backed by the unique username
+    # index) makes sure only one of them creates the admin
+    try:
+        result = privileged_users_collection.update_one(
+            {"username": admin_username},
+            {"$setOnInsert": admin_data},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        result = None
+
+    if result is not None and result.upserted_id is not None:
+        logger.info(
+            "✓ Admin created: %s (ID: %s)", admin_username, result.upserted_id
+        )
     else:
         logger.info("✓ Admin user already exists: %s", admin_username)
@@ -0,0 +1,115 @@
+"""
+Index management and idempotent data migrations.
+
+Both run on startup (see app/main.py) and can be run by hand with
+`python -m app.database.migrations`.
+"""
+
+import logging
+
+from pymongo import ASCENDING, DESCENDING, UpdateMany, UpdateOne
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_indexes(db: Database) -> None:
+    """Create the indexes the queries rely on. No-op for existing indexes."""
+    # Referrer queues: equality on company and status, oldest request first.
+    # Replaces company_status_date: referral_date is a dd-mm-yyyy string and
+    # can't order the queue.
+    db.referrals.create_index(
+        [("company_id", ASCENDING), ("status", ASCENDING), ("_id", ASCENDING)],
+        name="company_status_page",
+    )
+    if "company_status_date" in db.referrals.index_information():
+        db.referrals.drop_index("company_status_date")
+
+    # Keyset pagination (see app/core/pagination.py): filter prefix + _id
+    db.referrals.create_index(
+        [("company_id", ASCENDING), ("_id", DESCENDING)], name="company_page"
+    )
+    db.referrals.create_index(
+        [("status", ASCENDING), ("_id", DESCENDING)], name="status_page"
+    )
+    db.companies.create_index([("name", ASCENDING), ("_id", ASCENDING)], name="name_page")
+    db.lessons.create_index(
+        [("created_at", DESCENDING), ("_id", DESCENDING)], name="created_page"
+    )
+
+    # One account per username; also serializes the bootstrap admin seed
+    # that every worker runs on startup (see app/database/init_db.py)
+    try:
+        db.privileged_users.create_index(
+            "username", unique=True, name="username_unique"
+        )
+    except OperationFailure as e:
+        logger.error("✗ Duplicate privileged usernames, not unique-indexed: %s", e)
+
+
+def backfill_referral_company_ids(db: Database) -> int:
+    """
+    Set `company_id` on referrals that only carry a `company_name`.
+    Names are resolved with one query and applied with one bulk write.
+    Returns the number of referrals updated.
+    """
+    missing = {"company_id": None}  # Matches missing and null
+    names = [name for name in db.referrals.distinct("company_name", missing) if name]
+    if not names:
+        return 0
+
+    companies = db.companies.find({"name": {"$in": names}}, {"name": 1})
+    operations = [
+        UpdateMany(
+            {**missing, "company_name": company["name"]},
+            {"$set": {"company_id": company["_id"]}},
+        )
+        for company in companies
+    ]
+    if not operations:
+        return 0
+
+    result = db.referrals.bulk_write(operations, ordered=False)
+    return result.modified_count
+
+
+def backfill_lesson_timestamps(db: Database) -> int:
+    """
+    Set `created_at` (and a missing `updated_at`) on lessons without one,
+    from the creation time in their ObjectId, in one bulk write. Lessons are
+    paged on `created_at`, and a range on it never matches a missing value,
+    so undated lessons could not be reached past the first page.
+    Returns the number of lessons updated.
+    """
+    operations = []
+    for lesson in db.lessons.find({"created_at": None}, {"updated_at": 1}):
+        # Stored naive in UTC, like datetime.utcnow() defaults
+        created_at = lesson["_id"].generation_time.replace(tzinfo=None)
+        fields = {"created_at": created_at}
+        if not lesson.get("updated_at"):
+            fields["updated_at"] = created_at
+        operations.append(UpdateOne({"_id": lesson["_id"]}, {"$set": fields}))
+
+    if not operations:
+        return 0
+    return db.lessons.bulk_write(operations, ordered=False).modified_count
+
+
+def run_migrations(db: Database) -> None:
+    updated = backfill_referral_company_ids(db)
+    if updated:
+        logger.info("✓ Backfilled company_id on %d referrals", updated)
+
+    updated = backfill_lesson_timestamps(db)
+    if updated:
+        logger.info("✓ Backfilled created_at on %d lessons", updated)
+
+
+if __name__ == "__main__":
+    from app.database.session import get_database
+
+    mongodb = get_database()
+    logging.basicConfig(level=logging.INFO)
+    ensure_indexes(mongodb)
+    run_migrations(mongodb)
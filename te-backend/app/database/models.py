@@ -0,0 +1,74 @@
+"""
+Shared building blocks for MongoDB document models.
+
+`PyObjectId` builds its pydantic core schema once and reuses it for every
+model field that uses it, and serializes to a string in JSON mode so models
+can be dumped with `model_dump_json()` without custom encoders.
+`ObjectIdStr` is the read-schema counterpart: it accepts an ObjectId straight
+from a Mongo document, so API schemas can be validated from raw documents
+with `model_validate()` instead of going through the document model first.
+"""
+
+from typing import Annotated, Any
+
+from bson import ObjectId
+from pydantic import BaseModel, BeforeValidator, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+
+class PyObjectId(ObjectId):
+    """MongoDB ObjectId usable as a pydantic v2 field type."""
+
+    _core_schema: core_schema.CoreSchema | None = None
+
+    @classmethod
+    def validate(cls, v):
+        if isinstance(v, ObjectId):
+            return v
+        if isinstance(v, str) and ObjectId.is_valid(v):
+            return ObjectId(v)
+        raise ValueError("Invalid ObjectId")
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: Any
+    ) -> core_schema.CoreSchema:
+        if cls._core_schema is None:
+            cls._core_schema = core_schema.union_schema(
+                [
+                    core_schema.is_instance_schema(ObjectId),
+                    core_schema.chain_schema(
+                        [
+                            core_schema.str_schema(),
+                            core_schema.no_info_plain_validator_function(cls.validate),
+                        ]
+                    ),
+                ],
+                serialization=core_schema.plain_serializer_function_ser_schema(
+                    str, when_used="json"
+                ),
+            )
+        return cls._core_schema
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "string"}
+
+
+def _object_id_to_str(value: Any) -> Any:
+    return str(value) if isinstance(value, ObjectId) else value
+
+
+# ObjectId exposed as a string in API schemas
+ObjectIdStr = Annotated[str, BeforeValidator(_object_id_to_str)]
+
+
+class MongoModel(BaseModel):
+    """Base for MongoDB document models (`_id` aliased to `id`, ObjectId fields)."""
+
+    class Config:
+        populate_by_name = True
+        arbitrary_types_allowed = True
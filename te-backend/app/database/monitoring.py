@@ -0,0 +1,184 @@
+"""
+MongoDB command and connection pool monitoring.
+
+`CommandMetricsListener` is registered on the MongoClient. For every command
+it records the driver-reported duration in the metrics registry, attributes
+the command to the current request (query count and DB time, see
+`app.core.context`), and logs commands slower than
+`settings.MONGODB_SLOW_COMMAND_MS` with the shape of their filter.
+
+`PoolMetricsListener` tracks the connection pools: how long checkouts wait,
+how many connections are open and in use, and how many threads are queued
+for one. Waiting checkouts mean the pool is smaller than the concurrency
+hitting it.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from pymongo import monitoring
+
+from app.core import context
+from app.core.metrics import (
+    MONGODB_COMMAND_DURATION,
+    MONGODB_COMMAND_FAILURES,
+    MONGODB_POOL_CHECKED_OUT,
+    MONGODB_POOL_CHECKOUT_FAILURES,
+    MONGODB_POOL_CHECKOUT_WAIT,
+    MONGODB_POOL_CONNECTIONS,
+    MONGODB_POOL_MAX_SIZE,
+    MONGODB_POOL_WAITING,
+)
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Where each command keeps the filter that decides which documents it reads
+_FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+
+
+def query_shape(value: Any) -> Any:
+    """Replace the literal values in a filter with "?" and keep its structure."""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = [query_shape(item) for item in value]
+        # Lists of literals ($in, $nin...) collapse to a single placeholder
+        return shapes if any(shape != "?" for shape in shapes) else ["?"]
+    return "?"
+
+
+def _shape_input(command_name: str, command: dict) -> Any:
+    """The part of a command its shape is built from (not its documents)."""
+    if command_name in _FILTER_FIELDS:
+        return command.get(_FILTER_FIELDS[command_name], {})
+    if command_name == "aggregate":
+        return command.get("pipeline", [])
+    if command_name == "update":
+        return [op.get("q", {}) for op in command.get("updates", [])]
+    if command_name == "delete":
+        return [op.get("q", {}) for op in command.get("deletes", [])]
+    return None
+
+
+def command_shape(command_name: str, shape_input: Any) -> Any:
+    """Filter shape of a command, for logs. Pipelines keep their stage names."""
+    if shape_input is None:
+        return None
+    if command_name in _FILTER_FIELDS:
+        return query_shape(shape_input)
+    return [query_shape(item) for item in shape_input]
+
+
+# Started commands whose finish event never arrives (e.g. the connection was
+# dropped) are forgotten oldest first beyond this many
+MAX_COMMANDS_IN_FLIGHT = 10_000
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    def __init__(self) -> None:
+        # Commands in flight, kept so slow ones can be logged with their shape:
+        # (database, collection, shape input), never the full command
+        self._started: OrderedDict[tuple, tuple[str, Any, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, event) -> tuple:
+        return (event.connection_id, event.request_id, event.operation_id)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command_name = event.command_name
+        entry = (
+            event.database_name,
+            event.command.get(command_name, ""),
+            _shape_input(command_name, event.command),
+        )
+        with self._lock:
+            self._started[self._key(event)] = entry
+            if len(self._started) > MAX_COMMANDS_IN_FLIGHT:
+                self._started.popitem(last=False)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        MONGODB_COMMAND_FAILURES.inc(command=event.command_name)
+        self._finished(event)
+
+    def _finished(self, event) -> None:
+        with self._lock:
+            started = self._started.pop(self._key(event), ("", "", None))
+        database_name, collection, shape_input = started
+        duration = event.duration_micros / 1_000_000
+
+        MONGODB_COMMAND_DURATION.observe(duration, command=event.command_name)
+        context.record_db_command(duration)
+
+        if event.duration_micros >= settings.MONGODB_SLOW_COMMAND_MS * 1000:
+            logger.warning(
+                "Slow MongoDB command: %s %s.%s took %.1fms, shape %s",
+                event.command_name,
+                database_name,
+                collection,
+                event.duration_micros / 1000,
+                command_shape(event.command_name, shape_input),
+            )
+
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        if "maxPoolSize" in event.options:
+            MONGODB_POOL_MAX_SIZE.set(event.options["maxPoolSize"])
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        logger.warning("MongoDB connection pool for %s cleared", _address(event))
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        MONGODB_POOL_CONNECTIONS.inc(address=_address(event))
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        MONGODB_POOL_CONNECTIONS.dec(address=_address(event))
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        MONGODB_POOL_WAITING.inc()
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        MONGODB_POOL_WAITING.dec()
+        MONGODB_POOL_CHECKOUT_FAILURES.inc(reason=event.reason)
+        if event.duration is not None:
+            MONGODB_POOL_CHECKOUT_WAIT.observe(event.duration)
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        MONGODB_POOL_WAITING.dec()
+        MONGODB_POOL_CHECKED_OUT.inc(address=_address(event))
+        if event.duration is not None:
+            MONGODB_POOL_CHECKOUT_WAIT.observe(event.duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        MONGODB_POOL_CHECKED_OUT.dec(address=_address(event))
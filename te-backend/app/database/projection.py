@@ -0,0 +1,47 @@
+"""
+Aggregation expressions for shaping documents into their API form on the
+server. ObjectIds are converted to strings, missing fields get defaults and
+fields are renamed inside a `$project` stage, so the documents a cursor
+yields are ready to be encoded as-is.
+"""
+
+from typing import Any, Optional
+
+from pymongo.collection import Collection
+
+Sort = list[tuple[str, int]]
+
+
+def id_str(path: str) -> dict:
+    """ObjectId at `path` as a hex string."""
+    return {"$toString": path}
+
+
+def optional_id_str(path: str) -> dict:
+    """ObjectId at `path` as a hex string, or null when missing/empty."""
+    return {"$cond": [path, {"$toString": path}, None]}
+
+
+def value_or(path: str, default: Any = None) -> dict:
+    """Value at `path`, or `default` when it is missing or null."""
+    return {"$ifNull": [path, default]}
+
+
+def map_array(path: str, item: str, fields: dict) -> dict:
+    """Reshape every element of the array at `path` (missing arrays map to [])."""
+    return {"$map": {"input": value_or(path, []), "as": item, "in": fields}}
+
+
+def find_projected(
+    collection: Collection,
+    query: dict,
+    projection: dict,
+    *,
+    sort: Optional[Sort] = None,
+) -> list[dict]:
+    """Find documents matching `query`, shaped by the `$project` expression."""
+    pipeline: list[dict] = [{"$match": query}]
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
+    pipeline.append({"$project": projection})
+    return list(collection.aggregate(pipeline))
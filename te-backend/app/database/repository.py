@@ -0,0 +1,51 @@
+"""
+Write helpers that return the written document without reading it back.
+
+Inserts build the model from the payload that was sent plus the generated
+`_id`. Updates use `find_one_and_update(..., return_document=AFTER)`, so the
+write and the read of the result are a single round trip.
+"""
+
+from typing import Optional, Type, TypeVar
+
+from pydantic import BaseModel
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def insert_model(collection: Collection, document: dict, model: Type[M]) -> M:
+    """Insert `document` and return it as `model`, including its new `_id`."""
+    result = collection.insert_one(document)
+    return model(**{**document, "_id": result.inserted_id})
+
+
+def update_document(
+    collection: Collection,
+    filter: dict,
+    update: dict | list,
+    *,
+    projection: Optional[dict] = None,
+    array_filters: Optional[list] = None,
+) -> Optional[dict]:
+    """Apply `update` to the first match and return the updated document (or None)."""
+    return collection.find_one_and_update(
+        filter,
+        update,
+        projection=projection,
+        array_filters=array_filters,
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+def update_model(
+    collection: Collection,
+    filter: dict,
+    update: dict | list,
+    model: Type[M],
+    **kwargs,
+) -> Optional[M]:
+    """Like `update_document`, returning the updated document as `model`."""
+    document = update_document(collection, filter, update, **kwargs)
+    return model(**document) if document else None
@@ -0,0 +1,101 @@
+"""
+Read routing by workload.
+
+Reads are tagged with the kind of endpoint that issues them. Interactive
+reads (member-facing pages, anything that must see the caller's own writes)
+use the client defaults, normally the primary. Analytics reads (admin
+dashboards, statistics, exports) scan a lot and tolerate slightly stale
+data, so they go to secondaries when the deployment has them and keep that
+load off the primary that serves member writes.
+
+    db = routing.route(db, Workload.analytics)
+    db.member_users.aggregate(...)
+
+Writes always go to the primary whatever the routing; only reads move.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Union
+
+from fastapi import Depends
+from pymongo.database import Database
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+import app.database.session as session
+from app.core.settings import settings
+
+
+class Workload(str, Enum):
+    interactive = "interactive"
+    analytics = "analytics"
+
+
+ReadPreferenceMode = Union[
+    Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest
+]
+
+# Modes by their connection string name; primary takes no max staleness
+_MODES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+def parse_read_preference(
+    name: str, max_staleness_seconds: int = -1
+) -> ReadPreferenceMode:
+    """Read preference from its URI name, e.g. "secondaryPreferred"."""
+    if name == "primary":
+        return Primary()
+    if name not in _MODES:
+        raise ValueError(f"Unknown read preference {name!r}")
+    return _MODES[name](max_staleness=max_staleness_seconds)
+
+
+@lru_cache
+def _workload_options(workload: Workload) -> dict:
+    if workload is Workload.analytics:
+        return {
+            "read_preference": parse_read_preference(
+                settings.MONGODB_ANALYTICS_READ_PREFERENCE,
+                settings.MONGODB_ANALYTICS_MAX_STALENESS_SECONDS,
+            ),
+            "read_concern": ReadConcern(settings.MONGODB_ANALYTICS_READ_CONCERN),
+        }
+    return {}
+
+
+def route(
+    db: Database,
+    workload: Workload,
+    *,
+    read_preference: Optional[ReadPreferenceMode] = None,
+    read_concern: Optional[ReadConcern] = None,
+) -> Database:
+    """
+    `db` with the read preference and read concern of `workload`. Explicit
+    `read_preference`/`read_concern` override the workload's for this call.
+    """
+    options = dict(_workload_options(workload))
+    if read_preference is not None:
+        options["read_preference"] = read_preference
+    if read_concern is not None:
+        options["read_concern"] = read_concern
+    if not options:
+        return db
+    return db.client.get_database(db.name, **options)
+
+
+def get_analytics_db(db: Database = Depends(session.get_db)) -> Database:
+    """Dependency for endpoints that only read, in bulk, for dashboards."""
+    return route(db, Workload.analytics)
@@ -1,31 +1,88 @@
-from typing import Generator
+"""
+MongoDB client.
+
+The client is created on first use in each process rather than at import
+time. A MongoClient is not fork-safe (its pool sockets and monitor threads
+do not survive a fork), and under the pre-forking production server (see
+gunicorn.conf.py) the app is imported once in the master before the workers
+are forked. Each worker then builds its own client after the fork.
+"""
+
+import os
+import re
+import threading
+from typing import Generator, Optional
 
 from app.core.settings import settings
+from app.database.monitoring import CommandMetricsListener, PoolMetricsListener
 from pymongo import MongoClient
 from pymongo.database import Database
 import certifi
 
-# MongoDB client with SSL certificate and fallback options
-try:
-    # Try with certifi first (most secure)
-    client = MongoClient(
-        settings.MONGODB_URI,
-        tlsCAFile=certifi.where(),
-        serverSelectionTimeoutMS=5000,
-        connectTimeoutMS=10000,
+_client: Optional[MongoClient] = None
+_client_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def _uses_tls(uri: str) -> bool:
+    # SRV (Atlas) connection strings default to TLS
+    return uri.startswith("mongodb+srv://") or bool(
+        re.search(r"[?&](tls|ssl)=true", uri, re.IGNORECASE)
     )
-except Exception as e:
-    print(f"Failed with certifi, trying with default SSL context: {e}")
-    # Fallback: Use default SSL context
-    client = MongoClient(
+
+
+def _create_client() -> MongoClient:
+    options = {}
+    if _uses_tls(settings.MONGODB_URI):
+        # Not every platform's Python ships usable system CA certificates.
+        # Passing a CA file turns TLS on, so local plain connections skip it.
+        options["tlsCAFile"] = certifi.where()
+
+    return MongoClient(
         settings.MONGODB_URI,
-        tls=True,
-        tlsAllowInvalidCertificates=False,
-        serverSelectionTimeoutMS=5000,
-        connectTimeoutMS=10000,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT_MS,
+        compressors=settings.MONGODB_COMPRESSORS,
+        readPreference=settings.MONGODB_READ_PREFERENCE,
+        event_listeners=[CommandMetricsListener(), PoolMetricsListener()],
+        **options,
     )
 
-mongodb = client[settings.MONGODB_DB_NAME]
+
+def get_client() -> MongoClient:
+    """Return the MongoClient for the current process, creating it if needed."""
+    global _client, _client_pid
+
+    client = _client
+    if client is not None and _client_pid == os.getpid():
+        return client
+
+    with _lock:
+        if _client is None or _client_pid != os.getpid():
+            # A client inherited from the parent is abandoned, not closed:
+            # closing it would talk to the server over the parent's sockets
+            _client = _create_client()
+            _client_pid = os.getpid()
+        return _client
+
+
+def get_database() -> Database:
+    return get_client()[settings.MONGODB_DB_NAME]
+
+
+def close_client() -> None:
+    """Close this process's client, if it has one."""
+    global _client, _client_pid
+
+    with _lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
+        _client_pid = None
 
 
 def get_db() -> Generator[Database, None, None]:
@@ -33,6 +90,6 @@ def get_db() -> Generator[Database, None, None]:
     Dependency for getting MongoDB database instance.
     """
     try:
-        yield mongodb
+        yield get_database()
     finally:
         pass  # Connection pooling handled by MongoClient
@@ -5,6 +5,7 @@ from app.ents.application.endpoints import (
 from app.ents.referral.endpoints import referral_router
 from app.ents.home.endpoints import home_router
 from app.ents.documentation.endpoints import documentation_router
+from app.ents.export.endpoints import exports_router
 from app.ents.learning.endpoints import router as learning_router
 from app.ents.problem.endpoints import router as problem_router
 from app.ents.user.auth import auth_router
@@ -14,6 +15,7 @@ from app.ents.resume import (
     resumes_router,
     user_resumes_router,
 )
+from app.ents.upload.endpoints import uploads_router
 from app.ents.verification.endpoints import router as verification_router
 from fastapi import APIRouter
 
@@ -42,9 +44,15 @@ api_router.include_router(
 )  # Has its own tags from router definition
 api_router.include_router(resumes_router)
 
+# Background file uploads
+api_router.include_router(uploads_router)  # Tags: Uploads
+
 # Referral management
 api_router.include_router(referral_router, tags=["Referrals"])
 
+# Background exports
+api_router.include_router(exports_router)  # Tags: Exports
+
 # Resume review management
 api_router.include_router(resume_reviews_router)
 
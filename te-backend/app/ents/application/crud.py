@@ -1,13 +1,9 @@
-import os
-import tempfile
 from datetime import date
 from uuid import uuid4
 
-import app.core.service as service
 import app.ents.application.models as application_models
 import app.ents.application.schema as application_schema
 from fastapi import HTTPException
-from googleapiclient.http import MediaFileUpload
 from pymongo.database import Database
 
 
@@ -176,35 +172,3 @@ def delete_application(db: Database, *, user_id: str, application_id: str) -> bo
     )
 
     return result.modified_count > 0
-
-
-# ============= Helper Functions =============
-
-
-def upload_member_file(file, parent) -> application_schema.FileUpload:
-    drive_service = service.get_drive_service()
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(file.file.read())
-
-    file_metadata = {
-        "name": file.filename,
-        "parents": [parent],
-    }
-
-    media = MediaFileUpload(temp_file.name, resumable=True)
-    uploaded_file = (
-        drive_service.files()
-        .create(
-            body=file_metadata,
-            media_body=media,
-            fields="id,name,webContentLink",
-        )
-        .execute()
-    )
-
-    os.remove(temp_file.name)
-    return application_schema.FileUpload(
-        file_id=uploaded_file.get("id"),
-        name=uploaded_file.get("name"),
-        link=uploaded_file.get("webContentLink"),
-    )
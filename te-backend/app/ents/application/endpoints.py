@@ -1,6 +1,7 @@
 from typing import Any, Dict
 import logging
 
+import app.database.routing as routing
 import app.database.session as session
 import app.ents.application.crud as application_crud
 import app.ents.application.dependencies as application_dependencies
@@ -198,7 +199,7 @@ def delete_user_application(
 
 @applications_router.get("", response_model=Dict[str, list])
 def list_all_applications(
-    db: Database = Depends(session.get_db),
+    db: Database = Depends(routing.get_analytics_db),
     current_user=Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
@@ -0,0 +1,477 @@
+import csv
+import io
+import json
+import tempfile
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterable, Iterator
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+from pymongo.database import Database
+
+import app.core.background as background
+import app.core.service as service
+import app.database.routing as routing
+import app.ents.export.models as export_models
+import app.ents.export.schema as export_schema
+from app.core.settings import settings
+
+# Referrals read per cursor batch; user names are joined once per batch
+EXPORT_BATCH_SIZE = 500
+# Rows sent per Sheets append call
+SHEETS_APPEND_ROWS = 2000
+
+# Bytes read per chunk when streaming a finished XLSX file
+XLSX_STREAM_CHUNK_SIZE = 64 * 1024
+
+# (key, header) pairs; keys are used for NDJSON, headers for CSV/XLSX/Sheets
+REFERRAL_COLUMNS = [
+    ("id", "Referral ID"),
+    ("member_name", "Member Name"),
+    ("member_email", "Member Email"),
+    ("company", "Company"),
+    ("job_title", "Job Title"),
+    ("role", "Role"),
+    ("request_note", "Request Note"),
+    ("resume", "Resume Link"),
+    ("referral_date", "Date"),
+    ("status", "Status"),
+    ("review_note", "Review Note"),
+]
+REFERRAL_HEADERS = [header for _, header in REFERRAL_COLUMNS]
+
+APPLICATION_COLUMNS = [
+    ("id", "Application ID"),
+    ("user_id", "Member ID"),
+    ("member_name", "Member Name"),
+    ("member_email", "Member Email"),
+    ("company", "Company"),
+    ("title", "Title"),
+    ("role", "Role"),
+    ("country", "Country"),
+    ("city", "City"),
+    ("date", "Date"),
+    ("status", "Status"),
+    ("referred", "Referred"),
+    ("active", "Active"),
+    ("archived", "Archived"),
+    ("recruiter_name", "Recruiter Name"),
+    ("recruiter_email", "Recruiter Email"),
+    ("notes", "Notes"),
+]
+
+RESUME_REVIEW_COLUMNS = [
+    ("id", "Review ID"),
+    ("user_id", "Member ID"),
+    ("user_name", "Member Name"),
+    ("user_email", "Member Email"),
+    ("job_title", "Job Title"),
+    ("level", "Level"),
+    ("resume_link", "Resume Link"),
+    ("status", "Status"),
+    ("submitted_date", "Submitted Date"),
+    ("reviewer_name", "Reviewer"),
+    ("assigned_date", "Assigned Date"),
+    ("review_date", "Review Date"),
+    ("feedback", "Feedback"),
+    ("notes", "Notes"),
+]
+
+
+# ============= Row Streaming =============
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of up to `size` items from `iterable`."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def referral_export_query(referral_ids: list[str] | None = None) -> dict:
+    if not referral_ids:
+        return {}
+    return {"_id": {"$in": [ObjectId(ref_id) for ref_id in referral_ids]}}
+
+
+def iter_referral_rows(db: Database, query: dict) -> Iterator[list]:
+    """
+    Stream referral rows from a cursor, joining member names and emails
+    with one query per batch instead of one per referral.
+    """
+    cursor = db.referrals.find(query, batch_size=EXPORT_BATCH_SIZE).sort("_id", 1)
+
+    for batch in batched(cursor, EXPORT_BATCH_SIZE):
+        user_ids = list({referral["user_id"] for referral in batch})
+        users = {
+            user["_id"]: user
+            for user in db.member_users.find(
+                {"_id": {"$in": user_ids}}, {"full_name": 1, "email": 1}
+            )
+        }
+
+        for referral in batch:
+            user = users.get(referral["user_id"])
+            yield [
+                str(referral["_id"]),
+                user.get("full_name", "N/A") if user else "N/A",
+                user.get("email", "N/A") if user else "N/A",
+                referral.get("company_name") or "N/A",
+                referral.get("job_title", ""),
+                referral.get("role", ""),
+                referral.get("request_note", ""),
+                referral.get("resume", ""),
+                referral.get("referral_date", ""),
+                referral.get("status", ""),
+                referral.get("review_note") or "",
+            ]
+
+
+def iter_application_rows(db: Database) -> Iterator[list]:
+    """Stream every member application, unwound from the embedded arrays."""
+    pipeline = [
+        {"$match": {"applications.0": {"$exists": True}}},
+        {"$sort": {"_id": 1}},
+        {"$project": {"full_name": 1, "email": 1, "applications": 1}},
+        {"$unwind": "$applications"},
+    ]
+    cursor = db.member_users.aggregate(
+        pipeline, batchSize=EXPORT_BATCH_SIZE, allowDiskUse=True
+    )
+
+    for user in cursor:
+        application = user["applications"]
+        location = application.get("location") or {}
+        yield [
+            application.get("id", ""),
+            str(user["_id"]),
+            user.get("full_name", ""),
+            user.get("email", ""),
+            application.get("company", ""),
+            application.get("title", ""),
+            application.get("role", ""),
+            location.get("country", ""),
+            location.get("city", ""),
+            application.get("date", ""),
+            application.get("status", ""),
+            application.get("referred", False),
+            application.get("active", True),
+            application.get("archived", False),
+            application.get("recruiter_name", ""),
+            application.get("recruiter_email", ""),
+            application.get("notes", ""),
+        ]
+
+
+def iter_resume_review_rows(db: Database) -> Iterator[list]:
+    """Stream resume review requests from a cursor."""
+    cursor = db.resume_reviews.find({}, batch_size=EXPORT_BATCH_SIZE).sort("_id", 1)
+
+    for review in cursor:
+        yield [
+            str(review["_id"]),
+            str(review.get("user_id", "")),
+            review.get("user_name", ""),
+            review.get("user_email", ""),
+            review.get("job_title", ""),
+            review.get("level", ""),
+            review.get("resume_link", ""),
+            review.get("status", ""),
+            review.get("submitted_date", ""),
+            review.get("reviewer_name") or "",
+            review.get("assigned_date") or "",
+            review.get("review_date") or "",
+            review.get("feedback", ""),
+            review.get("notes", ""),
+        ]
+
+
+# ============= File Export =============
+
+
+def _csv_chunks(columns: list[tuple], rows: Iterable[list]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for _, header in columns])
+
+    for batch in batched(rows, EXPORT_BATCH_SIZE):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunks(columns: list[tuple], rows: Iterable[list]) -> Iterator[bytes]:
+    keys = [key for key, _ in columns]
+
+    for batch in batched(rows, EXPORT_BATCH_SIZE):
+        yield "".join(
+            json.dumps(dict(zip(keys, row)), default=str) + "\n" for row in batch
+        ).encode("utf-8")
+
+
+def _xlsx_chunks(
+    columns: list[tuple], rows: Iterable[list], title: str
+) -> Iterator[bytes]:
+    from openpyxl import Workbook
+
+    # Write-only workbooks stream rows to a temp file instead of holding them
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title)
+    sheet.append([header for _, header in columns])
+    for row in rows:
+        sheet.append(row)
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx") as xlsx_file:
+        workbook.save(xlsx_file.name)
+        xlsx_file.seek(0)
+        while chunk := xlsx_file.read(XLSX_STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+EXPORT_MEDIA_TYPES = {
+    export_schema.ExportFormats.csv: "text/csv",
+    export_schema.ExportFormats.xlsx: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    export_schema.ExportFormats.ndjson: "application/x-ndjson",
+}
+
+
+def stream_export(
+    db: Database,
+    *,
+    dataset: export_schema.ExportDatasets,
+    export_format: export_schema.ExportFormats,
+) -> Iterator[bytes]:
+    """
+    Encode a dataset in the requested format, a batch at a time,
+    so exports run in constant memory regardless of size.
+    """
+    db = routing.route(db, routing.Workload.analytics)
+    if dataset == export_schema.ExportDatasets.referrals:
+        columns, rows = REFERRAL_COLUMNS, iter_referral_rows(db, {})
+    elif dataset == export_schema.ExportDatasets.applications:
+        columns, rows = APPLICATION_COLUMNS, iter_application_rows(db)
+    else:
+        columns, rows = RESUME_REVIEW_COLUMNS, iter_resume_review_rows(db)
+
+    if export_format == export_schema.ExportFormats.csv:
+        return _csv_chunks(columns, rows)
+    if export_format == export_schema.ExportFormats.ndjson:
+        return _ndjson_chunks(columns, rows)
+    return _xlsx_chunks(columns, rows, title=dataset.value)
+
+
+# ============= Export Job CRUD =============
+
+
+def create_export_job(
+    db: Database,
+    *,
+    user_id: str,
+    kind: export_schema.ExportKinds,
+    params: dict | None = None,
+) -> export_models.ExportJob:
+    job = export_models.ExportJob(
+        user_id=ObjectId(user_id), kind=kind.value, params=params or {}
+    )
+    db.export_jobs.insert_one(job.model_dump(by_alias=True))
+    return job
+
+
+def read_export_job(db: Database, *, job_id: str) -> export_models.ExportJob:
+    try:
+        job_object_id = ObjectId(job_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found"
+        )
+
+    job = db.export_jobs.find_one({"_id": job_object_id})
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found"
+        )
+
+    return export_models.ExportJob(**job)
+
+
+def _update_export_job(db: Database, job_id: ObjectId, **fields) -> None:
+    fields["updated_at"] = datetime.utcnow()
+    db.export_jobs.update_one({"_id": job_id}, {"$set": fields})
+
+
+def fail_interrupted_export_jobs(db: Database) -> int:
+    """
+    Fail export jobs left queued/running by a process that stopped: the queue
+    lives in that process, so nothing would ever finish them. Only jobs
+    untouched for BACKGROUND_JOB_STALE_SECONDS count. Returns how many failed.
+    """
+    cutoff = datetime.utcnow() - timedelta(
+        seconds=settings.BACKGROUND_JOB_STALE_SECONDS
+    )
+    result = db.export_jobs.update_many(
+        {
+            "status": {
+                "$in": [
+                    export_schema.ExportStatuses.queued.value,
+                    export_schema.ExportStatuses.running.value,
+                ]
+            },
+            "updated_at": {"$lt": cutoff},
+        },
+        {
+            "$set": {
+                "status": export_schema.ExportStatuses.failed.value,
+                "error": "Export interrupted by a server restart",
+                "updated_at": datetime.utcnow(),
+            }
+        },
+    )
+    return result.modified_count
+
+
+# ============= Google Sheets Export =============
+
+
+def create_referral_sheet_export(
+    db: Database, *, user_id: str, referral_ids: list[str] | None = None
+) -> export_models.ExportJob:
+    """Queue an export of referrals (all, or the selected ids) to Google Sheets."""
+    if referral_ids and not all(ObjectId.is_valid(ref_id) for ref_id in referral_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid referral ID"
+        )
+
+    job = create_export_job(
+        db,
+        user_id=user_id,
+        kind=export_schema.ExportKinds.referrals_sheet,
+        params={"referral_ids": referral_ids or []},
+    )
+    background.submit(run_referral_sheet_export, db, job.id)
+    return job
+
+
+def _format_sheet_header(sheets, spreadsheet_id: str) -> None:
+    requests = [
+        {
+            "repeatCell": {
+                "range": {"sheetId": 0, "startRowIndex": 0, "endRowIndex": 1},
+                "cell": {
+                    "userEnteredFormat": {
+                        "backgroundColor": {"red": 0.23, "green": 0.51, "blue": 0.96},
+                        "textFormat": {
+                            "bold": True,
+                            "foregroundColor": {"red": 1, "green": 1, "blue": 1},
+                        },
+                        "horizontalAlignment": "CENTER",
+                    }
+                },
+                "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)",
+            }
+        }
+    ]
+
+    sheets.spreadsheets().batchUpdate(
+        spreadsheetId=spreadsheet_id, body={"requests": requests}
+    ).execute()
+
+
+def run_referral_sheet_export(db: Database, job_id: ObjectId) -> None:
+    """
+    Create a spreadsheet and append referral rows to it in chunks,
+    recording progress on the export job as rows are written.
+    """
+    try:
+        # Inside the try: any failure, even loading the job, must mark it failed
+        # or clients polling it never stop
+        job = export_models.ExportJob(**db.export_jobs.find_one({"_id": job_id}))
+        query = referral_export_query(job.params.get("referral_ids"))
+        # Job progress is written to (and read from) the primary; rows can be
+        # read anywhere
+        analytics_db = routing.route(db, routing.Workload.analytics)
+        _update_export_job(
+            db,
+            job_id,
+            status=export_schema.ExportStatuses.running.value,
+            total=analytics_db.referrals.count_documents(query),
+        )
+
+        sheets = service.get_sheets_service()
+        spreadsheet = (
+            sheets.spreadsheets()
+            .create(
+                body={
+                    "properties": {
+                        "title": f"TechElevate Referrals Export - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                    },
+                    "sheets": [{"properties": {"title": "Referrals"}}],
+                }
+            )
+            .execute()
+        )
+        spreadsheet_id = spreadsheet["spreadsheetId"]
+
+        sheets.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id,
+            range="Referrals!A1",
+            valueInputOption="RAW",
+            body={"values": [REFERRAL_HEADERS]},
+        ).execute()
+        _format_sheet_header(sheets, spreadsheet_id)
+
+        processed = 0
+        for rows in batched(
+            iter_referral_rows(analytics_db, query), SHEETS_APPEND_ROWS
+        ):
+            sheets.spreadsheets().values().append(
+                spreadsheetId=spreadsheet_id,
+                range="Referrals!A1",
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": rows},
+            ).execute()
+            processed += len(rows)
+            _update_export_job(db, job_id, processed=processed)
+
+        _update_export_job(
+            db,
+            job_id,
+            status=export_schema.ExportStatuses.completed.value,
+            processed=processed,
+            url=f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
+        )
+    except Exception as exc:
+        _update_export_job(
+            db,
+            job_id,
+            status=export_schema.ExportStatuses.failed.value,
+            error=str(exc) or exc.__class__.__name__,
+        )
+        raise
+
+
+def job_to_read(job: export_models.ExportJob) -> export_schema.ExportJobRead:
+    """Convert an ExportJob model instance into the API response schema."""
+    if job.total:
+        progress = min(job.processed / job.total, 1.0)
+    else:
+        progress = 1.0 if job.status == export_schema.ExportStatuses.completed.value else 0.0
+
+    return export_schema.ExportJobRead(
+        id=str(job.id),
+        kind=job.kind,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        progress=round(progress, 4),
+        url=job.url,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
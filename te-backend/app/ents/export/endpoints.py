@@ -0,0 +1,53 @@
+from datetime import date
+from typing import Dict
+
+import app.database.session as session
+import app.ents.export.crud as export_crud
+import app.ents.export.schema as export_schema
+import app.ents.user.dependencies as user_dependencies
+from app.core.permissions import require_lead
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from pymongo.database import Database
+
+exports_router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+@exports_router.get("/{job_id}", response_model=Dict[str, export_schema.ExportJobRead])
+def read_export_job(
+    *,
+    db: Database = Depends(session.get_db),
+    job_id: str,
+    current_user=Depends(user_dependencies.get_current_user),
+) -> Dict[str, export_schema.ExportJobRead]:
+    """
+    Poll the progress of a background export (Lead/Admin only).
+    """
+    require_lead(current_user)
+
+    job = export_crud.read_export_job(db, job_id=job_id)
+    return {"job": export_crud.job_to_read(job)}
+
+
+@exports_router.get("/download/{dataset}")
+def download_export(
+    *,
+    db: Database = Depends(session.get_db),
+    dataset: export_schema.ExportDatasets,
+    format: export_schema.ExportFormats = Query(
+        default=export_schema.ExportFormats.csv, description="csv, xlsx or ndjson"
+    ),
+    current_user=Depends(user_dependencies.get_current_user),
+) -> StreamingResponse:
+    """
+    Download a raw export of referrals, applications or resume reviews (Lead/Admin only).
+    Rows are read with server-side cursors and streamed as they are encoded.
+    """
+    require_lead(current_user)
+
+    filename = f"{dataset.value}-{date.today().isoformat()}.{format.value}"
+    return StreamingResponse(
+        export_crud.stream_export(db, dataset=dataset, export_format=format),
+        media_type=export_crud.EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from app.database.models import MongoModel, PyObjectId
+
+
+class ExportJob(MongoModel):
+    """MongoDB ExportJob document model for exports that run in the background."""
+
+    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
+    user_id: PyObjectId
+    kind: str  # ExportKinds enum value
+    status: str = "queued"  # ExportStatuses enum value
+    params: dict = {}  # Export filters, e.g. selected referral ids
+    total: int = 0  # Rows to export
+    processed: int = 0  # Rows written so far
+    url: Optional[str] = None  # Location of the finished export
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
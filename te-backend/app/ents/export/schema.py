@@ -0,0 +1,49 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ExportKinds(Enum):
+    referrals_sheet = "referrals_sheet"
+
+
+class ExportDatasets(Enum):
+    referrals = "referrals"
+    applications = "applications"
+    resume_reviews = "resume_reviews"
+
+
+class ExportFormats(Enum):
+    csv = "csv"
+    xlsx = "xlsx"
+    ndjson = "ndjson"
+
+
+class ExportStatuses(Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class ReferralSheetExportCreate(BaseModel):
+    """Payload for exporting referrals to Google Sheets."""
+
+    referral_ids: Optional[list[str]] = None  # Export all referrals when omitted
+
+
+class ExportJobRead(BaseModel):
+    """Response model for export job status."""
+
+    id: str
+    kind: str
+    status: str
+    total: int = 0
+    processed: int = 0
+    progress: float = 0.0
+    url: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
@@ -1,44 +1,10 @@
-from typing import Optional, Any
-from pydantic import BaseModel, Field, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import core_schema
-from bson import ObjectId
-
-
-# Custom type for MongoDB ObjectId compatible with Pydantic v2
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: Any
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema(
-                    [
-                        core_schema.str_schema(),
-                        core_schema.no_info_plain_validator_function(cls.validate),
-                    ]
-                ),
-            ]
-        )
-
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
-        raise ValueError("Invalid ObjectId")
-
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
-    ) -> JsonSchemaValue:
-        return {"type": "string"}
-
-
-class Event(BaseModel):
+from typing import Optional
+from pydantic import Field
+
+from app.database.models import MongoModel, PyObjectId
+
+
+class Event(MongoModel):
     """MongoDB Event document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -48,26 +14,16 @@ class Event(BaseModel):
     location: str = ""
     link: str = ""
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-
 
-class Tag(BaseModel):
+class Tag(MongoModel):
     """MongoDB Tag document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
     name: str
     category: str = ""
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
 
-
-class Team(BaseModel):
+class Team(MongoModel):
     """MongoDB Team member document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -76,13 +32,8 @@ class Team(BaseModel):
     image: str = ""
     bio: str = ""
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-
 
-class Beneficiary(BaseModel):
+class Beneficiary(MongoModel):
     """MongoDB Beneficiary document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -90,21 +41,11 @@ class Beneficiary(BaseModel):
     description: str = ""
     image: str = ""
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
 
-
-class Partner(BaseModel):
+class Partner(MongoModel):
     """MongoDB Partner document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
     name: str
     logo: str = ""
     website: str = ""
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
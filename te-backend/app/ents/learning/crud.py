@@ -2,9 +2,10 @@ import app.ents.learning.models as learning_models
 import app.ents.learning.schema as learning_schema
 from pymongo.database import Database
 from app.core import service
+from app.core.pagination import paginate
 from app.core.settings import settings
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from bson import ObjectId
 import logging
 
@@ -19,14 +20,18 @@ logger = logging.getLogger(__name__)
 def get_all_lessons(
     db: Database,
     *,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     category: Optional[str] = None,
     topic: Optional[str] = None,
     difficulty: Optional[str] = None,
     is_published: Optional[bool] = None,
-) -> List[learning_models.Lesson]:
-    """Get all lessons with optional filtering"""
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Get a page of lesson documents (newest first) with optional filtering,
+    and the next page's cursor. Documents are returned as stored so they can
+    be validated straight into the read schema.
+    """
     query = {}
 
     if category:
@@ -38,8 +43,10 @@ def get_all_lessons(
     if is_published is not None:
         query["is_published"] = is_published
 
-    lessons = db["lessons"].find(query).skip(skip).limit(limit).sort("created_at", -1)
-    return [learning_models.Lesson(**lesson) for lesson in lessons]
+    page = paginate(
+        db["lessons"], query, sort=[("created_at", -1)], limit=limit, cursor=cursor
+    )
+    return page.items, page.next_cursor
 
 
 def get_lesson_by_id(db: Database, lesson_id: str) -> Optional[learning_models.Lesson]:
@@ -60,16 +67,14 @@ def get_lesson_by_id(db: Database, lesson_id: str) -> Optional[learning_models.L
 
 def get_lessons_by_category_and_topic(
     db: Database, category: str, topic: str
-) -> List[learning_models.Lesson]:
-    """Get all lessons for a specific category and topic"""
-    lessons = (
+) -> List[dict]:
+    """Get all lesson documents for a specific category and topic"""
+    return list(
         db["lessons"]
         .find({"category": category, "topic": topic, "is_published": True})
         .sort("created_at", -1)
     )
 
-    return [learning_models.Lesson(**lesson) for lesson in lessons]
-
 
 def create_lesson(
     db: Database, *, data: learning_schema.LessonCreate, user_id: int
@@ -119,9 +124,10 @@ def delete_lesson(db: Database, lesson_id: str) -> bool:
 
 # Legacy function for backwards compatibility
 def read_lessons(
-    db: Database, *, skip: int = 0, limit: int = 100
+    db: Database, *, cursor: Optional[str] = None, limit: int = 100
 ) -> List[learning_models.Lesson]:
-    return get_all_lessons(db, skip=skip, limit=limit)
+    lessons, _ = get_all_lessons(db, cursor=cursor, limit=limit)
+    return [learning_models.Lesson(**lesson) for lesson in lessons]
 
 
 def read_lessons_v1():
@@ -402,6 +408,9 @@ def get_learning_statistics(db: Database) -> dict:
     topic_completions = {}
     for progress in all_progress:
         for topic in progress.get("completed_topics", []):
+            # Entries are {"topic_key": ...} dicts; older documents store strings
+            if isinstance(topic, dict):
+                topic = topic.get("topic_key", "")
             topic_completions[topic] = topic_completions.get(topic, 0) + 1
 
     # Sort topics by completion count
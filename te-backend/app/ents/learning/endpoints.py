@@ -1,14 +1,15 @@
 from typing import Any, Dict, List, Optional
 
+import app.database.routing as routing
 import app.database.session as session
-import app.ents.application.crud as application_crud
-import app.ents.application.schema as application_schema
 import app.ents.learning.crud as learning_crud
 import app.ents.learning.schema as learning_schema
+import app.ents.upload.crud as upload_crud
+import app.ents.upload.schema as upload_schema
 import app.ents.user.dependencies as user_dependencies
 import app.ents.user.models as user_models
-from app.core.settings import settings
-from fastapi import APIRouter, Depends, UploadFile, HTTPException, Query
+from app.core.pagination import next_cursor_headers
+from fastapi import APIRouter, Depends, UploadFile, HTTPException, Query, Response, status
 from pymongo.database import Database
 
 router = APIRouter(prefix="/learning")
@@ -24,12 +25,15 @@ router = APIRouter(prefix="/learning")
     response_model=List[learning_schema.LessonRead],
 )
 def get_lessons(
+    response: Response,
     db: Database = Depends(session.get_db),
     current_user: Optional[user_models.MemberUser] = Depends(
         user_dependencies.get_learning_content_access
     ),
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor of the page to fetch (from X-Next-Cursor)"
+    ),
+    limit: int = Query(100, ge=1),
     category: Optional[str] = Query(None),
     topic: Optional[str] = Query(None),
     difficulty: Optional[str] = Query(None),
@@ -40,39 +44,18 @@ def get_lessons(
     Filters: category, topic, difficulty, is_published
     Available to everyone except Referrers. Guests can view content.
     """
-    lessons = learning_crud.get_all_lessons(
+    lessons, next_cursor = learning_crud.get_all_lessons(
         db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         category=category,
         topic=topic,
         difficulty=difficulty,
         is_published=is_published,
     )
+    response.headers.update(next_cursor_headers(next_cursor))
 
-    return [
-        learning_schema.LessonRead(
-            id=str(lesson.id),
-            title=lesson.title,
-            category=lesson.category,
-            topic=lesson.topic,
-            description=lesson.description,
-            video_id=lesson.video_id,
-            content_type=lesson.content_type,
-            resources=lesson.resources,
-            code_examples=lesson.code_examples,
-            difficulty=lesson.difficulty,
-            tags=lesson.tags,
-            duration_minutes=lesson.duration_minutes,
-            instructor=lesson.instructor,
-            is_published=lesson.is_published,
-            created_by=lesson.created_by,
-            created_at=lesson.created_at,
-            updated_at=lesson.updated_at,
-            view_count=lesson.view_count,
-        )
-        for lesson in lessons
-    ]
+    return [learning_schema.LessonRead.model_validate(lesson) for lesson in lessons]
 
 
 @router.get(
@@ -95,26 +78,7 @@ def get_lesson(
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
 
-    return learning_schema.LessonRead(
-        id=str(lesson.id),
-        title=lesson.title,
-        category=lesson.category,
-        topic=lesson.topic,
-        description=lesson.description,
-        video_id=lesson.video_id,
-        content_type=lesson.content_type,
-        resources=lesson.resources,
-        code_examples=lesson.code_examples,
-        difficulty=lesson.difficulty,
-        tags=lesson.tags,
-        duration_minutes=lesson.duration_minutes,
-        instructor=lesson.instructor,
-        is_published=lesson.is_published,
-        created_by=lesson.created_by,
-        created_at=lesson.created_at,
-        updated_at=lesson.updated_at,
-        view_count=lesson.view_count,
-    )
+    return learning_schema.LessonRead.model_validate(lesson)
 
 
 @router.get(
@@ -135,29 +99,7 @@ def get_lessons_for_topic(
     """
     lessons = learning_crud.get_lessons_by_category_and_topic(db, category, topic)
 
-    return [
-        learning_schema.LessonRead(
-            id=str(lesson.id),
-            title=lesson.title,
-            category=lesson.category,
-            topic=lesson.topic,
-            description=lesson.description,
-            video_id=lesson.video_id,
-            content_type=lesson.content_type,
-            resources=lesson.resources,
-            code_examples=lesson.code_examples,
-            difficulty=lesson.difficulty,
-            tags=lesson.tags,
-            duration_minutes=lesson.duration_minutes,
-            instructor=lesson.instructor,
-            is_published=lesson.is_published,
-            created_by=lesson.created_by,
-            created_at=lesson.created_at,
-            updated_at=lesson.updated_at,
-            view_count=lesson.view_count,
-        )
-        for lesson in lessons
-    ]
+    return [learning_schema.LessonRead.model_validate(lesson) for lesson in lessons]
 
 
 @router.post(
@@ -177,26 +119,7 @@ def create_lesson(
     """
     lesson = learning_crud.create_lesson(db, data=data, user_id=current_user.id)
 
-    return learning_schema.LessonRead(
-        id=str(lesson.id),
-        title=lesson.title,
-        category=lesson.category,
-        topic=lesson.topic,
-        description=lesson.description,
-        video_id=lesson.video_id,
-        content_type=lesson.content_type,
-        resources=lesson.resources,
-        code_examples=lesson.code_examples,
-        difficulty=lesson.difficulty,
-        tags=lesson.tags,
-        duration_minutes=lesson.duration_minutes,
-        instructor=lesson.instructor,
-        is_published=lesson.is_published,
-        created_by=lesson.created_by,
-        created_at=lesson.created_at,
-        updated_at=lesson.updated_at,
-        view_count=lesson.view_count,
-    )
+    return learning_schema.LessonRead.model_validate(lesson)
 
 
 @router.patch(
@@ -220,26 +143,7 @@ def update_lesson(
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
 
-    return learning_schema.LessonRead(
-        id=str(lesson.id),
-        title=lesson.title,
-        category=lesson.category,
-        topic=lesson.topic,
-        description=lesson.description,
-        video_id=lesson.video_id,
-        content_type=lesson.content_type,
-        resources=lesson.resources,
-        code_examples=lesson.code_examples,
-        difficulty=lesson.difficulty,
-        tags=lesson.tags,
-        duration_minutes=lesson.duration_minutes,
-        instructor=lesson.instructor,
-        is_published=lesson.is_published,
-        created_by=lesson.created_by,
-        created_at=lesson.created_at,
-        updated_at=lesson.updated_at,
-        view_count=lesson.view_count,
-    )
+    return learning_schema.LessonRead.model_validate(lesson)
 
 
 @router.delete(
@@ -266,7 +170,8 @@ def delete_lesson(
 
 @router.post(
     "/file/upload",
-    response_model=Dict[str, application_schema.FileUpload],
+    response_model=Dict[str, upload_schema.UploadJobRead],
+    status_code=status.HTTP_202_ACCEPTED,
 )
 def lesson_file_upload(
     *,
@@ -275,12 +180,13 @@ def lesson_file_upload(
     current_user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
-    Create other lesson.
+    Upload a lesson file in the background.
+    Poll /uploads/{job_id} for the Drive link once the upload completes.
     """
-    uploaded_file = application_crud.upload_member_file(
-        file=file, parent=settings.GDRIVE_LESSONS
+    job = upload_crud.create_lesson_upload_job(
+        db, file=file, user_id=str(current_user.id)
     )
-    return {"file": uploaded_file}
+    return {"job": upload_crud.job_to_read(job)}
 
 
 # User Progress Endpoints
@@ -463,7 +369,7 @@ def update_note(
     "/admin/all-progress",
 )
 def get_all_progress(
-    db: Database = Depends(session.get_db),
+    db: Database = Depends(routing.get_analytics_db),
     current_user: user_models.MemberUser = Depends(user_dependencies.get_current_lead),
 ) -> Any:
     """
@@ -478,7 +384,7 @@ def get_all_progress(
     "/admin/statistics",
 )
 def get_statistics(
-    db: Database = Depends(session.get_db),
+    db: Database = Depends(routing.get_analytics_db),
     current_user: user_models.MemberUser = Depends(user_dependencies.get_current_lead),
 ) -> Any:
     """
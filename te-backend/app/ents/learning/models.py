@@ -1,45 +1,11 @@
 from typing import Optional, Any, List, Dict
-from pydantic import BaseModel, Field, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import core_schema
-from bson import ObjectId
+from pydantic import Field
 from datetime import datetime
 
+from app.database.models import MongoModel, PyObjectId
 
-# Custom type for MongoDB ObjectId compatible with Pydantic v2
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: Any
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema(
-                    [
-                        core_schema.str_schema(),
-                        core_schema.no_info_plain_validator_function(cls.validate),
-                    ]
-                ),
-            ]
-        )
 
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
-        raise ValueError("Invalid ObjectId")
-
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
-    ) -> JsonSchemaValue:
-        return {"type": "string"}
-
-
-class Lesson(BaseModel):
+class Lesson(MongoModel):
     """MongoDB Lesson document model for DSA learning content"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -78,13 +44,8 @@ class Lesson(BaseModel):
     instructor: str = ""
     year: int = 2024
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
 
-
-class UserProgress(BaseModel):
+class UserProgress(MongoModel):
     """MongoDB UserProgress document model for tracking learning progress"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -103,8 +64,3 @@ class UserProgress(BaseModel):
     )  # {"category::topic": "note text"}
     last_updated: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str, datetime: lambda v: v.isoformat()}
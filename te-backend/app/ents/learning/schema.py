@@ -3,7 +3,9 @@ from enum import Enum
 from typing import Optional, List, Dict
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
+
+from app.database.models import ObjectIdStr
 
 
 # Lesson Schemas for DSA Content
@@ -50,10 +52,13 @@ class LessonUpdate(BaseModel):
 class LessonRead(LessonBase):
     """Schema for reading a lesson"""
 
-    id: str  # MongoDB ObjectId as string
-    created_by: int
-    created_at: datetime
-    updated_at: datetime
+    id: ObjectIdStr = Field(
+        validation_alias=AliasChoices("_id", "id")
+    )  # MongoDB ObjectId as string
+    # Same defaults as learning_models.Lesson: older documents lack these
+    created_by: int = 0
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
     view_count: int = 0
 
     class Config:
@@ -1,44 +1,10 @@
-from typing import Optional, Any
-from pydantic import BaseModel, EmailStr, Field, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import core_schema
-from bson import ObjectId
+from typing import Optional
+from pydantic import EmailStr, Field
 
+from app.database.models import MongoModel, PyObjectId
 
-# Custom type for MongoDB ObjectId compatible with Pydantic v2
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: Any
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema(
-                    [
-                        core_schema.str_schema(),
-                        core_schema.no_info_plain_validator_function(cls.validate),
-                    ]
-                ),
-            ]
-        )
 
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
-        raise ValueError("Invalid ObjectId")
-
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
-    ) -> JsonSchemaValue:
-        return {"type": "string"}
-
-
-class Posting(BaseModel):
+class Posting(MongoModel):
     """MongoDB Posting document model (job posting/problem)"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -57,8 +23,3 @@ class Posting(BaseModel):
     is_active: bool = True
     start_date: str = ""
     end_date: str = ""
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
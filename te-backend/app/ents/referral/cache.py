@@ -0,0 +1,98 @@
+import json
+from bisect import bisect_right
+
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo.database import Database
+
+import app.ents.referral.dependencies as referral_dependencies
+import app.ents.referral.models as referral_models
+from app.core.cache import VersionedCache
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _join(items: list[bytes]) -> bytes:
+    return b'{"companies":[' + b",".join(items) + b"]}"
+
+
+class CompanyCatalog:
+    """Snapshot of the referral companies, pre-serialized for the listings."""
+
+    def __init__(self, companies: list[referral_models.ReferralCompany]):
+        self.companies = companies
+        self.names = {str(company.id): company.name for company in companies}
+        self.ids_by_name = {company.name: company.id for company in companies}
+        # Sort keys in catalog order: name, then _id
+        self._keys = [(company.name, company.id) for company in companies]
+        self._referral_items = [
+            _dumps(
+                referral_dependencies.parse_company_for_referrals(
+                    None, company
+                ).model_dump(mode="json")
+            )
+            for company in companies
+        ]
+        self._list_items = [
+            _dumps({"id": str(company.id), "name": company.name})
+            for company in companies
+        ]
+
+    def _page(
+        self, items: list[bytes], cursor: str | None, limit: int
+    ) -> tuple[bytes, str | None]:
+        start = 0
+        if cursor:
+            key = tuple(decode_cursor(cursor))
+            if len(key) != 2:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            start = bisect_right(self._keys, key)
+
+        end = start + limit
+        next_cursor = None
+        if end < len(items):
+            next_cursor = encode_cursor(list(self._keys[end - 1]))
+        return _join(items[start:end]), next_cursor
+
+    def referral_companies_json(
+        self, *, cursor: str | None = None, limit: int = 100
+    ) -> tuple[bytes, str | None]:
+        """A page of `{"companies": [CompanyReadForReferrals, ...]}` as JSON bytes."""
+        return self._page(self._referral_items, cursor, limit)
+
+    def company_list_json(
+        self, *, cursor: str | None = None, limit: int = 1000
+    ) -> tuple[bytes, str | None]:
+        """A page of `{"companies": [{"id", "name"}, ...]}` as JSON bytes."""
+        return self._page(self._list_items, cursor, limit)
+
+    def company_name(self, company_id) -> str | None:
+        return self.names.get(str(company_id))
+
+    def company_id(self, company: str) -> ObjectId | None:
+        """Resolve a company ObjectId string or company name to its ObjectId."""
+        if ObjectId.is_valid(company) and str(company) in self.names:
+            return ObjectId(company)
+        return self.ids_by_name.get(company)
+
+
+def _load_catalog(db: Database) -> CompanyCatalog:
+    companies_cursor = db.companies.find().sort([("name", 1), ("_id", 1)])
+    return CompanyCatalog(
+        [referral_models.ReferralCompany(**company) for company in companies_cursor]
+    )
+
+
+company_catalog = VersionedCache("companies", _load_catalog)
+
+
+def get_company_catalog(db: Database) -> CompanyCatalog:
+    return company_catalog.get(db)
+
+
+def invalidate_company_catalog(db: Database) -> None:
+    """Call after any write to the companies collection."""
+    company_catalog.invalidate(db)
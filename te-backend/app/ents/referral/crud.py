@@ -1,9 +1,40 @@
+import app.ents.referral.cache as referral_cache
 import app.ents.referral.models as referral_models
 import app.ents.referral.schema as referral_schema
 import app.ents.user.crud as user_crud
+from datetime import datetime, timezone
 from typing import Optional
+from bson import ObjectId
+from pymongo import UpdateOne
 from pymongo.database import Database
 from fastapi import HTTPException
+from app.core.pagination import paginate, paginate_with_total
+from app.database.repository import insert_model, update_document, update_model
+
+# Page order, backed by indexes (see app/database/migrations.py)
+REFERRAL_PAGE_SORT = [("_id", -1)]  # Newest first
+
+REFERRAL_DATE_FORMAT = "%d-%m-%Y"  # referral_date / feedback_date
+
+# Allowed status changes for bulk updates
+REFERRAL_STATUS_TRANSITIONS = {
+    referral_schema.ReferralStatuses.pending.value: {
+        referral_schema.ReferralStatuses.completed.value,
+        referral_schema.ReferralStatuses.declined.value,
+        referral_schema.ReferralStatuses.cancelled.value,
+    },
+    referral_schema.ReferralStatuses.declined.value: {
+        referral_schema.ReferralStatuses.pending.value,
+        referral_schema.ReferralStatuses.completed.value,
+    },
+    referral_schema.ReferralStatuses.completed.value: {
+        referral_schema.ReferralStatuses.pending.value,
+        referral_schema.ReferralStatuses.declined.value,
+    },
+    referral_schema.ReferralStatuses.cancelled.value: {
+        referral_schema.ReferralStatuses.pending.value,
+    },
+}
 
 
 def create_referral_company(
@@ -43,11 +74,10 @@ def create_referral_company(
     }
 
     # Insert into MongoDB
-    result = db.companies.insert_one(company_dict)
+    company = insert_model(db.companies, company_dict, referral_models.ReferralCompany)
+    referral_cache.invalidate_company_catalog(db)
 
-    # Fetch and return the created company
-    company_data = db.companies.find_one({"_id": result.inserted_id})
-    return referral_models.ReferralCompany(**company_data)
+    return company
 
 
 def update_referral_company(
@@ -116,12 +146,27 @@ def update_referral_company(
             update_dict[f"referral_materials.{key}"] = value
 
     # Perform update if there are changes
-    if update_dict:
-        db.companies.update_one({"_id": ObjectId(company_id)}, {"$set": update_dict})
+    if not update_dict:
+        return referral_models.ReferralCompany(**existing)
+
+    company = update_model(
+        db.companies,
+        {"_id": ObjectId(company_id)},
+        {"$set": update_dict},
+        referral_models.ReferralCompany,
+    )
+    if company is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+    referral_cache.invalidate_company_catalog(db)
 
-    # Fetch and return the updated company
-    company_data = db.companies.find_one({"_id": ObjectId(company_id)})
-    return referral_models.ReferralCompany(**company_data)
+    # Keep the denormalized name on the company's referrals in sync
+    if "name" in update_dict and update_dict["name"] != existing.get("name"):
+        db.referrals.update_many(
+            {"company_id": ObjectId(company_id)},
+            {"$set": {"company_name": update_dict["name"]}},
+        )
+
+    return company
 
 
 def read_company_by_id(
@@ -143,11 +188,9 @@ def read_referral_companies(
     return [referral_models.ReferralCompany(**company) for company in companies_cursor]
 
 
-def read_user_referrals(
-    db: Database, *, user_id: str
-) -> list[referral_models.Referral]:
+def read_user_referrals(db: Database, *, user_id: str) -> list[dict]:
     """
-    Get all referrals for a specific user from MongoDB.
+    Get all referral documents for a specific user from MongoDB.
     """
     from bson import ObjectId
 
@@ -155,76 +198,139 @@ def read_user_referrals(
     if not user:
         return []
 
-    referrals_data = db.referrals.find({"user_id": ObjectId(user_id)})
-    return [referral_models.Referral(**ref) for ref in referrals_data]
+    return list(db.referrals.find({"user_id": ObjectId(user_id)}))
 
 
 def read_all_referrals(
-    db: Database, *, skip: int = 0, limit: int = 100
-) -> list[referral_models.Referral]:
+    db: Database, *, cursor: Optional[str] = None, limit: int = 100
+) -> tuple[list[dict], Optional[str]]:
     """
-    Get all referrals in the system (for Lead/Admin users) from MongoDB.
+    Get a page of all referrals in the system (for Lead/Admin users) from MongoDB.
+    Returns the referral documents and the cursor of the next page.
     """
-    referrals_data = db.referrals.find().skip(skip).limit(limit)
-    return [referral_models.Referral(**ref) for ref in referrals_data]
+    page = paginate(
+        db.referrals, {}, sort=REFERRAL_PAGE_SORT, limit=limit, cursor=cursor
+    )
+    return page.items, page.next_cursor
+
+
+def resolve_company_id(db: Database, *, company: str) -> Optional[ObjectId]:
+    """
+    Resolve a company ObjectId string or company name to the company's ObjectId.
+    Returns None for companies that are not in the catalog.
+    """
+    return referral_cache.get_company_catalog(db).company_id(company)
 
 
 def read_company_referrals(
-    db: Database, *, company_id: str, skip: int = 0, limit: int = 100
-) -> list[referral_models.Referral]:
+    db: Database,
+    *,
+    company_id: ObjectId,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> tuple[list[dict], Optional[str]]:
     """
-    Get all referrals for a specific company from MongoDB.
+    Get a page of referrals for a specific company from MongoDB.
     Useful for seeing all referral requests to a particular company.
-    company_id is actually the company name (string).
+    Returns the referral documents and the cursor of the next page.
     """
-    referrals_data = (
-        db.referrals.find({"company_name": company_id}).skip(skip).limit(limit)
+    page = paginate(
+        db.referrals,
+        {"company_id": company_id},
+        sort=REFERRAL_PAGE_SORT,
+        limit=limit,
+        cursor=cursor,
     )
-    referrals_list = [referral_models.Referral(**ref) for ref in referrals_data]
-
-    return referrals_list
+    return page.items, page.next_cursor
 
 
 def read_referrals_by_status(
-    db: Database, *, status: str, skip: int = 0, limit: int = 100
-) -> list[referral_models.Referral]:
+    db: Database, *, status: str, cursor: Optional[str] = None, limit: int = 100
+) -> tuple[list[dict], Optional[str]]:
     """
-    Get all referrals with a specific status from MongoDB.
+    Get a page of referrals with a specific status from MongoDB.
     Useful for filtering by 'in_review', 'completed', 'declined', etc.
+    Returns the referral documents and the cursor of the next page.
     """
-    referrals_data = db.referrals.find({"status": status}).skip(skip).limit(limit)
-    return [referral_models.Referral(**ref) for ref in referrals_data]
+    page = paginate(
+        db.referrals,
+        {"status": status},
+        sort=REFERRAL_PAGE_SORT,
+        limit=limit,
+        cursor=cursor,
+    )
+    return page.items, page.next_cursor
 
 
 def read_user_company_referrals(
-    db: Database, *, user_id: str, company_id: str
+    db: Database, *, user_id: str, company_id: ObjectId
 ) -> list[referral_models.Referral]:
     """
     Get all referrals for a specific user at a specific company from MongoDB.
     Useful for checking if user already requested referral at this company.
-    company_id is actually the company name (string).
     """
-    from bson import ObjectId
-
     referrals_data = db.referrals.find(
-        {"user_id": ObjectId(user_id), "company_name": company_id}
+        {"user_id": ObjectId(user_id), "company_id": company_id}
     )
     return [referral_models.Referral(**ref) for ref in referrals_data]
 
 
-def count_referrals_by_company(db: Database, *, company_id: str) -> int:
+def read_company_referrals_with_total(
+    db: Database,
+    *,
+    company_id: ObjectId,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> tuple[list[dict], Optional[str], int]:
     """
-    Count total referrals for a specific company.
-    company_id is actually the company name (string).
+    Get a page of referral documents for a specific company together with the
+    company's total referral count.
     """
-    return db.referrals.count_documents({"company_name": company_id})
+    page = paginate_with_total(
+        db.referrals,
+        {"company_id": company_id},
+        sort=REFERRAL_PAGE_SORT,
+        limit=limit,
+        cursor=cursor,
+    )
+    return page.items, page.next_cursor, page.total
+
+
+def read_referrals_by_status_with_total(
+    db: Database, *, status: str, cursor: Optional[str] = None, limit: int = 100
+) -> tuple[list[dict], Optional[str], int]:
+    """
+    Get a page of referral documents with a specific status together with the
+    total count for that status.
+    """
+    page = paginate_with_total(
+        db.referrals,
+        {"status": status},
+        sort=REFERRAL_PAGE_SORT,
+        limit=limit,
+        cursor=cursor,
+    )
+    return page.items, page.next_cursor, page.total
 
 
-def count_referrals_by_status(db: Database, *, status: str) -> int:
+def _resolve_company(db: Database, company: str) -> tuple[ObjectId, str]:
     """
-    Count total referrals with a specific status.
+    Id and name of a company given by id or name. The cached catalog can lag
+    behind a company created moments ago (and is per process), so a miss is
+    looked up in the collection before giving up.
     """
-    return db.referrals.count_documents({"status": status})
+    catalog = referral_cache.get_company_catalog(db)
+    company_id = catalog.company_id(company)
+    if company_id is not None:
+        return company_id, catalog.company_name(company_id)
+
+    query = {"name": company}
+    if ObjectId.is_valid(company):
+        query = {"$or": [{"_id": ObjectId(company)}, query]}
+    found = db.companies.find_one(query, {"name": 1})
+    if not found:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return found["_id"], found["name"]
 
 
 def request_referral(
@@ -239,10 +345,12 @@ def request_referral(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Create referral document with company_name (string from frontend)
+    # The frontend sends the company name; reference the company by id as well
+    company_id, company_name = _resolve_company(db, data.company_id)
     referral_dict = {
         "user_id": ObjectId(user_id),
-        "company_name": data.company_id,  # Store company name as string
+        "company_id": company_id,
+        "company_name": company_name,
         "job_title": data.job_title,
         "job_id": data.job_id or "",
         "role": data.role,
@@ -256,11 +364,26 @@ def request_referral(
     }
 
     # Insert into MongoDB
-    result = db.referrals.insert_one(referral_dict)
+    return insert_model(db.referrals, referral_dict, referral_models.Referral)
 
-    # Fetch and return the created referral
-    referral_data = db.referrals.find_one({"_id": result.inserted_id})
-    return referral_models.Referral(**referral_data)
+
+def _status_update_pipeline(
+    *, status: str, review_note: Optional[str] = None, set_feedback_date: bool = False
+) -> list[dict]:
+    """
+    Update pipeline for a status change. Values are wrapped in $literal so
+    user text starting with "$" is never read as a field path.
+    feedback_date is only filled in when it is missing or empty.
+    """
+    update_data = {"status": {"$literal": status}}
+    if review_note:
+        update_data["review_note"] = {"$literal": review_note}
+    if set_feedback_date:
+        today = datetime.now().strftime(REFERRAL_DATE_FORMAT)
+        update_data["feedback_date"] = {
+            "$cond": [{"$gt": ["$feedback_date", ""]}, "$feedback_date", today]
+        }
+    return [{"$set": update_data}]
 
 
 def update_referral_status(
@@ -269,167 +392,171 @@ def update_referral_status(
     referral_id: str,
     data: referral_schema.ReferralUpdateStatus,
     user_role: int = None,
-) -> referral_models.Referral:
+) -> Optional[dict]:
     """
-    Update referral status and review note in MongoDB.
+    Update referral status and review note in MongoDB in a single atomic write.
     Sets feedback_date when a Referrer (role=2) provides feedback.
+    Returns the updated referral document.
     """
-    from bson import ObjectId
-    from datetime import datetime
-
-    # Build update data
-    update_data = {"status": data.status.value}
-    if data.review_note:
-        update_data["review_note"] = data.review_note
-
-    # Set feedback_date when Referrer provides feedback (only if not already set)
-    if user_role == 2:  # Referrer role
-        # Check if feedback_date is already set
-        existing = db.referrals.find_one({"_id": ObjectId(referral_id)})
-        if existing and not existing.get("feedback_date"):
-            update_data["feedback_date"] = datetime.now().strftime("%d-%m-%Y")
-
-    # Update in MongoDB
-    result = db.referrals.update_one(
-        {"_id": ObjectId(referral_id)}, {"$set": update_data}
+    return update_document(
+        db.referrals,
+        {"_id": ObjectId(referral_id)},
+        _status_update_pipeline(
+            status=data.status.value,
+            review_note=data.review_note,
+            set_feedback_date=user_role == 2,  # Referrer role
+        ),
     )
 
-    if result.matched_count == 0:
-        return None
-
-    # Fetch and return updated referral
-    referral_data = db.referrals.find_one({"_id": ObjectId(referral_id)})
-    return referral_models.Referral(**referral_data)
 
-
-def export_referrals_to_google_sheets(
+def bulk_update_referral_status(
     db: Database,
     *,
-    referral_ids: list[str] = None,
-) -> str:
+    data: referral_schema.ReferralBulkStatusUpdate,
+    user_role: int,
+    company_id: Optional[ObjectId] = None,
+) -> list[referral_schema.ReferralBulkStatusResult]:
     """
-    Export referrals to Google Sheets from MongoDB.
-    Returns the URL of the created Google Sheet.
+    Move many referrals to one status.
+    Current statuses are read with one query, transitions are validated
+    against REFERRAL_STATUS_TRANSITIONS and the updates go out in one
+    bulk_write. Referrers pass their company_id to scope the update.
+    Returns one result per requested id, in request order.
     """
-    from googleapiclient.discovery import build
-    from google.oauth2 import service_account
-    from datetime import datetime
-    from bson import ObjectId
-    from app.core.settings import settings
-
-    # Load Google credentials from environment variables
-    SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
-
-    credentials_info = {
-        "type": settings.GOOGLE_TYPE,
-        "project_id": settings.GOOGLE_PROJECT_ID,
-        "private_key_id": settings.GOOGLE_PRIVATE_KEY_ID,
-        "private_key": settings.GOOGLE_PRIVATE_KEY.replace("\\n", "\n"),
-        "client_email": settings.GOOGLE_CLIENT_EMAIL,
-        "client_id": settings.GOOGLE_CLIENT_ID,
-        "auth_uri": settings.GOOGLE_AUTH_URI,
-        "token_uri": settings.GOOGLE_TOKEN_URI,
-        "auth_provider_x509_cert_url": settings.GOOGLE_AUTH_PROVIDER_X509_CERT_URL,
-        "client_x509_cert_url": settings.GOOGLE_CLIENT_X509_CERT_URL,
-        "universe_domain": settings.GOOGLE_UNIVERSE_DOMAIN,
+    target = data.status.value
+    results: dict[str, str] = {}
+
+    object_ids = {}
+    for referral_id in dict.fromkeys(data.referral_ids):
+        if ObjectId.is_valid(referral_id):
+            object_ids[referral_id] = ObjectId(referral_id)
+        else:
+            results[referral_id] = "not_found"
+
+    current = {
+        str(referral["_id"]): referral
+        for referral in db.referrals.find(
+            {"_id": {"$in": list(object_ids.values())}},
+            {"status": 1, "company_id": 1},
+        )
     }
 
-    credentials = service_account.Credentials.from_service_account_info(
-        credentials_info, scopes=SCOPES
+    pipeline = _status_update_pipeline(
+        status=target,
+        review_note=data.review_note,
+        set_feedback_date=user_role == 2,  # Referrer role
     )
-
-    service = build("sheets", "v4", credentials=credentials)
-
-    # Get referrals to export from MongoDB
-    if referral_ids:
-        object_ids = [ObjectId(ref_id) for ref_id in referral_ids]
-        referrals_data = db.referrals.find({"_id": {"$in": object_ids}})
-    else:
-        referrals_data = db.referrals.find()
-
-    referrals = [referral_models.Referral(**ref) for ref in referrals_data]
-
-    # Create new spreadsheet
-    spreadsheet = {
-        "properties": {
-            "title": f"TechElevate Referrals Export - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        },
-        "sheets": [{"properties": {"title": "Referrals"}}],
-    }
-
-    spreadsheet = service.spreadsheets().create(body=spreadsheet).execute()
-    spreadsheet_id = spreadsheet["spreadsheetId"]
-
-    # Prepare data
-    headers = [
-        "Referral ID",
-        "Member Name",
-        "Member Email",
-        "Company",
-        "Job Title",
-        "Role",
-        "Request Note",
-        "Resume Link",
-        "Date",
-        "Status",
-        "Review Note",
+    operations, pending_ids = [], []
+    for referral_id, object_id in object_ids.items():
+        referral = current.get(referral_id)
+        if not referral:
+            results[referral_id] = "not_found"
+        elif company_id is not None and referral.get("company_id") != company_id:
+            results[referral_id] = "forbidden"
+        elif referral["status"] == target:
+            results[referral_id] = "unchanged"
+        elif target not in REFERRAL_STATUS_TRANSITIONS.get(referral["status"], ()):
+            results[referral_id] = "invalid_transition"
+        else:
+            # Guard on the status we validated against
+            operations.append(
+                UpdateOne({"_id": object_id, "status": referral["status"]}, pipeline)
+            )
+            pending_ids.append(referral_id)
+
+    if operations:
+        write = db.referrals.bulk_write(operations, ordered=False)
+        if write.matched_count == len(operations):
+            results.update({referral_id: "updated" for referral_id in pending_ids})
+        else:
+            # Some referrals changed status concurrently; find out which
+            statuses = {
+                str(referral["_id"]): referral["status"]
+                for referral in db.referrals.find(
+                    {"_id": {"$in": [object_ids[ref_id] for ref_id in pending_ids]}},
+                    {"status": 1},
+                )
+            }
+            for referral_id in pending_ids:
+                updated = statuses.get(referral_id) == target
+                results[referral_id] = "updated" if updated else "conflict"
+                current[referral_id]["status"] = statuses.get(referral_id)
+
+    return [
+        referral_schema.ReferralBulkStatusResult(
+            id=referral_id,
+            result=results[referral_id],
+            status=target
+            if results[referral_id] in ("updated", "unchanged")
+            else current.get(referral_id, {}).get("status"),
+        )
+        for referral_id in dict.fromkeys(data.referral_ids)
     ]
 
-    rows = [headers]
-    for referral in referrals:
-        user = referral.user
-        company = referral.company
-        rows.append(
+
+def read_referrer_queue(
+    db: Database,
+    *,
+    company_id: ObjectId,
+    status: Optional[str] = None,
+    limit: int = 50,
+) -> dict:
+    """
+    Build a referrer's work queue:
+    - referrals ordered pending first, then oldest request first
+    - the company's referral count per status
+    - the SLA age (days since the request) of pending referrals
+    Requests are ordered by _id, whose timestamp is the request time, so
+    every read is a range of the company_status_page index
+    (company_id, status, _id): one for the counts, one for the pending
+    referrals and, when the page isn't full, one merge of the other statuses.
+    """
+    pending = referral_schema.ReferralStatuses.pending.value
+    counts = {
+        count["_id"]: count["count"]
+        for count in db.referrals.aggregate(
             [
-                str(referral.id),
-                user.full_name if user else "N/A",
-                user.email if user else "N/A",
-                company.name if company else "N/A",
-                referral.job_title,
-                referral.role,
-                referral.request_note,
-                referral.resume,
-                referral.referral_date,
-                referral.status,
-                referral.review_note or "",
+                {"$match": {"company_id": company_id}},
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
             ]
         )
+    }
 
-    # Write data to sheet
-    body = {"values": rows}
-
-    service.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id,
-        range="Referrals!A1",
-        valueInputOption="RAW",
-        body=body,
-    ).execute()
-
-    # Format header row
-    requests = [
-        {
-            "repeatCell": {
-                "range": {"sheetId": 0, "startRowIndex": 0, "endRowIndex": 1},
-                "cell": {
-                    "userEnteredFormat": {
-                        "backgroundColor": {"red": 0.23, "green": 0.51, "blue": 0.96},
-                        "textFormat": {
-                            "bold": True,
-                            "foregroundColor": {"red": 1, "green": 1, "blue": 1},
-                        },
-                        "horizontalAlignment": "CENTER",
-                    }
-                },
-                "fields": "userEnteredFormat(backgroundColor,textFormat,horizontalAlignment)",
-            }
-        }
-    ]
-
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id, body={"requests": requests}
-    ).execute()
+    # Statuses the company has no referrals in are skipped
+    if status:
+        stages = [status] if status in counts else []
+    else:
+        others = sorted(name for name in counts if name != pending)
+        stages = [pending] if pending in counts else []
+        if others:
+            stages.append({"$in": others})
+
+    docs = []
+    for stage_status in stages:
+        if len(docs) >= limit:
+            break
+        docs += (
+            db.referrals.find({"company_id": company_id, "status": stage_status})
+            .sort("_id", 1)
+            .limit(limit - len(docs))
+        )
 
-    return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+    now = datetime.now(timezone.utc)
+    return {
+        "referrals": [
+            (
+                doc,
+                (
+                    (now - doc["_id"].generation_time).days
+                    if doc.get("status") == pending
+                    else None
+                ),
+            )
+            for doc in docs
+        ],
+        "counts": counts,
+        "total": sum(counts.values()),
+    }
 
 
 # def update(
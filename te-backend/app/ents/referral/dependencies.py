@@ -4,7 +4,7 @@ import app.ents.referral.schema as referral_schema
 def parse_company_basic(company):
     """Parse company to basic read format"""
     return referral_schema.CompanyReadBase(
-        id=str(company.id),
+        id=company.id,
         name=company.name,
         domain=getattr(company, "domain", ""),
         image=getattr(company, "image", ""),
@@ -42,8 +42,8 @@ def parse_referral(referral):
     company_base = referral_schema.ReferralCompanyBase(name=company_name, image="")
 
     referral_dict = {
-        "id": str(referral.id),
-        "user_id": str(referral.user_id),
+        "id": referral.id,
+        "user_id": referral.user_id,
         "job_title": referral.job_title,
         "job_id": referral.job_id,
         "role": referral.role,
@@ -59,39 +59,42 @@ def parse_referral(referral):
     return referral_schema.ReferralRead(**referral_dict, company=company_base)
 
 
-def parse_referral_with_user(referral):
-    """Parse referral including user information for Lead/Admin view"""
-    from app.ents.user import crud as user_crud
-    from app.database import session
-
-    # Get user info
-    db = next(session.get_db())
-    user = user_crud.read_user_by_id(db, id=str(referral.user_id))
-
+def _referral_read_fields(referral: dict) -> dict:
+    """Read schema input for a stored referral document"""
     # Use company_name or default to "Unknown Company"
-    company_name = referral.company_name or "Unknown Company"
-
-    # Create minimal company object
-    company_base = referral_schema.ReferralCompanyBase(name=company_name, image="")
-
-    referral_dict = {
-        "id": str(referral.id),
-        "user_id": str(referral.user_id),
-        "job_title": referral.job_title,
-        "job_id": referral.job_id,
-        "role": referral.role,
-        "request_note": referral.request_note,
-        "review_note": referral.review_note,
-        "date": referral.referral_date,
-        "status": referral.status,
-        "resume": referral.resume,
-        "phone_number": referral.phone_number,
-        "essay": referral.essay,
+    company_name = referral.get("company_name") or "Unknown Company"
+    return {**referral, "company": {"name": company_name, "image": ""}}
+
+
+def parse_referral_with_user(db, referral: dict):
+    """Parse a referral document including user information for Lead/Admin view"""
+    return parse_referrals_with_users(db, [referral])[0]
+
+
+def parse_referrals_with_users(db, referrals: list[dict]) -> list:
+    """
+    Parse referral documents including user information, loading all of their
+    users with a single query instead of one lookup per referral. Documents
+    are validated straight into the read schema.
+    """
+    user_ids = list({referral["user_id"] for referral in referrals})
+    users = {
+        user["_id"]: user
+        for user in db.member_users.find(
+            {"_id": {"$in": user_ids}}, {"full_name": 1, "email": 1}
+        )
     }
 
-    return referral_schema.ReferralReadWithUser(
-        **referral_dict,
-        company=company_base,
-        user_name=user.full_name if user else "Unknown",
-        user_email=user.email if user else "Unknown",
-    )
+    parsed = []
+    for referral in referrals:
+        user = users.get(referral["user_id"]) or {}
+        parsed.append(
+            referral_schema.ReferralReadWithUser.model_validate(
+                {
+                    **_referral_read_fields(referral),
+                    "user_name": user.get("full_name", "Unknown"),
+                    "user_email": user.get("email", "Unknown"),
+                }
+            )
+        )
+    return parsed
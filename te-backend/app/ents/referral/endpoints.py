@@ -1,13 +1,17 @@
 from typing import Any, Dict, Optional, Union
 
 import app.database.session as session
+import app.ents.export.crud as export_crud
+import app.ents.export.schema as export_schema
+import app.ents.referral.cache as referral_cache
 import app.ents.referral.crud as referral_crud
 import app.ents.referral.dependencies as referral_dependencies
 import app.ents.referral.schema as referral_schema
 import app.ents.user.dependencies as user_dependencies
 import app.ents.user.models as user_models
+from app.core.pagination import next_cursor_headers
 from app.core.permissions import require_lead
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pymongo.database import Database
 
 referral_router = APIRouter(prefix="/referrals")
@@ -19,26 +23,21 @@ referral_router = APIRouter(prefix="/referrals")
 )
 def get_companies_list(
     db: Database = Depends(session.get_db),
-    skip: int = 0,
-    limit: int = 1000,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=1000, ge=1, le=1000),
     user: user_models.MemberUser = Depends(user_dependencies.get_current_lead),
 ) -> Any:
     """
     Get simplified list of company names and IDs (Lead+ only).
     Returns trimmed down list for dropdown selection when creating referrer accounts.
     """
-    companies_cursor = (
-        db.companies.find({}, {"_id": 1, "name": 1}).skip(skip).limit(limit)
+    catalog = referral_cache.get_company_catalog(db)
+    content, next_cursor = catalog.company_list_json(cursor=cursor, limit=limit)
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers=next_cursor_headers(next_cursor),
     )
-    companies = []
-    for company in companies_cursor:
-        companies.append(
-            {
-                "id": str(company["_id"]),
-                "name": company.get("name", ""),
-            }
-        )
-    return {"companies": companies}
 
 
 @referral_router.get(
@@ -47,21 +46,22 @@ def get_companies_list(
 )
 def get_companies_for_referrals(
     db: Database = Depends(session.get_db),
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
     user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
     Get list of companies available for referrals.
     Returns companies with their referral status for the authenticated user.
     """
-    companies = referral_crud.read_referral_companies(db, skip=skip, limit=limit)
-    return {
-        "companies": [
-            referral_dependencies.parse_company_for_referrals(user.id, company)
-            for company in companies
-        ]
-    }
+    # Served from the pre-serialized company catalog
+    catalog = referral_cache.get_company_catalog(db)
+    content, next_cursor = catalog.referral_companies_json(cursor=cursor, limit=limit)
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers=next_cursor_headers(next_cursor),
+    )
 
 
 @referral_router.post(
@@ -131,8 +131,9 @@ def request_referral(
 def get_referrals(
     db: Database = Depends(session.get_db),
     *,
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
     user_id: Optional[str] = None,  # Filter by user
     company_id: Optional[str] = None,  # Filter by company
     current_user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
@@ -145,7 +146,7 @@ def get_referrals(
     - company_id: Filter by company ID
       * Referrers: Can only use their assigned company_id (validated)
       * Lead/Admin: Can use any company_id
-    - skip: Number of records to skip for pagination
+    - cursor: Opaque cursor of the page to fetch (from the X-Next-Cursor header)
     - limit: Maximum number of records to return
 
     Access Control:
@@ -166,10 +167,7 @@ def get_referrals(
 
         referrals = referral_crud.read_user_referrals(db, user_id=user_id)
         return {
-            "referrals": [
-                referral_dependencies.parse_referral_with_user(referral)
-                for referral in referrals
-            ]
+            "referrals": referral_dependencies.parse_referrals_with_users(db, referrals)
         }
 
     # For viewing all referrals (requires at least Referrer role)
@@ -213,37 +211,90 @@ def get_referrals(
 
     # Fetch referrals based on filter
     if filter_company_id:
-        # Get company name from company_id for filtering
-        from bson import ObjectId
-
-        # Ensure filter_company_id is an ObjectId
-        if isinstance(filter_company_id, str):
-            filter_company_id = ObjectId(filter_company_id)
-
-        company = db.companies.find_one({"_id": filter_company_id})
-        if not company:
+        company_id_filter = referral_crud.resolve_company_id(
+            db, company=str(filter_company_id)
+        )
+        if company_id_filter is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Company not found",
             )
-        company_name = company.get("name", "")
 
-        # Get referrals filtered by company (using company name)
-        referrals = referral_crud.read_company_referrals(
-            db, company_id=company_name, skip=skip, limit=limit
+        # Indexed lookup on the referral's company reference
+        referrals, next_cursor = referral_crud.read_company_referrals(
+            db, company_id=company_id_filter, cursor=cursor, limit=limit
         )
     else:
         # No filter - get all referrals (Lead/Admin only)
-        referrals = referral_crud.read_all_referrals(db, skip=skip, limit=limit)
+        referrals, next_cursor = referral_crud.read_all_referrals(
+            db, cursor=cursor, limit=limit
+        )
+
+    response.headers.update(next_cursor_headers(next_cursor))
 
     return {
-        "referrals": [
-            referral_dependencies.parse_referral_with_user(referral)
-            for referral in referrals
-        ]
+        "referrals": referral_dependencies.parse_referrals_with_users(db, referrals)
     }
 
 
+@referral_router.get(
+    "/queue",
+    response_model=referral_schema.ReferralQueueRead,
+)
+def get_referrer_queue(
+    db: Database = Depends(session.get_db),
+    *,
+    company_id: Optional[str] = None,
+    status: Optional[referral_schema.ReferralStatuses] = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
+) -> Any:
+    """
+    Get a referrer's work queue: pending requests first (oldest first),
+    per-status counts and how long each pending request has waited.
+    - Referrers (role=2): Their assigned company
+    - Lead/Admin (role>=4): Any company, via company_id
+    """
+    from app.core.permissions import is_referrer, require_referrer
+    from bson import ObjectId
+
+    require_referrer(user)
+
+    if is_referrer(user):
+        if not user.company_id:
+            raise HTTPException(
+                status_code=400, detail="Referrer account has no assigned company"
+            )
+        queue_company_id = ObjectId(user.company_id)
+    else:
+        require_lead(user)
+        if not company_id:
+            raise HTTPException(status_code=400, detail="company_id is required")
+        queue_company_id = referral_crud.resolve_company_id(db, company=company_id)
+        if queue_company_id is None:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+    queue = referral_crud.read_referrer_queue(
+        db,
+        company_id=queue_company_id,
+        status=status.value if status else None,
+        limit=limit,
+    )
+
+    referrals = [referral for referral, _ in queue["referrals"]]
+    parsed = referral_dependencies.parse_referrals_with_users(db, referrals)
+    return referral_schema.ReferralQueueRead(
+        referrals=[
+            referral_schema.ReferralQueueItem(
+                **referral_read.model_dump(), sla_age_days=sla_age_days
+            )
+            for referral_read, (_, sla_age_days) in zip(parsed, queue["referrals"])
+        ],
+        counts=queue["counts"],
+        total=queue["total"],
+    )
+
+
 @referral_router.get(
     "/company/{company_id}",
     response_model=Dict[str, Any],
@@ -252,8 +303,8 @@ def get_company_referrals(
     db: Database = Depends(session.get_db),
     *,
     company_id: str,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
     user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
@@ -263,18 +314,19 @@ def get_company_referrals(
     # Check if user has elevated privileges
     require_lead(user)
 
-    referrals = referral_crud.read_company_referrals(
-        db, company_id=company_id, skip=skip, limit=limit
+    # company_id may be the company's ObjectId or its name
+    company_object_id = referral_crud.resolve_company_id(db, company=company_id)
+    if company_object_id is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+
+    referrals, next_cursor, total = referral_crud.read_company_referrals_with_total(
+        db, company_id=company_object_id, cursor=cursor, limit=limit
     )
-    total = referral_crud.count_referrals_by_company(db, company_id=company_id)
 
     return {
-        "referrals": [
-            referral_dependencies.parse_referral_with_user(referral)
-            for referral in referrals
-        ],
+        "referrals": referral_dependencies.parse_referrals_with_users(db, referrals),
         "total": total,
-        "skip": skip,
+        "next_cursor": next_cursor,
         "limit": limit,
     }
 
@@ -287,8 +339,8 @@ def get_referrals_by_status(
     db: Database = Depends(session.get_db),
     *,
     status: str,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
     user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
@@ -299,18 +351,14 @@ def get_referrals_by_status(
     # Check if user has elevated privileges
     require_lead(user)
 
-    referrals = referral_crud.read_referrals_by_status(
-        db, status=status, skip=skip, limit=limit
+    referrals, next_cursor, total = referral_crud.read_referrals_by_status_with_total(
+        db, status=status, cursor=cursor, limit=limit
     )
-    total = referral_crud.count_referrals_by_status(db, status=status)
 
     return {
-        "referrals": [
-            referral_dependencies.parse_referral_with_user(referral)
-            for referral in referrals
-        ],
+        "referrals": referral_dependencies.parse_referrals_with_users(db, referrals),
         "total": total,
-        "skip": skip,
+        "next_cursor": next_cursor,
         "limit": limit,
     }
 
@@ -338,8 +386,13 @@ def get_user_company_referrals(
             detail="Not authorized to access these referrals",
         )
 
+    # company_id may be the company's ObjectId or its name
+    company_object_id = referral_crud.resolve_company_id(db, company=company_id)
+    if company_object_id is None:
+        return {"referrals": []}
+
     referrals = referral_crud.read_user_company_referrals(
-        db, user_id=user_id, company_id=company_id
+        db, user_id=user_id, company_id=company_object_id
     )
     return {
         "referrals": [
@@ -382,17 +435,8 @@ def update_referral(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Referrer account has no assigned company",
             )
-        # Get company name from company_id
-        company = db.companies.find_one({"_id": ObjectId(user.company_id)})
-        if not company:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Assigned company not found",
-            )
-        company_name = company.get("name", "")
-
         # Verify referral belongs to this referrer's company
-        if referral_data.get("company_name") != company_name:
+        if referral_data.get("company_id") != ObjectId(user.company_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to update this referral",
@@ -408,7 +452,7 @@ def update_referral(
     if not referral:
         raise HTTPException(status_code=404, detail="Referral not found")
 
-    return {"referral": referral_dependencies.parse_referral_with_user(referral)}
+    return {"referral": referral_dependencies.parse_referral_with_user(db, referral)}
 
 
 @referral_router.post(
@@ -438,33 +482,69 @@ def review_referral(
     if not referral:
         raise HTTPException(status_code=404, detail="Referral not found")
 
-    return {"referral": referral_dependencies.parse_referral_with_user(referral)}
+    return {"referral": referral_dependencies.parse_referral_with_user(db, referral)}
+
+
+@referral_router.post(
+    "/bulk/status",
+    response_model=Dict[str, list[referral_schema.ReferralBulkStatusResult]],
+)
+def bulk_update_referral_status(
+    *,
+    db: Database = Depends(session.get_db),
+    data: referral_schema.ReferralBulkStatusUpdate,
+    user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
+) -> Any:
+    """
+    Update the status of many referrals at once.
+    - Referrers (role=2): Only referrals for their assigned company are updated
+    - Lead/Admin (role>=4): Any referral
+    Each id gets its own result: updated, unchanged, not_found, forbidden,
+    invalid_transition or conflict (changed by someone else meanwhile).
+    """
+    from app.core.permissions import get_user_role, is_referrer, require_referrer
+    from bson import ObjectId
+
+    require_referrer(user)
+
+    company_id = None
+    if is_referrer(user):
+        if not user.company_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Referrer account has no assigned company",
+            )
+        company_id = ObjectId(user.company_id)
+    else:
+        require_lead(user)
+
+    results = referral_crud.bulk_update_referral_status(
+        db, data=data, user_role=get_user_role(user), company_id=company_id
+    )
+    return {"results": results}
 
 
 @referral_router.post(
     "/export/google-sheets",
-    response_model=Dict[str, str],
+    response_model=Dict[str, export_schema.ExportJobRead],
+    status_code=status.HTTP_202_ACCEPTED,
 )
 def export_referrals_to_sheets(
     db: Database = Depends(session.get_db),
     *,
-    referral_ids: list[int] = None,
+    data: export_schema.ReferralSheetExportCreate = export_schema.ReferralSheetExportCreate(),
     user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
-    Export referrals to Google Sheets (Lead/Admin only).
+    Export referrals to Google Sheets in the background (Lead/Admin only).
     If referral_ids is provided, export only those referrals.
     Otherwise, export all referrals.
+    Poll /exports/{job_id} for progress and the sheet URL.
     """
     # Check if user has elevated privileges
     require_lead(user)
 
-    try:
-        sheet_url = referral_crud.export_referrals_to_google_sheets(
-            db, referral_ids=referral_ids
-        )
-        return {"sheet_url": sheet_url, "message": "Referrals exported successfully"}
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to export to Google Sheets: {str(e)}"
-        )
+    job = export_crud.create_referral_sheet_export(
+        db, user_id=str(user.id), referral_ids=data.referral_ids
+    )
+    return {"job": export_crud.job_to_read(job)}
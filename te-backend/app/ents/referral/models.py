@@ -1,57 +1,18 @@
-from typing import Optional, List, Any
-from pydantic import BaseModel, Field, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import core_schema
-from bson import ObjectId
+from typing import Optional
+from pydantic import Field
 
+from app.database.models import MongoModel, PyObjectId
 
-# Custom type for MongoDB ObjectId compatible with Pydantic v2
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: Any
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema(
-                    [
-                        core_schema.str_schema(),
-                        core_schema.no_info_plain_validator_function(cls.validate),
-                    ]
-                ),
-            ]
-        )
 
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
-        raise ValueError("Invalid ObjectId")
-
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
-    ) -> JsonSchemaValue:
-        return {"type": "string"}
-
-
-class Location(BaseModel):
+class Location(MongoModel):
     """MongoDB Location subdocument"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
     country: str
     city: str = ""
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
 
-
-class ReferralCompany(BaseModel):
+class ReferralCompany(MongoModel):
     """MongoDB ReferralCompany document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -63,18 +24,14 @@ class ReferralCompany(BaseModel):
     referral_materials: dict = {}
     metadata: dict = {}  # Store additional company info and requirements
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-
 
-class Referral(BaseModel):
+class Referral(MongoModel):
     """MongoDB Referral document model"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
     user_id: PyObjectId
-    company_name: Optional[str] = ""  # Company name from frontend static data
+    company_id: Optional[PyObjectId] = None  # Referenced company (indexed)
+    company_name: Optional[str] = ""  # Denormalized company name for display
     job_title: str
     job_id: Optional[str] = ""
     role: str  # JobRoles enum value
@@ -87,8 +44,3 @@ class Referral(BaseModel):
     referral_date: str
     feedback_date: Optional[str] = None  # Date when referrer provided feedback
     status: str  # ReferralStatuses enum value
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
@@ -3,7 +3,9 @@ from enum import Enum
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
+
+from app.database.models import ObjectIdStr
 
 
 class JobRoles(Enum):
@@ -63,13 +65,13 @@ class ReferralCompanyUpdate(BaseModel):
 
 
 class CompanyReadBase(ReferralCompanyBase):
-    id: str  # MongoDB ObjectId as string
+    id: ObjectIdStr  # MongoDB ObjectId as string
     domain: str
     can_refer: bool = True
 
 
 class LocationRead(LocationBase):
-    id: str  # MongoDB ObjectId as string
+    id: ObjectIdStr  # MongoDB ObjectId as string
 
 
 class CompanyRead(CompanyReadBase):
@@ -98,14 +100,16 @@ class ReferralStatuses(Enum):
 
 
 class ReferralReadBase(BaseModel):
-    id: str  # MongoDB ObjectId as string
-    user_id: str  # MongoDB ObjectId as string
+    id: ObjectIdStr = Field(
+        validation_alias=AliasChoices("_id", "id")
+    )  # MongoDB ObjectId as string
+    user_id: ObjectIdStr  # MongoDB ObjectId as string
     job_title: str
     job_id: Optional[str] = ""
     role: str
     request_note: str = ""
     review_note: Optional[str] = ""
-    date: str
+    date: str = Field(validation_alias=AliasChoices("referral_date", "date"))
     feedback_date: Optional[str] = None
     status: ReferralStatuses
     resume: str = ""
@@ -126,6 +130,32 @@ class ReferralReadWithUser(ReferralReadBase):
     user_email: str
 
 
+class ReferralBulkStatusUpdate(BaseModel):
+    """Schema for moving many referrals to one status"""
+
+    referral_ids: list[str] = Field(..., min_length=1, max_length=500)
+    status: ReferralStatuses
+    review_note: Optional[str] = ""
+
+
+class ReferralBulkStatusResult(BaseModel):
+    id: str
+    result: str  # updated, unchanged, not_found, forbidden, invalid_transition, conflict
+    status: Optional[str] = None  # Status after the request
+
+
+class ReferralQueueItem(ReferralReadWithUser):
+    """Referral in a referrer's work queue"""
+
+    sla_age_days: Optional[int] = None  # Days a pending request has waited
+
+
+class ReferralQueueRead(BaseModel):
+    referrals: list[ReferralQueueItem]
+    counts: dict[str, int]  # Referral count per status for the company
+    total: int
+
+
 class ReferralUpdateStatus(BaseModel):
     """Schema for updating referral status"""
 
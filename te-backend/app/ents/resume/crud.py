@@ -1,17 +1,14 @@
-import os
-import tempfile
 from datetime import date, datetime
 from uuid import uuid4
 
 from bson import ObjectId
 from fastapi import HTTPException, status
-from googleapiclient.http import MediaFileUpload
 from pymongo.database import Database
 
-import app.core.service as service
-from app.core.settings import settings
 import app.ents.resume.models as resume_models
 import app.ents.resume.schema as resume_schema
+from app.database.projection import find_projected, id_str, optional_id_str, value_or
+from app.database.repository import insert_model, update_document
 
 
 def read_resumes(db: Database, *, user_id: str) -> list[resume_models.Resume]:
@@ -24,53 +21,61 @@ def read_resumes(db: Database, *, user_id: str) -> list[resume_models.Resume]:
     return [resume_models.Resume(**resume) for resume in user.get("resumes", [])]
 
 
-def upload_file(file, parent) -> resume_schema.FileUpload:
-    """Upload a file to Google Drive and return its metadata."""
-    drive_service = service.get_drive_service()
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-        temp_file.write(file.file.read())
+def _drive_view_link(link: str) -> str:
+    """Strip the forced-download suffix from a Drive webContentLink."""
+    link = link or ""
+    if "&export=download" in link:
+        link = link[: link.find("&export=download")]
+    return link
 
-    file_metadata = {
-        "name": file.filename,
-        "parents": [parent],
-    }
 
-    media = MediaFileUpload(temp_file.name, resumable=True)
-    uploaded_file = (
-        drive_service.files()
-        .create(
-            body=file_metadata,
-            media_body=media,
-            fields="id,name,webContentLink",
-        )
-        .execute()
+def read_resume_by_hash(
+    db: Database, *, user_id: str, sha256: str
+) -> resume_models.Resume | None:
+    """Find an active, uploaded resume of the user with the given content hash."""
+    user = db.member_users.find_one(
+        {
+            "_id": ObjectId(user_id),
+            "resumes": {
+                "$elemMatch": {"sha256": sha256, "status": "ready", "archived": False}
+            },
+        },
+        {"resumes.$": 1},
     )
 
-    os.remove(temp_file.name)
-    return resume_schema.FileUpload(
-        file_id=uploaded_file.get("id"),
-        name=uploaded_file.get("name"),
-        link=uploaded_file.get("webContentLink"),
-    )
+    if not user:
+        return None
+
+    return resume_models.Resume(**user["resumes"][0])
 
 
 def create_resume(
-    db: Database, file, user_id: str, role: str = "", notes: str = ""
+    db: Database,
+    *,
+    user_id: str,
+    name: str,
+    sha256: str,
+    upload_job_id: str,
+    uploaded_file: resume_schema.FileUpload | None = None,
+    role: str = "",
+    notes: str = "",
 ) -> resume_models.Resume:
-    """Upload and create a new resume for a member (embedded in user document)."""
-    uploaded_file = upload_file(file=file, parent=settings.GDRIVE_RESUMES)
-
+    """
+    Add a resume entry to the user's embedded resumes array.
+    Without `uploaded_file` the entry is pending until its upload job completes.
+    """
     new_resume = {
         "id": str(uuid4()),
-        "file_id": uploaded_file.file_id,
-        "name": uploaded_file.name,
-        "link": uploaded_file.link[: uploaded_file.link.find("&export=download")]
-        if "&export=download" in uploaded_file.link
-        else uploaded_file.link,
+        "file_id": uploaded_file.file_id if uploaded_file else "",
+        "name": name,
+        "link": _drive_view_link(uploaded_file.link) if uploaded_file else "",
         "date": date.today().strftime("%Y-%m-%d"),
         "role": role,
         "notes": notes,
         "archived": False,
+        "status": "ready" if uploaded_file else "uploading",
+        "upload_job_id": upload_job_id,
+        "sha256": sha256,
     }
 
     result = db.member_users.update_one(
@@ -83,6 +88,39 @@ def create_resume(
     return resume_models.Resume(**new_resume)
 
 
+def complete_resume_upload(
+    db: Database,
+    *,
+    user_id: str,
+    resume_id: str,
+    uploaded_file: resume_schema.FileUpload,
+) -> bool:
+    """Fill in the Drive file details of a pending resume entry."""
+    result = db.member_users.update_one(
+        {"_id": ObjectId(user_id)},
+        {
+            "$set": {
+                "resumes.$[res].file_id": uploaded_file.file_id,
+                "resumes.$[res].name": uploaded_file.name,
+                "resumes.$[res].link": _drive_view_link(uploaded_file.link),
+                "resumes.$[res].status": "ready",
+            }
+        },
+        array_filters=[{"res.id": resume_id}],
+    )
+    return result.modified_count > 0
+
+
+def fail_resume_upload(db: Database, *, user_id: str, resume_id: str) -> bool:
+    """Mark a pending resume entry as failed so the member can retry."""
+    result = db.member_users.update_one(
+        {"_id": ObjectId(user_id)},
+        {"$set": {"resumes.$[res].status": "failed"}},
+        array_filters=[{"res.id": resume_id}],
+    )
+    return result.modified_count > 0
+
+
 def delete_resume(db: Database, *, resume_id: str, user_id: str) -> bool:
     """Delete a resume by UUID from the user's embedded resumes array."""
     result = db.member_users.update_one(
@@ -114,20 +152,14 @@ def update_resume(
     if not update_fields:
         return None
 
-    result = db.member_users.update_one(
-        {"_id": ObjectId(user_id)},
+    updated_user = update_document(
+        db.member_users,
+        {"_id": ObjectId(user_id), "resumes.id": resume_id},
         {"$set": update_fields},
+        projection={"resumes": {"$elemMatch": {"id": resume_id}}},
         array_filters=[{"res.id": resume_id}],
     )
 
-    if result.modified_count == 0:
-        return None
-
-    updated_user = db.member_users.find_one(
-        {"_id": ObjectId(user_id)},
-        {"resumes": {"$elemMatch": {"id": resume_id}}},
-    )
-
     if not updated_user or "resumes" not in updated_user or not updated_user["resumes"]:
         return None
 
@@ -163,73 +195,67 @@ def create_review_request(
         "notes": data.notes,
     }
 
-    result = db.resume_reviews.insert_one(review_data)
-    created_review = db.resume_reviews.find_one({"_id": result.inserted_id})
-    return resume_models.ResumeReview(**created_review)
+    return insert_model(db.resume_reviews, review_data, resume_models.ResumeReview)
+
+
+# Review listings are shaped by the database and returned to the client as-is
+REVIEW_REQUEST_LIST_PROJECTION = {
+    "_id": id_str("$_id"),
+    "id": id_str("$_id"),
+    "user_id": id_str("$user_id"),
+    "user_name": value_or("$user_name"),
+    "user_email": value_or("$user_email"),
+    "resume_link": value_or("$resume_link"),
+    "job_title": value_or("$job_title"),
+    "level": value_or("$level"),
+    "status": value_or("$status"),
+    "submitted_date": value_or("$submitted_date"),
+    "reviewed_by": optional_id_str("$reviewed_by"),
+    "reviewer_name": value_or("$reviewer_name"),
+    "assigned_date": value_or("$assigned_date"),
+    "review_date": value_or("$review_date"),
+    "feedback": value_or("$feedback", ""),
+    "notes": value_or("$notes", ""),
+    "updated_at": value_or("$updated_at"),
+}
+
+ASSIGNED_REVIEW_LIST_PROJECTION = {
+    "_id": 0,
+    "id": id_str("$_id"),
+    "user_id": optional_id_str("$user_id"),
+    "user_name": value_or("$user_name"),
+    "user_email": value_or("$user_email"),
+    "resume_link": value_or("$resume_link"),
+    "job_title": value_or("$job_title"),
+    "level": value_or("$level"),
+    "notes": value_or("$notes"),
+    "status": value_or("$status"),
+    "feedback": value_or("$feedback"),
+    "submitted_date": value_or("$submitted_date"),
+    "reviewed_by": optional_id_str("$reviewed_by"),
+    "reviewer_name": value_or("$reviewer_name"),
+    "assigned_date": value_or("$assigned_date"),
+}
 
 
 def read_all_review_requests(db: Database) -> list[dict]:
     """Read all resume review requests (for Volunteers and above)."""
-    reviews_data = db.resume_reviews.find({}).sort("submitted_date", -1)
-    result: list[dict] = []
-    for review in reviews_data:
-        result.append(
-            {
-                "id": str(review["_id"]),
-                "_id": str(review["_id"]),
-                "user_id": str(review["user_id"]),
-                "user_name": review.get("user_name"),
-                "user_email": review.get("user_email"),
-                "resume_link": review.get("resume_link"),
-                "job_title": review.get("job_title"),
-                "level": review.get("level"),
-                "status": review.get("status"),
-                "submitted_date": review.get("submitted_date"),
-                "reviewed_by": str(review["reviewed_by"])
-                if review.get("reviewed_by")
-                else None,
-                "reviewer_name": review.get("reviewer_name"),
-                "assigned_date": review.get("assigned_date"),
-                "review_date": review.get("review_date"),
-                "feedback": review.get("feedback", ""),
-                "notes": review.get("notes", ""),
-                "updated_at": review.get("updated_at"),
-            }
-        )
-    return result
+    return find_projected(
+        db.resume_reviews,
+        {},
+        REVIEW_REQUEST_LIST_PROJECTION,
+        sort=[("submitted_date", -1)],
+    )
 
 
 def read_user_review_requests(db: Database, *, user_id: str) -> list[dict]:
     """Read resume review requests for a specific user."""
-    reviews_data = db.resume_reviews.find({"user_id": ObjectId(user_id)}).sort(
-        "submitted_date", -1
+    return find_projected(
+        db.resume_reviews,
+        {"user_id": ObjectId(user_id)},
+        REVIEW_REQUEST_LIST_PROJECTION,
+        sort=[("submitted_date", -1)],
     )
-    result: list[dict] = []
-    for review in reviews_data:
-        result.append(
-            {
-                "id": str(review["_id"]),
-                "_id": str(review["_id"]),
-                "user_id": str(review["user_id"]),
-                "user_name": review.get("user_name"),
-                "user_email": review.get("user_email"),
-                "resume_link": review.get("resume_link"),
-                "job_title": review.get("job_title"),
-                "level": review.get("level"),
-                "status": review.get("status"),
-                "submitted_date": review.get("submitted_date"),
-                "reviewed_by": str(review["reviewed_by"])
-                if review.get("reviewed_by")
-                else None,
-                "reviewer_name": review.get("reviewer_name"),
-                "assigned_date": review.get("assigned_date"),
-                "review_date": review.get("review_date"),
-                "feedback": review.get("feedback", ""),
-                "notes": review.get("notes", ""),
-                "updated_at": review.get("updated_at"),
-            }
-        )
-    return result
 
 
 def update_review_request(
@@ -271,17 +297,16 @@ def update_review_request(
             detail="No fields to update",
         )
 
-    result = db.resume_reviews.update_one(
-        {"_id": ObjectId(review_id)}, {"$set": update_data}
+    updated_review = update_document(
+        db.resume_reviews, {"_id": ObjectId(review_id)}, {"$set": update_data}
     )
 
-    if result.matched_count == 0:
+    if updated_review is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume review request not found",
         )
 
-    updated_review = db.resume_reviews.find_one({"_id": ObjectId(review_id)})
     return {
         "id": str(updated_review["_id"]),
         "_id": str(updated_review["_id"]),
@@ -350,17 +375,16 @@ def assign_review_to_reviewer(
         "updated_at": datetime.utcnow().isoformat(),
     }
 
-    result = db.resume_reviews.update_one(
-        {"_id": ObjectId(review_id)}, {"$set": assignment_data}
+    updated_review = update_document(
+        db.resume_reviews, {"_id": ObjectId(review_id)}, {"$set": assignment_data}
     )
 
-    if result.matched_count == 0:
+    if updated_review is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume review request not found",
         )
 
-    updated_review = db.resume_reviews.find_one({"_id": ObjectId(review_id)})
     return {
         "id": str(updated_review["_id"]),
         "_id": str(updated_review["_id"]),
@@ -415,52 +439,17 @@ def bulk_assign_reviews_to_reviewer(
 
 def get_reviews_assigned_to_user(db: Database, *, user_id: str) -> list[dict]:
     """Get all resume reviews assigned to a specific user."""
-    reviews_data = db.resume_reviews.find({"reviewed_by": ObjectId(user_id)})
-    result: list[dict] = []
-    for review in reviews_data:
-        result.append(
-            {
-                "id": str(review["_id"]),
-                "user_id": str(review.get("user_id")),
-                "user_name": review.get("user_name"),
-                "user_email": review.get("user_email"),
-                "resume_link": review.get("resume_link"),
-                "job_title": review.get("job_title"),
-                "level": review.get("level"),
-                "notes": review.get("notes"),
-                "status": review.get("status"),
-                "feedback": review.get("feedback"),
-                "submitted_date": review.get("submitted_date"),
-                "reviewed_by": str(review.get("reviewed_by"))
-                if review.get("reviewed_by")
-                else None,
-                "reviewer_name": review.get("reviewer_name"),
-                "assigned_date": review.get("assigned_date"),
-            }
-        )
-    return result
+    return find_projected(
+        db.resume_reviews,
+        {"reviewed_by": ObjectId(user_id)},
+        ASSIGNED_REVIEW_LIST_PROJECTION,
+    )
 
 
 def get_all_assigned_reviews(db: Database) -> list[dict]:
     """Get all resume reviews that have been assigned (Admin only)."""
-    reviews_data = db.resume_reviews.find({"reviewed_by": {"$ne": None}})
-    result: list[dict] = []
-    for review in reviews_data:
-        result.append(
-            {
-                "id": str(review["_id"]),
-                "user_id": str(review.get("user_id")),
-                "user_name": review.get("user_name"),
-                "user_email": review.get("user_email"),
-                "resume_link": review.get("resume_link"),
-                "job_title": review.get("job_title"),
-                "level": review.get("level"),
-                "status": review.get("status"),
-                "feedback": review.get("feedback"),
-                "submitted_date": review.get("submitted_date"),
-                "reviewed_by": str(review.get("reviewed_by")),
-                "reviewer_name": review.get("reviewer_name"),
-                "assigned_date": review.get("assigned_date"),
-            }
-        )
-    return result
+    return find_projected(
+        db.resume_reviews,
+        {"reviewed_by": {"$ne": None}},
+        ASSIGNED_REVIEW_LIST_PROJECTION,
+    )
@@ -4,9 +4,11 @@ import app.database.session as session
 import app.ents.resume.crud as resume_crud
 import app.ents.resume.models as resume_models
 import app.ents.resume.schema as resume_schema
+import app.ents.upload.crud as upload_crud
 import app.ents.user.dependencies as user_dependencies
 import app.ents.user.models as user_models
 from app.core.permissions import get_user_role, require_volunteer
+from app.core.responses import ORJSONResponse
 from fastapi import (
     APIRouter,
     Depends,
@@ -81,8 +83,8 @@ def list_resumes(
 
 @resumes_router.post(
     "",
-    response_model=Dict[str, resume_schema.ResumeRead],
-    status_code=status.HTTP_201_CREATED,
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_202_ACCEPTED,
 )
 def upload_resume(
     *,
@@ -91,7 +93,7 @@ def upload_resume(
     role: str = Form(default="", description="Target role for this resume"),
     notes: str = Form(default="", description="Additional notes about this resume"),
     current_user=Depends(user_dependencies.get_current_member_only),
-) -> Dict[str, resume_schema.ResumeRead]:
+) -> Dict[str, Any]:
     target_user_id = str(current_user.id)
 
     if not file.filename or not file.filename.lower().endswith(".pdf"):
@@ -100,11 +102,12 @@ def upload_resume(
             detail="Only PDF files are accepted. Please upload a PDF file.",
         )
 
-    uploaded_resume = resume_crud.create_resume(
+    # The file is pushed to Drive in the background; poll /uploads/{job_id}
+    job, pending_resume = upload_crud.create_resume_upload_job(
         db, file=file, user_id=target_user_id, role=role, notes=notes
     )
 
-    return {"resume": resume_to_read(uploaded_resume)}
+    return {"job": upload_crud.job_to_read(job), "resume": pending_resume}
 
 
 @resumes_router.patch(
@@ -192,8 +195,8 @@ def list_user_resumes(
 
 @user_resumes_router.post(
     "",
-    response_model=Dict[str, resume_schema.ResumeRead],
-    status_code=status.HTTP_201_CREATED,
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_202_ACCEPTED,
 )
 def upload_user_resume(
     db: Database = Depends(session.get_db),
@@ -203,7 +206,7 @@ def upload_user_resume(
     role: str = Form(default="", description="Target role for this resume"),
     notes: str = Form(default="", description="Additional notes about this resume"),
     current_user=Depends(user_dependencies.get_current_member_only),
-) -> Dict[str, resume_schema.ResumeRead]:
+) -> Dict[str, Any]:
     if str(current_user.id) != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -216,11 +219,12 @@ def upload_user_resume(
             detail="Only PDF files are accepted. Please upload a PDF file.",
         )
 
-    uploaded_resume = resume_crud.create_resume(
+    # The file is pushed to Drive in the background; poll /uploads/{job_id}
+    job, pending_resume = upload_crud.create_resume_upload_job(
         db, file=file, user_id=user_id, role=role, notes=notes
     )
 
-    return {"resume": resume_to_read(uploaded_resume)}
+    return {"job": upload_crud.job_to_read(job), "resume": pending_resume}
 
 
 @user_resumes_router.patch(
@@ -336,7 +340,8 @@ def get_resume_review_requests(
         require_volunteer(current_user)
         reviews = resume_crud.read_all_review_requests(db)
 
-    return {"reviews": reviews}
+    # Documents are already in their API shape; skip response-model validation
+    return ORJSONResponse({"reviews": reviews})
 
 
 @resume_reviews_router.patch("", response_model=Dict[str, Any])
@@ -501,7 +506,7 @@ def get_review_assignments(
             )
 
         reviews = resume_crud.get_reviews_assigned_to_user(db, user_id=user_id)
-        return {"reviews": reviews}
+        return ORJSONResponse({"reviews": reviews})
     else:
         # Viewing all assignments requires Admin role
         if user_role < 5:
@@ -511,4 +516,4 @@ def get_review_assignments(
             )
 
         assignments = resume_crud.get_all_assigned_reviews(db)
-        return {"assignments": assignments}
+        return ORJSONResponse({"assignments": assignments})
@@ -1,12 +1,11 @@
 from typing import Optional
 
-from bson import ObjectId
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from app.ents.user.models import PyObjectId
+from app.database.models import MongoModel, PyObjectId
 
 
-class Resume(BaseModel):
+class Resume(MongoModel):
     """Embedded Resume document stored on the member user record."""
 
     id: str  # UUID for identifying this resume
@@ -17,12 +16,12 @@ class Resume(BaseModel):
     role: str = ""  # Target role for this resume
     notes: str = ""  # Additional notes about this resume
     archived: bool = False
+    status: str = "ready"  # "uploading" while the file is pushed to storage
+    upload_job_id: Optional[str] = None  # Background upload job for this file
+    sha256: Optional[str] = None  # Content hash used to deduplicate uploads
 
-    class Config:
-        arbitrary_types_allowed = True
 
-
-class ResumeReview(BaseModel):
+class ResumeReview(MongoModel):
     """MongoDB ResumeReview document model."""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -41,8 +40,3 @@ class ResumeReview(BaseModel):
     feedback: str = ""
     notes: str = ""
     updated_at: Optional[str] = None
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
@@ -9,6 +9,7 @@ class ResumeBase(BaseModel):
     role: str = ""
     notes: str = ""
     archived: bool = False
+    status: str = "ready"
 
 
 class Resume(ResumeBase):
@@ -19,6 +20,7 @@ class ResumeRead(ResumeBase):
     id: str
     file_id: str
     link: str
+    upload_job_id: Optional[str] = None
 
 
 class ResumesRead(BaseModel):
@@ -0,0 +1,465 @@
+import hashlib
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+from pymongo.database import Database
+
+import app.core.background as background
+import app.ents.resume.crud as resume_crud
+import app.ents.resume.schema as resume_schema
+import app.ents.upload.models as upload_models
+import app.ents.upload.schema as upload_schema
+from app.core.settings import settings
+from app.core.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+
+# ============= Spooling =============
+
+
+def _spool_dir() -> Path:
+    spool_dir = Path(
+        settings.UPLOAD_SPOOL_DIR or os.path.join(tempfile.gettempdir(), "te-uploads")
+    )
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    return spool_dir
+
+
+def _spool_upload(file) -> tuple[str, int, str]:
+    """
+    Copy an incoming upload to the spool directory in fixed-size chunks,
+    hashing it on the way so the file is only read once.
+    """
+    spool_path = _spool_dir() / uuid4().hex
+    digest = hashlib.sha256()
+    size = 0
+
+    with open(spool_path, "wb") as spool_file:
+        while chunk := file.file.read(SPOOL_CHUNK_SIZE):
+            spool_file.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+
+    return str(spool_path), size, digest.hexdigest()
+
+
+def _remove_spool(spool_path: str) -> None:
+    if spool_path and os.path.exists(spool_path):
+        os.remove(spool_path)
+
+
+# ============= Stored File Index =============
+
+
+def _stored_file_key(sha256: str, parent: str) -> str:
+    return f"{parent}:{sha256}"
+
+
+def read_stored_file(
+    db: Database, *, sha256: str, parent: str, name: str
+) -> resume_schema.FileUpload | None:
+    """
+    Find a file with identical content already uploaded to the storage folder.
+    It is returned under `name`, the filename of the current upload, rather
+    than the name it was first uploaded with (possibly by another user).
+    """
+    stored = db.file_hashes.find_one({"_id": _stored_file_key(sha256, parent)})
+    if not stored:
+        return None
+
+    return resume_schema.FileUpload(
+        file_id=stored["file_id"], name=name, link=stored["link"]
+    )
+
+
+def record_stored_file(
+    db: Database,
+    *,
+    sha256: str,
+    parent: str,
+    size: int,
+    uploaded_file: resume_schema.FileUpload,
+) -> None:
+    """Index an uploaded file by content hash. The first upload of a file wins."""
+    db.file_hashes.update_one(
+        {"_id": _stored_file_key(sha256, parent)},
+        {
+            "$setOnInsert": {
+                "sha256": sha256,
+                "parent": parent,
+                "size": size,
+                "file_id": uploaded_file.file_id,
+                "name": uploaded_file.name,
+                "link": uploaded_file.link,
+                "created_at": datetime.utcnow(),
+            }
+        },
+        upsert=True,
+    )
+
+
+# ============= Upload Job CRUD =============
+
+
+def create_upload_job(
+    db: Database,
+    *,
+    job_id: ObjectId,
+    user_id: str,
+    kind: upload_schema.UploadKinds,
+    filename: str,
+    parent: str,
+    size: int,
+    sha256: str,
+    spool_path: str = "",
+    context: dict | None = None,
+    result: resume_schema.FileUpload | None = None,
+) -> upload_models.UploadJob:
+    """
+    Record an upload job for a spooled file. Jobs created with a `result`
+    (content already in storage) are completed immediately.
+    """
+    job = upload_models.UploadJob(
+        _id=job_id,
+        user_id=ObjectId(user_id),
+        kind=kind.value,
+        filename=filename,
+        size=size,
+        sha256=sha256,
+        parent=parent,
+        spool_path=spool_path,
+        context=context or {},
+    )
+    if result:
+        job.status = upload_schema.UploadStatuses.completed.value
+        job.progress = 1.0
+        job.result = result.model_dump()
+
+    db.upload_jobs.insert_one(job.model_dump(by_alias=True))
+    return job
+
+
+def read_upload_job(db: Database, *, job_id: str) -> upload_models.UploadJob:
+    try:
+        job_object_id = ObjectId(job_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload job not found"
+        )
+
+    job = db.upload_jobs.find_one({"_id": job_object_id})
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload job not found"
+        )
+
+    return upload_models.UploadJob(**job)
+
+
+def _update_upload_job(db: Database, job_id: ObjectId, **fields) -> None:
+    fields["updated_at"] = datetime.utcnow()
+    db.upload_jobs.update_one({"_id": job_id}, {"$set": fields})
+
+
+# ============= Background Upload =============
+
+
+def run_upload_job(db: Database, job_id: ObjectId) -> None:
+    """Push a spooled file to storage and record the outcome on the job."""
+    job = upload_models.UploadJob(**db.upload_jobs.find_one({"_id": job_id}))
+    _update_upload_job(db, job_id, status=upload_schema.UploadStatuses.uploading.value)
+
+    def report_progress(progress: float) -> None:
+        _update_upload_job(db, job_id, progress=round(progress, 4))
+
+    try:
+        stored = get_storage().upload(
+            job.spool_path,
+            name=job.filename,
+            parent=job.parent,
+            progress=report_progress,
+        )
+        uploaded_file = resume_schema.FileUpload(
+            file_id=stored["id"], name=stored["name"], link=stored["link"]
+        )
+
+        record_stored_file(
+            db,
+            sha256=job.sha256,
+            parent=job.parent,
+            size=job.size,
+            uploaded_file=uploaded_file,
+        )
+
+        if job.kind == upload_schema.UploadKinds.resume.value:
+            resume_crud.complete_resume_upload(
+                db,
+                user_id=str(job.user_id),
+                resume_id=job.context["resume_id"],
+                uploaded_file=uploaded_file,
+            )
+
+        _update_upload_job(
+            db,
+            job_id,
+            status=upload_schema.UploadStatuses.completed.value,
+            progress=1.0,
+            result=uploaded_file.model_dump(),
+            spool_path="",
+        )
+    except Exception as exc:
+        if job.kind == upload_schema.UploadKinds.resume.value:
+            resume_crud.fail_resume_upload(
+                db, user_id=str(job.user_id), resume_id=job.context["resume_id"]
+            )
+
+        _update_upload_job(
+            db,
+            job_id,
+            status=upload_schema.UploadStatuses.failed.value,
+            error=str(exc) or exc.__class__.__name__,
+            spool_path="",
+        )
+        raise
+    finally:
+        _remove_spool(job.spool_path)
+
+
+def create_resume_upload_job(
+    db: Database, *, file, user_id: str, role: str = "", notes: str = ""
+) -> tuple[upload_models.UploadJob, resume_schema.ResumeRead]:
+    """
+    Queue a resume upload and add its entry to the member's resumes.
+
+    Content that is already in storage is not uploaded again: a re-upload of
+    one of the member's own resumes returns that resume, with the new `role`
+    and `notes` if given, and a file uploaded before by anyone reuses the
+    existing Drive object.
+    """
+    job_id = ObjectId()
+    parent = settings.GDRIVE_RESUMES
+    spool_path, size, sha256 = _spool_upload(file)
+    job_fields = dict(
+        job_id=job_id,
+        user_id=user_id,
+        kind=upload_schema.UploadKinds.resume,
+        filename=file.filename,
+        parent=parent,
+        size=size,
+        sha256=sha256,
+    )
+
+    existing_resume = resume_crud.read_resume_by_hash(
+        db, user_id=user_id, sha256=sha256
+    )
+    if existing_resume:
+        _remove_spool(spool_path)
+        if role or notes:
+            updated_resume = resume_crud.update_resume(
+                db,
+                resume_id=existing_resume.id,
+                user_id=user_id,
+                data=resume_schema.ResumeUpdate(
+                    role=role or None, notes=notes or None
+                ),
+            )
+            existing_resume = updated_resume or existing_resume
+        job = create_upload_job(
+            db,
+            **job_fields,
+            context={"resume_id": existing_resume.id, "deduplicated": True},
+            result=resume_schema.FileUpload(
+                file_id=existing_resume.file_id,
+                name=existing_resume.name,
+                link=existing_resume.link,
+            ),
+        )
+        return job, resume_schema.ResumeRead(**existing_resume.model_dump())
+
+    stored_file = read_stored_file(db, sha256=sha256, parent=parent, name=file.filename)
+    if stored_file:
+        _remove_spool(spool_path)
+
+    try:
+        resume = resume_crud.create_resume(
+            db,
+            user_id=user_id,
+            name=file.filename,
+            sha256=sha256,
+            upload_job_id=str(job_id),
+            uploaded_file=stored_file,
+            role=role,
+            notes=notes,
+        )
+    except Exception:
+        _remove_spool(spool_path)
+        raise
+
+    job = None
+    try:
+        if stored_file:
+            job = create_upload_job(
+                db,
+                **job_fields,
+                context={"resume_id": resume.id, "deduplicated": True},
+                result=stored_file,
+            )
+        else:
+            job = create_upload_job(
+                db,
+                **job_fields,
+                spool_path=spool_path,
+                context={"resume_id": resume.id},
+            )
+            background.submit(run_upload_job, db, job_id)
+    except Exception:
+        # No job will ever finish this entry; don't leave it on the resume list
+        resume_crud.delete_resume(db, resume_id=resume.id, user_id=user_id)
+        _remove_spool(spool_path)
+        if job is not None:
+            _update_upload_job(
+                db,
+                job_id,
+                status=upload_schema.UploadStatuses.failed.value,
+                error="Upload could not be scheduled",
+                spool_path="",
+            )
+        raise
+
+    return job, resume_schema.ResumeRead(**resume.model_dump())
+
+
+def create_lesson_upload_job(
+    db: Database, *, file, user_id: str
+) -> upload_models.UploadJob:
+    """Queue a lesson file upload, reusing stored content with the same hash."""
+    job_id = ObjectId()
+    parent = settings.GDRIVE_LESSONS
+    spool_path, size, sha256 = _spool_upload(file)
+    job_fields = dict(
+        job_id=job_id,
+        user_id=user_id,
+        kind=upload_schema.UploadKinds.lesson,
+        filename=file.filename,
+        parent=parent,
+        size=size,
+        sha256=sha256,
+    )
+
+    stored_file = read_stored_file(db, sha256=sha256, parent=parent, name=file.filename)
+    if stored_file:
+        _remove_spool(spool_path)
+        return create_upload_job(
+            db, **job_fields, context={"deduplicated": True}, result=stored_file
+        )
+
+    try:
+        job = create_upload_job(db, **job_fields, spool_path=spool_path)
+    except Exception:
+        _remove_spool(spool_path)
+        raise
+
+    try:
+        background.submit(run_upload_job, db, job_id)
+    except Exception:
+        _remove_spool(spool_path)
+        _update_upload_job(
+            db,
+            job_id,
+            status=upload_schema.UploadStatuses.failed.value,
+            error="Upload could not be scheduled",
+            spool_path="",
+        )
+        raise
+    return job
+
+
+# ============= Recovery =============
+
+
+def recover_upload_jobs(db: Database) -> None:
+    """
+    Requeue or fail jobs left queued/uploading by a process that stopped
+    (restart, deploy, worker recycle): the queue lives in that process.
+    A job is requeued when its spool file is still on this host, otherwise it
+    is failed together with its resume entry. Only jobs untouched for
+    BACKGROUND_JOB_STALE_SECONDS count, so running jobs of live workers are
+    left alone.
+    """
+    cutoff = datetime.utcnow() - timedelta(
+        seconds=settings.BACKGROUND_JOB_STALE_SECONDS
+    )
+    stale = {
+        "status": {
+            "$in": [
+                upload_schema.UploadStatuses.queued.value,
+                upload_schema.UploadStatuses.uploading.value,
+            ]
+        },
+        "updated_at": {"$lt": cutoff},
+    }
+
+    requeued = failed = 0
+    for document in db.upload_jobs.find(stale, {"_id": 1}):
+        # Claim the job first so a worker starting at the same time skips it
+        claimed = db.upload_jobs.find_one_and_update(
+            {**stale, "_id": document["_id"]},
+            {"$set": {"updated_at": datetime.utcnow()}},
+        )
+        if not claimed:
+            continue
+
+        job = upload_models.UploadJob(**claimed)
+        if job.spool_path and os.path.exists(job.spool_path):
+            _update_upload_job(
+                db, job.id, status=upload_schema.UploadStatuses.queued.value
+            )
+            background.submit(run_upload_job, db, job.id)
+            requeued += 1
+            continue
+
+        if job.kind == upload_schema.UploadKinds.resume.value:
+            resume_crud.fail_resume_upload(
+                db, user_id=str(job.user_id), resume_id=job.context["resume_id"]
+            )
+        _update_upload_job(
+            db,
+            job.id,
+            status=upload_schema.UploadStatuses.failed.value,
+            error="Upload interrupted by a server restart",
+            spool_path="",
+        )
+        failed += 1
+
+    if requeued or failed:
+        logger.info(
+            "✓ Recovered interrupted uploads: %d requeued, %d failed",
+            requeued,
+            failed,
+        )
+
+
+def job_to_read(job: upload_models.UploadJob) -> upload_schema.UploadJobRead:
+    """Convert an UploadJob model instance into the API response schema."""
+    return upload_schema.UploadJobRead(
+        id=str(job.id),
+        kind=job.kind,
+        status=job.status,
+        filename=job.filename,
+        size=job.size,
+        progress=job.progress,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
@@ -0,0 +1,33 @@
+from typing import Dict
+
+import app.database.session as session
+import app.ents.upload.crud as upload_crud
+import app.ents.upload.schema as upload_schema
+import app.ents.user.dependencies as user_dependencies
+from app.core.permissions import is_lead_or_admin
+from fastapi import APIRouter, Depends, HTTPException, status
+from pymongo.database import Database
+
+uploads_router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+@uploads_router.get("/{job_id}", response_model=Dict[str, upload_schema.UploadJobRead])
+def read_upload_job(
+    *,
+    db: Database = Depends(session.get_db),
+    job_id: str,
+    current_user=Depends(user_dependencies.get_current_user),
+) -> Dict[str, upload_schema.UploadJobRead]:
+    """
+    Poll the status of a background file upload.
+    Only the uploader, Leads and Admins can view a job.
+    """
+    job = upload_crud.read_upload_job(db, job_id=job_id)
+
+    if str(job.user_id) != str(current_user.id) and not is_lead_or_admin(current_user):
+        # Don't reveal that the job exists
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload job not found"
+        )
+
+    return {"job": upload_crud.job_to_read(job)}
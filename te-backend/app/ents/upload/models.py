@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from app.database.models import MongoModel, PyObjectId
+
+
+class UploadJob(MongoModel):
+    """MongoDB UploadJob document model for files uploaded in the background."""
+
+    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
+    user_id: PyObjectId
+    kind: str  # UploadKinds enum value
+    status: str = "queued"  # UploadStatuses enum value
+    filename: str
+    size: int = 0  # Bytes received from the client
+    sha256: str = ""  # Content hash computed while spooling
+    progress: float = 0.0  # Fraction of the file pushed to storage (0.0 - 1.0)
+    parent: str  # Storage folder the file is uploaded into
+    spool_path: str = ""  # Local copy of the file until the upload finishes
+    context: dict = {}  # Kind-specific data, e.g. the embedded resume id
+    result: Optional[dict] = None  # {"file_id": ..., "name": ..., "link": ...}
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
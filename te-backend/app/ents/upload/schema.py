@@ -0,0 +1,38 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UploadKinds(Enum):
+    resume = "resume"
+    lesson = "lesson"
+
+
+class UploadStatuses(Enum):
+    queued = "queued"
+    uploading = "uploading"
+    completed = "completed"
+    failed = "failed"
+
+
+class UploadResult(BaseModel):
+    file_id: str
+    name: str
+    link: str
+
+
+class UploadJobRead(BaseModel):
+    """Response model for upload job status."""
+
+    id: str
+    kind: str
+    status: str
+    filename: str
+    size: int = 0
+    progress: float = 0.0
+    result: Optional[UploadResult] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
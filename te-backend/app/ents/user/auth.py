@@ -43,8 +43,6 @@ from app.core.settings import settings
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
 from pymongo.database import Database
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
 from urllib.parse import urlencode
 
 # Professional auth router without prefix - will be mounted at /auth
@@ -68,7 +66,7 @@ def login_access_token(
 
     Note: Users must verify their email before they can log in.
     """
-    logger.info(f"Login attempt for user: {data.username}")
+    logger.info("Member login attempt")
 
     user = security.authenticate(db, email=data.username, password=data.password)
     if not user:
@@ -242,7 +240,7 @@ def management_login_access_token(
     - **token**: Secure token provided during account creation
     - Returns: Access token and user information
     """
-    logger.info(f"Management login attempt for user: {data.username}")
+    logger.info("Management login attempt")
 
     # Find user in privileged_users collection
     user_data = db.privileged_users.find_one({"username": data.username})
@@ -252,7 +250,6 @@ def management_login_access_token(
         )
 
     user = user_models.PrivilegedUser(**user_data)
-    print(user)
 
     # Only allow Volunteer (3), Lead (4), and Admin (5) to use this endpoint
     if user.role not in [
@@ -455,6 +452,8 @@ async def google_callback(code: str, db: Database = Depends(session.get_db)) ->
     try:
         # Exchange authorization code for tokens
         import requests
+        from google.auth.transport import requests as google_requests
+        from google.oauth2 import id_token
 
         token_url = "https://oauth2.googleapis.com/token"
         token_data = {
@@ -495,7 +494,7 @@ async def google_callback(code: str, db: Database = Depends(session.get_db)) ->
         last_name = idinfo.get("family_name", "")
         picture = idinfo.get("picture", "")
 
-        logger.info(f"Google user authenticated: {email}")
+        logger.info("Google user authenticated")
 
         if not email:
             raise HTTPException(
@@ -583,7 +582,7 @@ async def google_callback(code: str, db: Database = Depends(session.get_db)) ->
         frontend_url = settings.DOMAIN
         redirect_url = f"{frontend_url}/auth/callback?token={access_token}&user_id={user_id_str}&role={user.role}"
 
-        logger.info(f"Redirecting to: {redirect_url}")
+        logger.info("Redirecting to frontend after Google login")
         return RedirectResponse(url=redirect_url)
 
     except Exception as e:
@@ -1,4 +1,5 @@
 import random
+import re
 import string
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
@@ -8,6 +9,9 @@ from fastapi import HTTPException, status
 from pymongo.database import Database
 
 import app.core.security as security
+from app.core.pagination import paginate
+from app.database.projection import find_projected, id_str, map_array, value_or
+from app.database.repository import insert_model, update_model
 import app.ents.user.models as user_models
 import app.ents.user.schema as user_schema
 
@@ -66,24 +70,25 @@ def read_all_member_users(db: Database) -> list[user_models.MemberUser]:
     return [user_models.MemberUser(**user) for user in users_data]
 
 
+PRIVILEGED_USER_LIST_PROJECTION = {
+    "_id": 1,
+    "id": "$_id",
+    "full_name": value_or("$full_name", ""),
+    "email": value_or("$email", ""),
+    "username": value_or("$username"),
+    "role": value_or("$role"),
+    "is_active": value_or("$is_active", True),
+}
+
+
 def read_all_privileged_users(db: Database) -> list[dict]:
     """Read all privileged users from MongoDB (Admin only)"""
-    users_data = db.privileged_users.find({"is_active": True}).sort("full_name", 1)
-
-    result = []
-    for user in users_data:
-        result.append(
-            {
-                "id": str(user["_id"]),
-                "_id": str(user["_id"]),
-                "full_name": user.get("full_name", ""),
-                "email": user.get("email", ""),
-                "username": user.get("username"),
-                "role": user.get("role"),
-                "is_active": user.get("is_active", True),
-            }
-        )
-    return result
+    return find_projected(
+        db.privileged_users,
+        {"is_active": True},
+        PRIVILEGED_USER_LIST_PROJECTION,
+        sort=[("full_name", 1)],
+    )
 
 
 def read_users_by_base_role(
@@ -121,11 +126,7 @@ def create_user(
     user_dict["email_verified"] = False  # Start as unverified
 
     # Insert into MongoDB
-    result = db.member_users.insert_one(user_dict)
-
-    # Fetch and return the created user
-    user_data = db.member_users.find_one({"_id": result.inserted_id})
-    return user_models.MemberUser(**user_data)
+    return insert_model(db.member_users, user_dict, user_models.MemberUser)
 
 
 def create_lead_user(db: Database, *, data: user_schema.LeadCreate) -> dict:
@@ -149,11 +150,7 @@ def create_lead_user(db: Database, *, data: user_schema.LeadCreate) -> dict:
     }
 
     # Insert into privileged_users collection
-    result = db.privileged_users.insert_one(user_dict)
-
-    # Fetch the created user
-    user_data = db.privileged_users.find_one({"_id": result.inserted_id})
-    user = user_models.PrivilegedUser(**user_data)
+    user = insert_model(db.privileged_users, user_dict, user_models.PrivilegedUser)
 
     # Return user info with credentials
     return {
@@ -197,11 +194,7 @@ def create_referrer_user(db: Database, *, data: user_schema.ReferrerCreate) -> d
     }
 
     # Insert into privileged_users collection
-    result = db.privileged_users.insert_one(user_dict)
-
-    # Fetch the created user
-    user_data = db.privileged_users.find_one({"_id": result.inserted_id})
-    user = user_models.PrivilegedUser(**user_data)
+    user = insert_model(db.privileged_users, user_dict, user_models.PrivilegedUser)
 
     # Return user info with credentials
     return {
@@ -274,6 +267,85 @@ def add_user_cover_letter(
     return data.cover_letter
 
 
+# Files listing for the admin dashboard, shaped by the database. `_id` is
+# kept for the pagination cursor.
+_MEMBER_FILES_BASE_PROJECTION = {
+    "_id": 1,
+    "id": id_str("$_id"),
+    "full_name": value_or("$full_name", ""),
+    "email": value_or("$email", ""),
+}
+
+_RESUME_FILE_FIELDS = {
+    "id": value_or("$$resume.id", ""),  # UUID
+    "file_id": value_or("$$resume.file_id", ""),
+    "name": value_or("$$resume.name", ""),
+    "url": value_or("$$resume.link", ""),
+    "uploaded_at": value_or("$$resume.date", ""),
+    "role": value_or("$$resume.role", ""),
+}
+
+MEMBER_FILES_PROJECTION = {
+    **_MEMBER_FILES_BASE_PROJECTION,
+    "resumes": map_array(
+        "$resumes",
+        "resume",
+        {**_RESUME_FILE_FIELDS, "notes": value_or("$$resume.notes", "")},
+    ),
+    "referral_essay": value_or("$referral_essay", ""),
+    "cover_letter": value_or("$cover_letter", ""),
+}
+
+# Resume metadata and text lengths only; full text comes from read_member_files
+MEMBER_FILES_SUMMARY_PROJECTION = {
+    **_MEMBER_FILES_BASE_PROJECTION,
+    "resumes": map_array("$resumes", "resume", _RESUME_FILE_FIELDS),
+    "referral_essay_length": {"$strLenCP": value_or("$referral_essay", "")},
+    "cover_letter_length": {"$strLenCP": value_or("$cover_letter", "")},
+}
+
+MEMBER_FILES_PAGE_SORT = [("_id", 1)]
+
+
+def read_all_member_files(
+    db: Database,
+    *,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    search: Optional[str] = None,
+    summary: bool = False,
+) -> Tuple[list[dict], Optional[str]]:
+    """
+    Read a page of members' resumes, referral essays and cover letters,
+    optionally filtered by a case-insensitive search on name or email.
+    In summary mode essays and cover letters are reduced to their lengths.
+    """
+    query: dict = {"role": user_schema.UserRoles.member.value}
+    if search:
+        pattern = {"$regex": re.escape(search), "$options": "i"}
+        query["$or"] = [{"full_name": pattern}, {"email": pattern}]
+
+    page = paginate(
+        db.member_users,
+        query,
+        sort=MEMBER_FILES_PAGE_SORT,
+        limit=limit,
+        cursor=cursor,
+        projection=MEMBER_FILES_SUMMARY_PROJECTION
+        if summary
+        else MEMBER_FILES_PROJECTION,
+    )
+    return page.items, page.next_cursor
+
+
+def read_member_files(db: Database, *, user_id: str) -> Optional[dict]:
+    """Read one member's resumes and the full text of their essays."""
+    return db.member_users.find_one(
+        {"_id": ObjectId(user_id), "role": user_schema.UserRoles.member.value},
+        MEMBER_FILES_PROJECTION,
+    )
+
+
 def update_user_profile(
     db: Database, *, user_id: str, data: user_schema.MemberUserUpdate
 ) -> user_models.MemberUser:
@@ -287,17 +359,18 @@ def update_user_profile(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update"
         )
 
-    # Update the user
-    result = db.member_users.update_one(
-        {"_id": ObjectId(user_id)}, {"$set": update_data}
+    # Update the user and return the updated document
+    user = update_model(
+        db.member_users,
+        {"_id": ObjectId(user_id)},
+        {"$set": update_data},
+        user_models.MemberUser,
     )
 
-    if result.matched_count == 0:
+    if user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Fetch and return the updated user
-    user_data = db.member_users.find_one({"_id": ObjectId(user_id)})
-    return user_models.MemberUser(**user_data)
+    return user
 
 
 def update_privileged_user(
@@ -345,18 +418,17 @@ def update_privileged_user(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update"
         )
 
-    # Update the privileged user
-    result = db.privileged_users.update_one(
-        {"_id": ObjectId(user_id)}, {"$set": update_data}
+    # Update the privileged user and return the updated document
+    user = update_model(
+        db.privileged_users,
+        {"_id": ObjectId(user_id)},
+        {"$set": update_data},
+        user_models.PrivilegedUser,
     )
 
-    if result.matched_count == 0:
+    if user is None:
         raise HTTPException(status_code=404, detail="Privileged user not found")
 
-    # Fetch and return the updated user
-    user_data = db.privileged_users.find_one({"_id": ObjectId(user_id)})
-    user = user_models.PrivilegedUser(**user_data)
-
     return {
         "user_id": str(user.id),
         "username": user.username,
@@ -411,9 +483,9 @@ def create_password_reset_request(
         "expires_at": now + timedelta(minutes=PASSWORD_RESET_CODE_EXP_MINUTES),
     }
 
-    result = db.password_resets.insert_one(reset_data)
-    reset_doc = db.password_resets.find_one({"_id": result.inserted_id})
-    reset_model = user_models.PasswordReset(**reset_doc)
+    reset_model = insert_model(
+        db.password_resets, reset_data, user_models.PasswordReset
+    )
 
     token = security.generate_password_reset_token(
         email=email,
@@ -4,6 +4,8 @@ import app.core.security as security
 import app.database.session as session
 import app.ents.user.crud as user_crud
 import app.ents.user.models as user_models
+import app.ents.user.schema as user_schema
+from app.core import context
 from app.core.permissions import get_user_role
 from app.core.settings import settings
 from fastapi import Depends, HTTPException, status
@@ -18,6 +20,15 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
+def _record_role(user) -> None:
+    """Label the current request's metrics with the user's role."""
+    role = get_user_role(user)
+    try:
+        context.set_user_role(user_schema.UserRoles(role).name)
+    except ValueError:
+        context.set_user_role(str(role))
+
+
 def get_current_user(
     db: Database = Depends(session.get_db),
     token=Depends(reusable_oauth2),
@@ -43,6 +54,7 @@ def get_current_user(
     # First try to find in regular users collection
     user = user_crud.read_user_by_id(db, id=token_data.sub)
     if user:
+        _record_role(user)
         return user
 
     # If not found, try privileged_users collection
@@ -51,7 +63,9 @@ def get_current_user(
     if ObjectId.is_valid(token_data.sub):
         priv_user_data = db.privileged_users.find_one({"_id": ObjectId(token_data.sub)})
         if priv_user_data:
-            return user_models.PrivilegedUser(**priv_user_data)
+            user = user_models.PrivilegedUser(**priv_user_data)
+            _record_role(user)
+            return user
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
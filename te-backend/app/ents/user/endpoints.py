@@ -1,30 +1,18 @@
+import logging
 from typing import Any, Dict, Optional
 from bson import ObjectId
+import app.database.routing as routing
 import app.database.session as session
 import app.ents.user.crud as user_crud
 import app.ents.user.dependencies as user_dependencies
 import app.ents.user.models as user_models
 import app.ents.user.schema as user_schema
-from fastapi import APIRouter, Depends, HTTPException, status
+from app.core.responses import ORJSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pymongo.database import Database
 
 router = APIRouter(prefix="/users", tags=["Users"])
-
-
-def _serialize_mongo_document(value: Any) -> Any:
-    """Recursively convert MongoDB ObjectId instances to str for JSON serialization.
-
-    FastAPI/Pydantic cannot serialize raw ObjectId objects; leaving them causes
-    PydanticSerializationError. This helper walks dicts/lists and converts all
-    ObjectIds to their hex string representation.
-    """
-    if isinstance(value, ObjectId):
-        return str(value)
-    if isinstance(value, dict):
-        return {k: _serialize_mongo_document(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_serialize_mongo_document(v) for v in value]
-    return value
+logger = logging.getLogger(__name__)
 
 
 # ============= Privileged User Management (Admin Only) =============
@@ -45,7 +33,8 @@ def list_privileged_users(
     **Requires**: Lead (role=4) or Admin (role=5) access
     """
     users = user_crud.read_all_privileged_users(db)
-    return users
+    # ObjectIds are encoded by the response class
+    return ORJSONResponse(users)
 
 
 @router.post(
@@ -280,13 +269,11 @@ def get_user_by_role_query(
             detail="Must provide one of: referrer_id, volunteer_id, or lead_id",
         )
 
-    # Recursively serialize any nested ObjectIds (e.g., company_id)
-    user_data = _serialize_mongo_document(user_data)
-    # Ensure id field consistency
-    if "_id" in user_data:
-        user_data["id"] = user_data.get("id") or user_data["_id"]
-        user_data["_id"] = user_data["id"]
-    return {"user": user_data}
+    # Ensure id field consistency; nested ObjectIds (e.g., company_id) are
+    # encoded by the response class
+    user_data["id"] = user_data.get("id") or user_data["_id"]
+    user_data["_id"] = user_data["id"]
+    return ORJSONResponse({"user": user_data})
 
 
 # ============= Member User Management =============
@@ -354,7 +341,7 @@ def create_member_user(
     except Exception as e:
         # Log error but don't fail registration
         # User can request verification code later
-        print(f"Failed to send verification email: {e}")
+        logger.warning("Failed to send verification email: %s", e)
 
     return {"user": user_schema.MemberUserRead(**vars(new_user))}
 
@@ -612,19 +599,34 @@ def update_cover_letter(
 
 @router.get("/files/all", response_model=Dict[str, Any])
 def list_all_user_files(
-    db: Database = Depends(session.get_db),
+    db: Database = Depends(routing.get_analytics_db),
     *,
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor of the page to fetch (from next_cursor)"
+    ),
+    limit: int = Query(default=100, ge=1, le=500),
+    search: Optional[str] = Query(
+        None, description="Case-insensitive filter on member name or email"
+    ),
+    summary: bool = Query(
+        False,
+        description="Return resume metadata and essay/cover letter lengths only",
+    ),
     current_user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
 ) -> Any:
     """
-    Retrieve all members' files and essays (Lead/Admin dashboard).
+    Retrieve a page of members' files and essays (Lead/Admin dashboard).
 
     Returns aggregated view of:
     - All resumes (PDFs in Google Drive)
     - Referral essays (text)
     - Cover letters (text)
 
-    Uses MongoDB projection for efficient queries.
+    With `summary=true`, essays and cover letters are returned as
+    `referral_essay_length`/`cover_letter_length`; fetch the full text from
+    `/users/{user_id}/files`.
+
+    Documents are shaped by a MongoDB projection and encoded with orjson.
 
     **Requires**: Lead (role >= 4) or Admin (role >= 5) access
     """
@@ -633,40 +635,41 @@ def list_all_user_files(
     # Require at least Lead access
     require_lead(current_user)
 
-    # Use projection to fetch only needed fields from member_users
-    users_data = db.member_users.find(
-        {"role": user_schema.UserRoles.member.value},
-        {
-            "_id": 1,
-            "full_name": 1,
-            "email": 1,
-            "resumes": 1,
-            "referral_essay": 1,
-            "cover_letter": 1,
-        },
+    # Documents are shaped by the database; skip response-model validation
+    users_with_files, next_cursor = user_crud.read_all_member_files(
+        db, cursor=cursor, limit=limit, search=search, summary=summary
     )
+    return ORJSONResponse({"users": users_with_files, "next_cursor": next_cursor})
 
-    users_with_files = []
-    for user in users_data:
-        user_data = {
-            "id": str(user["_id"]),
-            "full_name": user.get("full_name", ""),
-            "email": user.get("email", ""),
-            "resumes": [
-                {
-                    "id": r.get("id", ""),  # UUID
-                    "file_id": r.get("file_id", ""),
-                    "name": r.get("name", ""),
-                    "url": r.get("link", ""),
-                    "uploaded_at": r.get("date", ""),
-                    "role": r.get("role", ""),
-                    "notes": r.get("notes", ""),
-                }
-                for r in user.get("resumes", [])
-            ],
-            "referral_essay": user.get("referral_essay", ""),
-            "cover_letter": user.get("cover_letter", ""),
-        }
-        users_with_files.append(user_data)
 
-    return {"users": users_with_files}
+@router.get("/{user_id}/files", response_model=Dict[str, Any])
+def get_user_files(
+    db: Database = Depends(session.get_db),
+    *,
+    user_id: str,
+    current_user: user_models.MemberUser = Depends(user_dependencies.get_current_user),
+) -> Any:
+    """
+    Retrieve one member's resumes, referral essay and cover letter in full.
+
+    **Authorization**:
+    - Members (role=1): Can only view their own files
+    - Leads/Admins: Can view any member's files
+    """
+    from app.core.permissions import require_lead
+
+    if str(current_user.id) != user_id:
+        require_lead(current_user)
+
+    if not ObjectId.is_valid(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+
+    user_files = user_crud.read_member_files(db, user_id=user_id)
+    if not user_files:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+
+    return ORJSONResponse({"user": user_files})
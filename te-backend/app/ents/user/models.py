@@ -1,45 +1,11 @@
 from datetime import datetime
-from typing import Optional, Any
-from pydantic import BaseModel, EmailStr, Field, GetJsonSchemaHandler
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import core_schema
-from bson import ObjectId
+from typing import Optional
+from pydantic import EmailStr, Field
 
+from app.database.models import MongoModel, PyObjectId
 
-# Custom type for MongoDB ObjectId compatible with Pydantic v2
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: Any
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema(
-                    [
-                        core_schema.str_schema(),
-                        core_schema.no_info_plain_validator_function(cls.validate),
-                    ]
-                ),
-            ]
-        )
 
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
-        raise ValueError("Invalid ObjectId")
-
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
-    ) -> JsonSchemaValue:
-        return {"type": "string"}
-
-
-class MemberUser(BaseModel):
+class MemberUser(MongoModel):
     """MongoDB MemberUser document model for Members (role=1)"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -67,13 +33,8 @@ class MemberUser(BaseModel):
     google_id: Optional[str] = None  # Google OAuth user ID
     oauth_provider: Optional[str] = None  # OAuth provider (e.g., "google")
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
 
-
-class PrivilegedUser(BaseModel):
+class PrivilegedUser(MongoModel):
     """MongoDB PrivilegedUser document model for Referrer/Lead/Admin (role>=2)"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -87,13 +48,8 @@ class PrivilegedUser(BaseModel):
     )
     is_active: bool = True
 
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-
 
-class PasswordReset(BaseModel):
+class PasswordReset(MongoModel):
     """MongoDB password reset request model."""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -108,8 +64,3 @@ class PasswordReset(BaseModel):
     completed_at: Optional[datetime] = None
     session_token_hash: Optional[str] = None
     session_expires_at: Optional[datetime] = None
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str, datetime: lambda v: v.isoformat()}
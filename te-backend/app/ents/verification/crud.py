@@ -7,6 +7,7 @@ from pymongo.database import Database
 from bson import ObjectId
 
 import app.ents.verification.models as verification_models
+from app.database.repository import insert_model
 
 
 def generate_verification_code() -> str:
@@ -68,11 +69,11 @@ def create_verification_code(
     }
 
     # Insert into MongoDB
-    result = db.email_verifications.insert_one(verification_data)
-
-    # Fetch and return the created verification
-    verification_doc = db.email_verifications.find_one({"_id": result.inserted_id})
-    return verification_models.EmailVerification(**verification_doc)
+    return insert_model(
+        db.email_verifications,
+        verification_data,
+        verification_models.EmailVerification,
+    )
 
 
 def verify_code(
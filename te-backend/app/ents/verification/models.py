@@ -1,45 +1,11 @@
-from typing import Optional, Any
+from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
-from pydantic.json_schema import JsonSchemaValue
-from pydantic_core import core_schema
-from bson import ObjectId
+from pydantic import EmailStr, Field
 
+from app.database.models import MongoModel, PyObjectId
 
-# Custom type for MongoDB ObjectId compatible with Pydantic v2
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_pydantic_core_schema__(
-        cls, source_type: Any, handler: Any
-    ) -> core_schema.CoreSchema:
-        return core_schema.union_schema(
-            [
-                core_schema.is_instance_schema(ObjectId),
-                core_schema.chain_schema(
-                    [
-                        core_schema.str_schema(),
-                        core_schema.no_info_plain_validator_function(cls.validate),
-                    ]
-                ),
-            ]
-        )
 
-    @classmethod
-    def validate(cls, v):
-        if isinstance(v, ObjectId):
-            return v
-        if isinstance(v, str) and ObjectId.is_valid(v):
-            return ObjectId(v)
-        raise ValueError("Invalid ObjectId")
-
-    @classmethod
-    def __get_pydantic_json_schema__(
-        cls, schema: core_schema.CoreSchema, handler: Any
-    ) -> JsonSchemaValue:
-        return {"type": "string"}
-
-
-class EmailVerification(BaseModel):
+class EmailVerification(MongoModel):
     """MongoDB EmailVerification document model for email verification codes"""
 
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -52,8 +18,3 @@ class EmailVerification(BaseModel):
     expires_at: datetime  # Expiration time (15 minutes from creation)
     is_used: bool = False  # Whether code has been used
     attempts: int = 0  # Number of failed verification attempts
-
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str, datetime: lambda v: v.isoformat()}
@@ -1,18 +1,31 @@
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.metrics import (
+    REGISTRY,
+    collect_threadpool_stats,
+    remove_snapshot,
+    render_snapshots,
+    write_snapshot,
+)
+from app.core.logs import configure_logging, stop_logging
+from app.core.middleware import REQUEST_ID_HEADER, RequestMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import ORJSONResponse
 from app.core.settings import settings
 from app.ents.api import api_router
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException as StarletteHTTPException
+import asyncio
 import logging
-import time
+import os
+import secrets
 from fastapi.middleware.gzip import GZipMiddleware
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Structured JSON logs, written off the request path
+configure_logging(settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +38,7 @@ def create_app():
         openapi_url=f"{settings.API_STR}/openapi.json",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
         openapi_tags=[
             {
                 "name": "Authentication",
@@ -64,7 +78,8 @@ def enable_cors(app):
             allow_credentials=True,
             allow_methods=["*"],  # Allow all methods including OPTIONS
             allow_headers=["*"],
-            expose_headers=["*"],
+            # Credentialed requests ignore "*", so list headers clients read
+            expose_headers=["*", NEXT_CURSOR_HEADER, REQUEST_ID_HEADER],
             max_age=3600,  # Cache preflight response for 1 hour
         )
 
@@ -75,36 +90,14 @@ enable_cors(app)
 # Enable gzip compression for large HTML (documentation) to speed up mobile loads
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-
-# Perform a MongoDB connectivity check on startup for observability
-@app.on_event("startup")
-async def verify_mongodb_connection():
-    try:
-        from app.database.session import client  # reuse existing client
-
-        client.admin.command("ping")
-        logger.info("MongoDB ping successful on startup")
-    except Exception as e:
-        logger.error(f"MongoDB ping failed on startup: {e}")
-
-
-# Middleware to handle OPTIONS requests before they hit authentication
-@app.middleware("http")
-async def options_handler(request: Request, call_next):
-    """Handle OPTIONS preflight requests directly to avoid authentication issues."""
-    if request.method == "OPTIONS":
-        return JSONResponse(
-            content={"status": "ok"},
-            status_code=200,
-            headers={
-                "Access-Control-Allow-Origin": request.headers.get("origin", "*"),
-                "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, PATCH, OPTIONS",
-                "Access-Control-Allow-Headers": "*",
-                "Access-Control-Allow-Credentials": "true",
-                "Access-Control-Max-Age": "3600",
-            },
-        )
-    return await call_next(request)
+# Outermost: request timing/metrics/logging, security headers and non-CORS OPTIONS
+app.add_middleware(
+    RequestMiddleware,
+    cors_enabled=bool(settings.BACKEND_CORS_ORIGINS),
+    debug=settings.DEBUG,
+    success_sample_rate=settings.LOG_SUCCESS_SAMPLE_RATE,
+    slow_request_ms=settings.LOG_SLOW_REQUEST_MS,
+)
 
 
 app.include_router(api_router, prefix=settings.API_STR)
@@ -123,14 +116,62 @@ async def health_check():
     return {"status": "healthy", "service": "te-backend", "version": "1.0.0"}
 
 
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics(request: Request):
+    """
+    Process metrics in the Prometheus text format: request latency by route,
+    MongoDB command timings, thread pool saturation and bcrypt load.
+
+    Only for scrapers holding METRICS_TOKEN (routes, roles and DB timings are
+    internal); without the setting the endpoint does not exist.
+    """
+    token = settings.METRICS_TOKEN.get_secret_value() if settings.METRICS_TOKEN else ""
+    if not token:
+        raise StarletteHTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    authorization = request.headers.get("authorization", "")
+    if not secrets.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+        raise StarletteHTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    collect_threadpool_stats()
+    if settings.METRICS_MULTIPROC_DIR:
+        body = await run_in_threadpool(render_snapshots, settings.METRICS_MULTIPROC_DIR)
+    else:
+        body = REGISTRY.render()
+    return PlainTextResponse(body, media_type=METRICS_CONTENT_TYPE)
+
+
+async def publish_metrics(directory: str) -> None:
+    """Keep this worker's metrics snapshot fresh for whichever worker is scraped."""
+    while True:
+        try:
+            collect_threadpool_stats()  # Needs the event loop, so sampled here
+            await run_in_threadpool(write_snapshot, directory)
+        except Exception as e:
+            logger.warning(f"Could not publish metrics: {e}")
+        await asyncio.sleep(settings.METRICS_PUBLISH_SECONDS)
+
+
+@app.on_event("startup")
+async def start_metrics_publisher():
+    if settings.METRICS_MULTIPROC_DIR:
+        app.state.metrics_publisher = asyncio.create_task(
+            publish_metrics(settings.METRICS_MULTIPROC_DIR)
+        )
+
+
 @app.get("/debug/db", tags=["Health"])
 async def debug_database():
     """
     Database diagnostic endpoint - helps debug MongoDB connection issues
     Returns collection counts and connection status
     """
-    from app.database.session import mongodb
+    from app.database.routing import Workload, route
+    from app.database.session import get_database
 
+    mongodb = route(get_database(), Workload.analytics)
     try:
         # Test connection
         mongodb.command("ping")
@@ -175,56 +216,63 @@ async def debug_database():
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions with consistent JSON response"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
+        headers=exc.headers,  # e.g. WWW-Authenticate on 401s
     )
 
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with detailed error messages"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": exc.errors(), "body": exc.body},
     )
 
 
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests with timing information"""
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
+def prepare_database(mongodb) -> None:
+    """Apply indexes and data migrations, then seed the bootstrap admin."""
+    from app.database.init_db import init_db
+    from app.database.migrations import ensure_indexes, run_migrations
 
-    logger.info(
-        f"{request.method} {request.url.path} "
-        f"completed in {process_time:.4f}s with status {response.status_code}"
-    )
-    return response
-
-
-# Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Add security headers to all responses"""
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Strict-Transport-Security"] = (
-        "max-age=31536000; includeSubDomains"
-    )
-    return response
+    # Indexes first: the unique username index keeps concurrent workers from
+    # each seeding their own admin
+    try:
+        ensure_indexes(mongodb)
+        run_migrations(mongodb)
+        logger.info("✓ Indexes and migrations applied")
+    except Exception as e:
+        logger.warning(f"Could not apply indexes and migrations: {e}")
+
+    try:
+        init_db(mongodb)
+        logger.info("✓ Initial data seeded successfully")
+    except Exception as e:
+        logger.warning(f"Could not seed initial data: {e}")
+
+    # Background jobs of processes that stopped before finishing them
+    import app.ents.export.crud as export_crud
+    import app.ents.upload.crud as upload_crud
+
+    try:
+        upload_crud.recover_upload_jobs(mongodb)
+        failed = export_crud.fail_interrupted_export_jobs(mongodb)
+        if failed:
+            logger.info("✓ Failed %d interrupted exports", failed)
+    except Exception as e:
+        logger.warning(f"Could not recover background jobs: {e}")
 
 
 @app.on_event("startup")
 def on_startup():
-    """Initialize MongoDB connection and seed initial data"""
-    from app.database.session import mongodb
+    """Check the MongoDB connection and prepare the database"""
+    from app.database.session import get_database
+
+    mongodb = get_database()
 
-    # Test MongoDB connection
+    # Test MongoDB connection (the only startup ping)
     try:
         mongodb.command("ping")
         logger.info("✓ MongoDB connection successful")
@@ -233,20 +281,24 @@ def on_startup():
         logger.error(f"✗ MongoDB connection failed: {e}")
         return
 
-    # Seed initial data
-    from app.database.init_db import init_db
-
-    try:
-        init_db(mongodb)
-        logger.info("✓ Initial data seeded successfully")
-    except Exception as e:
-        logger.warning(f"Could not seed initial data: {e}")
+    # Before serving: company-keyed reads and keyset pages rely on the
+    # indexes and the company_id backfill
+    prepare_database(mongodb)
 
 
 @app.on_event("shutdown")
 def on_shutdown():
-    """Close MongoDB connection"""
-    from app.database.session import client
-
-    client.close()
+    """Stop publishing metrics, finish background jobs, close MongoDB"""
+    import app.core.background as background
+    from app.database.session import close_client
+
+    publisher = getattr(app.state, "metrics_publisher", None)
+    if publisher is not None:
+        publisher.cancel()
+        remove_snapshot(settings.METRICS_MULTIPROC_DIR, os.getpid())
+
+    # Running uploads/exports still write their outcome through the client
+    background.shutdown(wait=True)
+    close_client()
     logger.info("✓ MongoDB connection closed")
+    stop_logging()
@@ -2,9 +2,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import emails
 from app.core.settings import settings
-from emails.template import JinjaTemplate
 
 
 def send_email(
@@ -15,6 +13,10 @@ def send_email(
 ) -> None:
     assert settings.EMAILS_ENABLED, "no provided configuration for email variables"
 
+    # Imported here: the emails package is slow to import and rarely needed
+    import emails
+    from emails.template import JinjaTemplate
+
     message = emails.Message(
         subject=JinjaTemplate(subject_template),
         html=JinjaTemplate(html_template),
@@ -0,0 +1,139 @@
+"""
+Import-time budget.
+
+Imports the app in a fresh interpreter with `python -X importtime`, which is
+what every worker pays before it can serve its first request, and reports the
+total and the slowest imports:
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --budget-ms 900 --top 15
+
+Exits non-zero when the total exceeds `--budget-ms` or when a module that
+should only load on first use (Google clients, email) is imported eagerly.
+Run it from te-backend/. Nothing connects to MongoDB: the client is created
+on first use.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+from benchmarks.run import DEFAULT_DB_NAME, DEFAULT_MONGODB_URI, SETTINGS_DEFAULTS
+
+# Only needed by file storage, exports, Google sign-in and email
+LAZY_MODULES = ("googleapiclient", "google.oauth2", "google.auth", "emails")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class Import:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse(stderr: str) -> list[Import]:
+    """Entries of an `-X importtime` report, in the order they were printed."""
+    imports = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append(
+                Import(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return imports
+
+
+def measure(target: str) -> list[Import]:
+    env = dict(os.environ)
+    for name, value in SETTINGS_DEFAULTS.items():
+        env.setdefault(name, value)
+    env.setdefault("MONGODB_URI", DEFAULT_MONGODB_URI)
+    env.setdefault("MONGODB_DB_NAME", DEFAULT_DB_NAME)
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode:
+        errors = [
+            line
+            for line in completed.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        sys.exit(f"Importing {target} failed:\n" + "\n".join(errors))
+    return parse(completed.stderr)
+
+
+def eager_lazy_modules(imports: list[Import]) -> list[str]:
+    return sorted(
+        entry.module
+        for entry in imports
+        if any(
+            entry.module == name or entry.module.startswith(name + ".")
+            for name in LAZY_MODULES
+        )
+    )
+
+
+def print_report(imports: list[Import], target: str, top: int) -> None:
+    total_ms = sum(entry.self_us for entry in imports) / 1000
+    print(f"import {target}: {total_ms:.1f} ms, {len(imports)} modules\n")
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    slowest = sorted(imports, key=lambda entry: entry.cumulative_us, reverse=True)
+    for entry in slowest[:top]:
+        print(
+            f"{entry.cumulative_us / 1000:>14.1f}  {entry.self_us / 1000:>8.1f}  "
+            f"{'  ' * entry.depth}{entry.module}"
+        )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", default="app.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=25, help="Slowest imports shown")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="Exit non-zero if the total import time exceeds this",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Imports to measure; the fastest is reported (the first warms caches)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+
+    runs = [measure(args.target) for _ in range(max(1, args.runs))]
+    imports = min(runs, key=lambda run: sum(entry.self_us for entry in run))
+    print_report(imports, args.target, args.top)
+
+    failed = False
+    eager = eager_lazy_modules(imports)
+    if eager:
+        print("\nImported eagerly (should load on first use):\n  " + "\n  ".join(eager))
+        failed = True
+
+    total_ms = sum(entry.self_us for entry in imports) / 1000
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nOver budget: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
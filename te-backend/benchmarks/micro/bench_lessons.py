@@ -0,0 +1,32 @@
+"""
+Lesson listings: `LessonRead` validated straight from the document, compared
+with the older route through the `Lesson` document model.
+"""
+
+import pytest
+
+import app.ents.learning.models as learning_models
+import app.ents.learning.schema as learning_schema
+
+LIST_SIZES = (10, 100, 1000)
+
+
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_lesson_read_from_document(benchmark, make_lessons, size):
+    documents = make_lessons(size)
+    benchmark(
+        lambda: [learning_schema.LessonRead.model_validate(doc) for doc in documents]
+    )
+
+
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_lesson_read_via_model(benchmark, make_lessons, size):
+    documents = make_lessons(size)
+
+    def read():
+        return [
+            learning_schema.LessonRead(**learning_models.Lesson(**doc).model_dump())
+            for doc in documents
+        ]
+
+    benchmark(read)
@@ -0,0 +1,40 @@
+"""
+Member documents: every authenticated member request validates one, and the
+embedded applications array grows with the member's history.
+"""
+
+import pytest
+
+import app.ents.application.dependencies as application_dependencies
+import app.ents.application.models as application_models
+import app.ents.user.models as user_models
+import app.ents.user.schema as user_schema
+
+APPLICATION_COUNTS = (0, 10, 100, 500)
+
+
+@pytest.mark.parametrize("applications", APPLICATION_COUNTS)
+def bench_member_user_from_document(benchmark, make_member, applications):
+    document = make_member(applications)
+    benchmark(lambda: user_models.MemberUser(**document))
+
+
+@pytest.mark.parametrize("applications", APPLICATION_COUNTS)
+def bench_member_user_read(benchmark, make_member, applications):
+    user = user_models.MemberUser(**make_member(applications))
+    benchmark(lambda: user_schema.MemberUserRead(**vars(user)))
+
+
+@pytest.mark.parametrize("applications", APPLICATION_COUNTS)
+def bench_applications_read(benchmark, make_member, applications):
+    document = make_member(applications)
+
+    def read():
+        return [
+            application_dependencies.parse_application(
+                application_models.Application(**application)
+            )
+            for application in document["applications"]
+        ]
+
+    benchmark(read)
@@ -0,0 +1,45 @@
+"""
+Referral listings: documents become `Referral` models, then read schemas.
+The lead view validates documents straight into its read schema and joins
+each referral's member name and email.
+"""
+
+import mongomock
+import pytest
+
+import app.ents.referral.dependencies as referral_dependencies
+import app.ents.referral.models as referral_models
+
+LIST_SIZES = (10, 100, 1000)
+
+
+@pytest.fixture(scope="module")
+def db():
+    # The member lookup in parse_referrals_with_users runs against mongomock,
+    # so that benchmark includes a small, fixed query cost
+    return mongomock.MongoClient().te_benchmark
+
+
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_referral_from_document(benchmark, make_referrals, size):
+    documents = make_referrals(size)
+    benchmark(lambda: [referral_models.Referral(**doc) for doc in documents])
+
+
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_referral_read(benchmark, make_referrals, size):
+    referrals = [referral_models.Referral(**doc) for doc in make_referrals(size)]
+    benchmark(lambda: [referral_dependencies.parse_referral(r) for r in referrals])
+
+
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_referral_read_with_user(benchmark, db, make_referrals, size):
+    documents = make_referrals(size)
+    db.member_users.delete_many({})
+    db.member_users.insert_many(
+        [
+            {"_id": user_id, "full_name": "Ama Mensah", "email": "ama@example.com"}
+            for user_id in {doc["user_id"] for doc in documents}
+        ]
+    )
+    benchmark(lambda: referral_dependencies.parse_referrals_with_users(db, documents))
@@ -0,0 +1,54 @@
+"""
+Response encoding: raw MongoDB documents and pydantic models through the
+orjson response encoder, compared with FastAPI's `jsonable_encoder` walk
+(what responses went through before the orjson default).
+"""
+
+import json
+
+import pytest
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+import app.ents.referral.dependencies as referral_dependencies
+import app.ents.referral.models as referral_models
+from app.core.responses import dumps
+
+LIST_SIZES = (10, 100, 1000)
+APPLICATION_COUNTS = (0, 100, 500)
+
+
+def _jsonable_dumps(content) -> bytes:
+    encoded = jsonable_encoder(content, custom_encoder={ObjectId: str})
+    return json.dumps(encoded).encode()
+
+
+ENCODERS = pytest.mark.parametrize(
+    "encoder", [dumps, _jsonable_dumps], ids=["orjson", "jsonable"]
+)
+
+
+@ENCODERS
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_encode_referral_documents(benchmark, make_referrals, size, encoder):
+    content = {"referrals": make_referrals(size)}
+    benchmark(encoder, content)
+
+
+@ENCODERS
+@pytest.mark.parametrize("size", LIST_SIZES)
+def bench_encode_referral_models(benchmark, make_referrals, size, encoder):
+    content = {
+        "referrals": [
+            referral_dependencies.parse_referral(referral_models.Referral(**doc))
+            for doc in make_referrals(size)
+        ]
+    }
+    benchmark(encoder, content)
+
+
+@ENCODERS
+@pytest.mark.parametrize("applications", APPLICATION_COUNTS)
+def bench_encode_member_document(benchmark, make_member, applications, encoder):
+    content = {"user": make_member(applications)}
+    benchmark(encoder, content)
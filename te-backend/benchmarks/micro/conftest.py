@@ -0,0 +1,71 @@
+"""
+Payload builders for the microbenchmarks.
+
+Documents come from the benchmark seed generators, so they have the same
+shape as the data the load tests run against. Sizes are the knob each
+benchmark is parametrized over.
+"""
+
+import os
+import random
+
+import pytest
+from bson import ObjectId
+
+from benchmarks.run import SETTINGS_DEFAULTS
+
+# Some model modules import the settings through their crud helpers
+for name, value in {
+    **SETTINGS_DEFAULTS,
+    "MONGODB_URI": "mongodb://localhost:27017",
+    "MONGODB_DB_NAME": "te_benchmark",
+}.items():
+    os.environ.setdefault(name, value)
+
+from benchmarks import seed  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def rng() -> random.Random:
+    return random.Random(0)
+
+
+@pytest.fixture(scope="session")
+def companies(rng) -> list[dict]:
+    return seed.company_documents(rng, 50)
+
+
+@pytest.fixture(scope="session")
+def make_member(rng, companies):
+    def make(applications: int) -> dict:
+        member = next(seed.member_documents(rng, 1, companies, "hashed-password"))
+        member["applications"] = [
+            seed.application_document(rng, companies) for _ in range(applications)
+        ]
+        return member
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_referrals(rng, companies, make_member):
+    members = [make_member(0) for _ in range(100)]
+
+    def make(count: int) -> list[dict]:
+        return [
+            {"_id": ObjectId(), **referral}
+            for referral in seed.referral_documents(rng, count, members, companies)
+        ]
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_lessons(rng):
+    def make(count: int) -> list[dict]:
+        return [
+            {"_id": ObjectId(), **lesson}
+            for lesson in seed.lesson_documents(rng, count)
+        ]
+
+    return make
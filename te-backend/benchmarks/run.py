@@ -0,0 +1,449 @@
+"""
+Benchmark runner.
+
+Seeds a benchmark database (see `benchmarks.seed`), drives the hot API
+endpoints in-process through an ASGI client and reports p50/p95/p99 latency
+and MongoDB queries per request for each scenario. Results can be written to
+a JSON file and compared with an earlier run:
+
+    python -m benchmarks.run --output benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+
+Run it from te-backend/. Query counts come from the `X-DB-Queries` header the
+app adds in DEBUG mode, so they are only available against a real MongoDB;
+`--backend mongomock` runs everything in memory without them.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+DEFAULT_MONGODB_URI = "mongodb://localhost:27017"
+DEFAULT_DB_NAME = "te_benchmark"
+
+# Settings the app requires. Anything already set in the environment wins.
+SETTINGS_DEFAULTS = {
+    "API_STR": "/v1",
+    "PROJECT_NAME": "TechElevate Benchmark",
+    "SERVER_HOST": "http://localhost",
+    "DOMAIN": "localhost",
+    "SECRET_KEY": "benchmark-secret-key",
+    "AUTHJWT_SECRET_KEY": "benchmark-secret-key",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "EMAILS_ENABLED": "false",
+    "EMAILS_FROM_NAME": "TechElevate",
+    "EMAILS_FROM_EMAIL": "noreply@bench.example.com",
+    "GDRIVE_RESUMES": "benchmark",
+    "GDRIVE_OTHER_FILES": "benchmark",
+    "GDRIVE_LESSONS": "benchmark",
+    "FILE_STORAGE_BACKEND": "local",
+    "LOG_LEVEL": "WARNING",
+}
+
+MEMBER_SAMPLE_SIZE = 200  # Members the member scenarios rotate through
+
+
+@dataclass
+class Fixtures:
+    """Accounts the scenarios act as, with pre-issued access tokens."""
+
+    members: list[dict]  # {"id", "email", "token"}
+    lead_token: str
+    volunteer_id: str
+    volunteer_token: str
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Returns (method, path, json body, bearer token) for one request
+    build: Callable[[Fixtures, random.Random], tuple]
+    max_requests: Optional[int] = None  # Cap for expensive endpoints
+    expected_status: int = 200
+    backends: tuple = ("mongodb", "mongomock")  # Backends that can serve it
+
+
+@dataclass
+class ScenarioResult:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+
+def _member_request(method: str, path: str) -> Callable:
+    def build(fixtures: Fixtures, rng: random.Random) -> tuple:
+        member = rng.choice(fixtures.members)
+        return method, path.format(user_id=member["id"]), None, member["token"]
+
+    return build
+
+
+def _lead_request(path: str) -> Callable:
+    return lambda fixtures, rng: ("GET", path, None, fixtures.lead_token)
+
+
+def _login(fixtures: Fixtures, rng: random.Random) -> tuple:
+    from benchmarks.seed import BENCH_PASSWORD
+
+    member = rng.choice(fixtures.members)
+    body = {"username": member["email"], "password": BENCH_PASSWORD}
+    return "POST", "/auth/login", body, None
+
+
+def _volunteer_assignments(fixtures: Fixtures, rng: random.Random) -> tuple:
+    path = f"/resumes/reviews/assignments?user_id={fixtures.volunteer_id}"
+    return "GET", path, None, fixtures.volunteer_token
+
+
+SCENARIOS = [
+    # bcrypt dominates; a handful of logins is enough to see it
+    Scenario("auth.login", _login, max_requests=50),
+    Scenario("users.read_self", _member_request("GET", "/users/{user_id}")),
+    Scenario(
+        "referrals.member", _member_request("GET", "/referrals?user_id={user_id}")
+    ),
+    Scenario("referrals.lead_page", _lead_request("/referrals")),
+    Scenario(
+        "applications.member",
+        _member_request("GET", "/users/{user_id}/applications"),
+    ),
+    Scenario("applications.all", _lead_request("/applications"), max_requests=20),
+    Scenario("learning.progress", _member_request("GET", "/learning/progress")),
+    Scenario(
+        "learning.statistics",
+        _lead_request("/learning/admin/statistics"),
+        max_requests=20,
+    ),
+    Scenario("reviews.requests", _lead_request("/resumes/reviews")),
+    Scenario("reviews.assignments", _volunteer_assignments),
+    Scenario(
+        "users.files_summary",
+        _lead_request("/users/files/all?summary=true"),
+        backends=("mongodb",),  # mongomock has no $strLenCP
+    ),
+]
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """Point the app at the benchmark database. Must run before importing `app`."""
+    if "bench" not in args.db_name:
+        sys.exit(
+            f"Refusing to use database {args.db_name!r}: name must contain 'bench'"
+        )
+
+    for name, value in SETTINGS_DEFAULTS.items():
+        os.environ.setdefault(name, value)
+    os.environ["MONGODB_URI"] = args.mongodb_uri
+    os.environ["MONGODB_DB_NAME"] = args.db_name
+    os.environ["DEBUG"] = "true"  # Adds the X-DB-Queries header
+
+    if args.backend == "mongomock":
+        import mongomock
+        import pymongo
+
+        # app.database.session creates its client from pymongo.MongoClient
+        pymongo.MongoClient = mongomock.MongoClient
+
+
+def load_fixtures(db, *, random_seed: int) -> Fixtures:
+    from app.core.security import create_access_token
+    from benchmarks.seed import LEAD_USERNAME, VOLUNTEER_USERNAME, member_email
+
+    rng = random.Random(random_seed)
+    total = db.member_users.count_documents({})
+    if not total:
+        sys.exit("The benchmark database is empty; run without --no-seed first")
+    indexes = rng.sample(range(total), min(MEMBER_SAMPLE_SIZE, total))
+    members = [
+        {
+            "id": str(member["_id"]),
+            "email": member["email"],
+            "token": create_access_token(member["_id"]),
+        }
+        for member in db.member_users.find(
+            {"email": {"$in": [member_email(index) for index in indexes]}},
+            {"email": 1},
+        )
+    ]
+
+    lead = db.privileged_users.find_one({"username": LEAD_USERNAME})
+    volunteer = db.privileged_users.find_one({"username": VOLUNTEER_USERNAME})
+    return Fixtures(
+        members=members,
+        lead_token=create_access_token(lead["_id"]),
+        volunteer_id=str(volunteer["_id"]),
+        volunteer_token=create_access_token(volunteer["_id"]),
+    )
+
+
+async def run_scenario(
+    client,
+    scenario: Scenario,
+    fixtures: Fixtures,
+    *,
+    requests: int,
+    warmup: int,
+    concurrency: int,
+    rng: random.Random,
+) -> ScenarioResult:
+    result = ScenarioResult()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(record: bool) -> None:
+        method, path, body, token = scenario.build(fixtures, rng)
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        async with semaphore:
+            start_time = time.perf_counter()
+            response = await client.request(method, path, json=body, headers=headers)
+            latency = time.perf_counter() - start_time
+        if not record:
+            return
+        if response.status_code != scenario.expected_status:
+            result.errors += 1
+        result.latencies.append(latency)
+        if "x-db-queries" in response.headers:
+            result.queries.append(int(response.headers["x-db-queries"]))
+
+    for _ in range(warmup):
+        await send(record=False)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(send(record=True) for _ in range(requests)))
+    result.elapsed = time.perf_counter() - start_time
+    return result
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(result: ScenarioResult, *, count_queries: bool) -> dict[str, Any]:
+    latencies = sorted(result.latencies)
+    summary = {
+        "requests": len(latencies),
+        "errors": result.errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+        "throughput_rps": round(len(latencies) / result.elapsed, 1),
+        "queries_per_request": None,
+    }
+    if count_queries and result.queries:
+        summary["queries_per_request"] = round(
+            sum(result.queries) / len(result.queries), 2
+        )
+    return summary
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: dict, baseline: Optional[dict]) -> None:
+    baseline_scenarios = (baseline or {}).get("scenarios", {})
+    header = f"{'scenario':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    header += f"{'rps':>9}{'queries':>9}{'errors':>8}"
+    if baseline:
+        header += f"{'p50 Δ':>10}{'p95 Δ':>10}"
+    print(header)
+
+    for name, summary in results["scenarios"].items():
+        queries = summary["queries_per_request"]
+        line = (
+            f"{name:<24}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}"
+            f"{summary['p99_ms']:>10.2f}{summary['throughput_rps']:>9.1f}"
+            f"{'-' if queries is None else queries:>9}{summary['errors']:>8}"
+        )
+        previous = baseline_scenarios.get(name)
+        if previous:
+            for key in ("p50_ms", "p95_ms"):
+                change = _relative_change(previous[key], summary[key])
+                line += f"{change:>+9.1f}%" if change is not None else f"{'-':>10}"
+        print(line)
+
+
+def _relative_change(before: float, after: float) -> Optional[float]:
+    return (after - before) / before * 100 if before else None
+
+
+def regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Scenarios whose p95 grew by more than `threshold` percent."""
+    slower = []
+    for name, summary in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous or summary["errors"]:
+            continue
+        change = _relative_change(previous["p95_ms"], summary["p95_ms"])
+        if change is not None and change > threshold:
+            slower.append(f"{name}: p95 {previous['p95_ms']} -> {summary['p95_ms']} ms")
+    return slower
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.core.settings import settings
+    from app.database.session import get_database
+    from app.main import app
+    from benchmarks.seed import seed
+
+    mongodb = get_database()
+    if not args.no_seed:
+        started = time.perf_counter()
+        counts = seed(mongodb, scale=args.scale, random_seed=args.seed)
+        print(f"Seeded {counts} in {time.perf_counter() - started:.1f}s")
+
+    fixtures = load_fixtures(mongodb, random_seed=args.seed)
+    selected = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.scenario or scenario.name in args.scenario
+    ]
+    unsupported = [
+        scenario.name for scenario in selected if args.backend not in scenario.backends
+    ]
+    if unsupported:
+        print(f"Skipping on {args.backend}: {', '.join(unsupported)}")
+    selected = [scenario for scenario in selected if args.backend in scenario.backends]
+    rng = random.Random(args.seed)
+    scenarios = {}
+
+    # The lifespan runs the startup hooks: indexes, migrations, admin seed
+    async with app.router.lifespan_context(app):
+        # Unhandled errors still produce a 500 response and count as errors
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url=f"http://bench{settings.API_STR}"
+        ) as client:
+            for scenario in selected:
+                requests = min(args.requests, scenario.max_requests or args.requests)
+                result = await run_scenario(
+                    client,
+                    scenario,
+                    fixtures,
+                    requests=requests,
+                    warmup=min(args.warmup, requests),
+                    concurrency=args.concurrency,
+                    rng=rng,
+                )
+                scenarios[scenario.name] = summarize(
+                    result, count_queries=args.backend == "mongodb"
+                )
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "scale": args.scale,
+            "seed": args.seed,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--backend", choices=("mongodb", "mongomock"), default="mongodb"
+    )
+    parser.add_argument(
+        "--mongodb-uri",
+        default=os.environ.get("BENCH_MONGODB_URI", DEFAULT_MONGODB_URI),
+    )
+    parser.add_argument("--db-name", default=DEFAULT_DB_NAME)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplier for the seeded volumes"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Reuse the data of an earlier run"
+    )
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--scenario", action="append", help="Only run this scenario (repeatable)"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline results JSON to compare with")
+    parser.add_argument(
+        "--fail-on-regression",
+        type=float,
+        metavar="PCT",
+        help="Exit non-zero if a p95 grew by more than PCT percent over --compare",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    configure_environment(args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results = asyncio.run(run(args))
+    print_report(results, baseline)
+
+    # Latencies of failed requests say nothing about the endpoint: such
+    # scenarios fail the run and are never saved as a baseline
+    scenarios = results["scenarios"]
+    failed = [name for name, summary in scenarios.items() if summary["errors"]]
+    if args.output:
+        saved = {
+            **results,
+            "scenarios": {
+                name: summary
+                for name, summary in scenarios.items()
+                if name not in failed
+            },
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(saved, output_file, indent=2)
+            output_file.write("\n")
+
+    status = 0
+    if failed:
+        print("Scenarios with errors (not saved):\n  " + "\n  ".join(failed))
+        status = 1
+    if baseline and args.fail_on_regression is not None:
+        slower = regressions(results, baseline, args.fail_on_regression)
+        if slower:
+            print("Regressions:\n  " + "\n  ".join(slower))
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
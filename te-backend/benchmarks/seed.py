@@ -0,0 +1,389 @@
+"""
+Deterministic benchmark data.
+
+`seed` fills a database with production-like volumes: members with embedded
+applications and resumes, companies, referrals, learning progress, lessons
+and resume reviews, plus the privileged accounts the scenarios run as.
+The same `random_seed` always produces the same documents (ObjectIds aside).
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Iterator
+from uuid import UUID
+
+from bson import ObjectId
+from pymongo.database import Database
+
+from app.core.security import get_password_hash
+from app.ents.application.schema import ApplicationStatuses
+from app.ents.referral.crud import REFERRAL_DATE_FORMAT
+from app.ents.referral.schema import JobRoles, ReferralStatuses
+from app.ents.user.schema import UserRoles
+
+# Volumes at scale 1.0
+VOLUMES = {
+    "members": 10_000,
+    "companies": 300,
+    "referrals": 50_000,
+    "lessons": 400,
+    "reviews": 5_000,
+    "volunteers": 20,
+}
+PROGRESS_RATIO = 0.6  # Share of members with a learning progress document
+MAX_APPLICATIONS = 40
+MAX_RESUMES = 4
+
+BENCH_PASSWORD = "benchmark-password"
+LEAD_USERNAME = "bench-lead"
+VOLUNTEER_USERNAME = "bench-volunteer-00"
+
+COLLECTIONS = (
+    "member_users",
+    "privileged_users",
+    "companies",
+    "referrals",
+    "lessons",
+    "user_progress",
+    "resume_reviews",
+    "cache_versions",
+)
+
+CATEGORIES = {
+    "Arrays & Strings": ["Two Pointers", "Sliding Window", "Prefix Sums", "Hashing"],
+    "Linked Lists": ["Fast & Slow Pointers", "Reversal", "Merging"],
+    "Trees": ["Traversals", "Binary Search Trees", "Lowest Common Ancestor"],
+    "Graphs": ["BFS", "DFS", "Topological Sort", "Shortest Paths", "Union Find"],
+    "Recursion": ["Backtracking", "Divide & Conquer", "Memoization"],
+    "Dynamic Programming": ["1D DP", "2D DP", "Knapsack", "Intervals"],
+    "Heaps": ["Top K", "Two Heaps", "K-way Merge"],
+    "System Design": ["Caching", "Sharding", "Queues", "Rate Limiting"],
+}
+TOPIC_KEYS = [
+    f"{category}::{topic}"
+    for category, topics in CATEGORIES.items()
+    for topic in topics
+]
+
+FIRST_NAMES = ["Ama", "Kofi", "Esi", "Kwame", "Yaa", "Kojo", "Akua", "Yaw", "Abena"]
+LAST_NAMES = ["Mensah", "Owusu", "Boateng", "Asante", "Osei", "Appiah", "Addo"]
+UNIVERSITIES = ["KNUST", "University of Ghana", "Ashesi", "UCC", "UMaT"]
+JOB_TITLES = ["Software Engineer", "Data Engineer", "SRE", "ML Engineer", "Analyst"]
+COUNTRIES = {"Ghana": ["Accra", "Kumasi"], "USA": ["Seattle", "New York", "Austin"]}
+WORDS = (
+    "impact scale team project build design data users latency reliable system "
+    "growth learn mentor ship ownership customer problem solution measure"
+).split()
+
+BASE_DATE = datetime(2025, 1, 1)
+
+
+def member_email(index: int) -> str:
+    return f"member{index:05d}@bench.example.com"
+
+
+def scaled(name: str, scale: float) -> int:
+    return max(1, int(VOLUMES[name] * scale))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def _date(rng: random.Random, fmt: str = "%Y-%m-%d") -> str:
+    return (BASE_DATE + timedelta(days=rng.randrange(365))).strftime(fmt)
+
+
+def _batches(documents: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def application_document(rng: random.Random, companies: list[dict]) -> dict:
+    country = rng.choice(list(COUNTRIES))
+    return {
+        "id": _uuid(rng),
+        "company": rng.choice(companies)["name"],
+        "location": {"country": country, "city": rng.choice(COUNTRIES[country])},
+        "date": _date(rng),
+        "title": rng.choice(JOB_TITLES),
+        "notes": _text(rng, rng.randrange(0, 40)),
+        "recruiter_name": "",
+        "recruiter_email": "",
+        "role": rng.choice(list(JobRoles)).value,
+        "status": rng.choice(list(ApplicationStatuses)).value,
+        "referred": rng.random() < 0.2,
+        "active": rng.random() < 0.9,
+        "archived": rng.random() < 0.1,
+    }
+
+
+def resume_document(rng: random.Random) -> dict:
+    file_id = _uuid(rng).replace("-", "")
+    return {
+        "id": _uuid(rng),
+        "file_id": file_id,
+        "date": _date(rng),
+        "link": f"https://drive.google.com/file/d/{file_id}/view",
+        "name": f"resume-{file_id[:8]}.pdf",
+        "role": rng.choice(JOB_TITLES),
+        "notes": "",
+        "archived": False,
+        "status": "ready",
+        "upload_job_id": None,
+        "sha256": None,
+    }
+
+
+def member_documents(
+    rng: random.Random, count: int, companies: list[dict], password_hash: str
+) -> Iterator[dict]:
+    for index in range(count):
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield {
+            "_id": ObjectId(),
+            "email": member_email(index),
+            "first_name": first_name,
+            "middle_name": "",
+            "last_name": last_name,
+            "full_name": f"{first_name} {last_name}",
+            "image": "",
+            "phone_number": f"+233{rng.randrange(10**8, 10**9)}",
+            "address": "",
+            "password": password_hash,
+            "date_of_birth": "",
+            "university": rng.choice(UNIVERSITIES),
+            "start_date": "",
+            "end_date": "",
+            "is_active": True,
+            "email_verified": True,
+            "role": UserRoles.member.value,
+            "referral_essay": _text(rng, rng.randrange(0, 400)),
+            "cover_letter": _text(rng, rng.randrange(0, 300)),
+            "resumes": [
+                resume_document(rng) for _ in range(rng.randrange(MAX_RESUMES + 1))
+            ],
+            "applications": [
+                application_document(rng, companies)
+                for _ in range(rng.randrange(MAX_APPLICATIONS + 1))
+            ],
+            "mentor_id": None,
+            "google_id": None,
+            "oauth_provider": None,
+        }
+
+
+def company_documents(rng: random.Random, count: int) -> list[dict]:
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Company {index:04d}",
+            "domain": f"company{index:04d}.example.com",
+            "image": "",
+            "referral_link": "",
+            "can_refer": rng.random() < 0.9,
+            "locations": [],
+            "referral_materials": {
+                "resume": True,
+                "essay": rng.random() < 0.5,
+                "phone_number": rng.random() < 0.5,
+            },
+            "metadata": {
+                "description": _text(rng, 30),
+                "industry": rng.choice(["Fintech", "Cloud", "E-commerce", "Media"]),
+                "size": rng.choice(["Startup", "Mid-size", "Enterprise"]),
+                "headquarters": rng.choice(list(COUNTRIES)),
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def referral_documents(
+    rng: random.Random, count: int, members: list[dict], companies: list[dict]
+) -> Iterator[dict]:
+    for _ in range(count):
+        member, company = rng.choice(members), rng.choice(companies)
+        status = rng.choice(list(ReferralStatuses)).value
+        yield {
+            "user_id": member["_id"],
+            "company_id": company["_id"],
+            "company_name": company["name"],
+            "job_title": rng.choice(JOB_TITLES),
+            "job_id": str(rng.randrange(10**6)),
+            "role": rng.choice(list(JobRoles)).value,
+            "request_note": _text(rng, rng.randrange(0, 60)),
+            "review_note": "",
+            "resume": f"https://drive.google.com/file/d/{_uuid(rng)}/view",
+            "phone_number": member["phone_number"],
+            "email": member["email"],
+            "essay": "",
+            "referral_date": _date(rng, REFERRAL_DATE_FORMAT),
+            "feedback_date": None
+            if status == ReferralStatuses.pending.value
+            else _date(rng, REFERRAL_DATE_FORMAT),
+            "status": status,
+        }
+
+
+def lesson_documents(rng: random.Random, count: int) -> Iterator[dict]:
+    for index in range(count):
+        category = rng.choice(list(CATEGORIES))
+        yield {
+            "title": f"Lesson {index:04d}",
+            "category": category,
+            "topic": rng.choice(CATEGORIES[category]),
+            "description": _text(rng, 50),
+            "video_id": _uuid(rng)[:11],
+            "content_type": "video",
+            "resources": [],
+            "code_examples": [],
+            "difficulty": rng.choice(["Beginner", "Easy", "Medium", "Hard"]),
+            "tags": [],
+            "duration_minutes": rng.randrange(5, 60),
+            "created_by": 0,
+            "created_at": BASE_DATE,
+            "updated_at": BASE_DATE,
+            "is_published": True,
+            "view_count": rng.randrange(1000),
+            "instructor": "",
+            "year": 2025,
+        }
+
+
+def progress_documents(rng: random.Random, members: list[dict]) -> Iterator[dict]:
+    for member in members:
+        if rng.random() >= PROGRESS_RATIO:
+            continue
+        completed = rng.sample(TOPIC_KEYS, rng.randrange(len(TOPIC_KEYS)))
+        yield {
+            "user_id": member["_id"],
+            "completed_topics": [
+                {
+                    "topic_key": topic_key,
+                    "completed_at": BASE_DATE + timedelta(days=rng.randrange(365)),
+                    "count": rng.randrange(1, 4),
+                }
+                for topic_key in completed
+            ],
+            "bookmarked_topics": rng.sample(TOPIC_KEYS, rng.randrange(5)),
+            "topic_notes": {
+                topic_key: _text(rng, 20) for topic_key in completed[:3]
+            },
+            "last_updated": BASE_DATE,
+            "created_at": BASE_DATE,
+        }
+
+
+def privileged_user_documents(
+    volunteers: int, companies: list[dict], password_hash: str
+) -> list[dict]:
+    def account(username: str, role: UserRoles, company: dict | None = None) -> dict:
+        return {
+            "_id": ObjectId(),
+            "username": username,
+            "password": password_hash,
+            "lead_token": BENCH_PASSWORD,
+            "role": role.value,
+            "company_id": company["_id"] if company else None,
+            "company_name": company["name"] if company else None,
+            "is_active": True,
+        }
+
+    accounts = [account(LEAD_USERNAME, UserRoles.lead)]
+    accounts += [
+        account(f"bench-volunteer-{index:02d}", UserRoles.volunteer)
+        for index in range(volunteers)
+    ]
+    accounts += [
+        account(f"bench-referrer-{index:04d}", UserRoles.referrer, company)
+        for index, company in enumerate(companies)
+    ]
+    return accounts
+
+
+def review_documents(
+    rng: random.Random, count: int, members: list[dict], volunteers: list[dict]
+) -> Iterator[dict]:
+    for _ in range(count):
+        member = rng.choice(members)
+        status = rng.choice(["Pending", "In Review", "Completed"])
+        reviewer = rng.choice(volunteers) if status != "Pending" else None
+        yield {
+            "user_id": member["_id"],
+            "user_name": member["full_name"],
+            "user_email": member["email"],
+            "resume_link": f"https://drive.google.com/file/d/{_uuid(rng)}/view",
+            "job_title": rng.choice(JOB_TITLES),
+            "level": rng.choice(["Intern", "New Grad", "Mid-level"]),
+            "status": status,
+            "submitted_date": _date(rng),
+            "reviewed_by": reviewer["_id"] if reviewer else None,
+            "reviewer_name": reviewer["username"] if reviewer else None,
+            "assigned_date": _date(rng) if reviewer else None,
+            "review_date": _date(rng) if status == "Completed" else None,
+            "feedback": _text(rng, 80) if status == "Completed" else "",
+            "notes": "",
+            "updated_at": None,
+        }
+
+
+def seed(
+    db: Database, *, scale: float = 1.0, random_seed: int = 0, batch_size: int = 1000
+) -> dict[str, int]:
+    """Drop the benchmark collections and fill them again. Returns counts."""
+    rng = random.Random(random_seed)
+    # bcrypt is deliberately slow; every account shares one hash
+    password_hash = get_password_hash(BENCH_PASSWORD)
+
+    for name in COLLECTIONS:
+        db.drop_collection(name)
+
+    companies = company_documents(rng, scaled("companies", scale))
+    db.companies.insert_many(companies)
+
+    # Referrals and reviews only need a few fields of each member
+    members = []
+    member_count = scaled("members", scale)
+    for batch in _batches(
+        member_documents(rng, member_count, companies, password_hash), batch_size
+    ):
+        db.member_users.insert_many(batch)
+        members += [
+            {key: member[key] for key in ("_id", "email", "full_name", "phone_number")}
+            for member in batch
+        ]
+
+    privileged_users = privileged_user_documents(
+        scaled("volunteers", scale), companies, password_hash
+    )
+    db.privileged_users.insert_many(privileged_users)
+    volunteers = [
+        user for user in privileged_users if user["role"] == UserRoles.volunteer.value
+    ]
+
+    referral_count = scaled("referrals", scale)
+    for batch in _batches(
+        referral_documents(rng, referral_count, members, companies), batch_size
+    ):
+        db.referrals.insert_many(batch)
+    for batch in _batches(lesson_documents(rng, scaled("lessons", scale)), batch_size):
+        db.lessons.insert_many(batch)
+    for batch in _batches(progress_documents(rng, members), batch_size):
+        db.user_progress.insert_many(batch)
+    for batch in _batches(
+        review_documents(rng, scaled("reviews", scale), members, volunteers), batch_size
+    ):
+        db.resume_reviews.insert_many(batch)
+
+    return {name: db[name].estimated_document_count() for name in COLLECTIONS}
@@ -0,0 +1,76 @@
+"""
+Gunicorn configuration for production.
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+Runs uvicorn workers under gunicorn's process manager. The app is imported
+once in the master and shared copy-on-write with the forked workers; every
+per-process resource (MongoDB client, background pool, log writer) is created
+after the fork. Tuning comes from the settings (see app/core/settings.py).
+"""
+
+import os
+import shutil
+import tempfile
+
+# Each worker has its own metrics; they meet in this directory (see
+# app/core/metrics.py). Set before the settings are loaded.
+os.environ.setdefault(
+    "METRICS_MULTIPROC_DIR",
+    os.path.join(
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+        f"te-metrics-{os.getpid()}",
+    ),
+)
+
+from app.core.settings import settings  # noqa: E402
+
+
+def _cpu_count() -> int:
+    # Respects CPU affinity (e.g. container cpusets) where the OS supports it
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _worker_count() -> int:
+    if settings.WEB_CONCURRENCY:
+        return settings.WEB_CONCURRENCY
+    workers = int(_cpu_count() * settings.WORKERS_PER_CORE)
+    return max(1, min(workers, settings.MAX_WORKERS))
+
+
+bind = f"0.0.0.0:{settings.PORT}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = _worker_count()
+preload_app = True
+
+backlog = settings.SERVER_BACKLOG
+keepalive = settings.SERVER_KEEPALIVE_SECONDS  # Passed to uvicorn's keep-alive
+timeout = settings.SERVER_TIMEOUT_SECONDS
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT_SECONDS
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = max_requests // 10  # Stagger recycling across workers
+
+# Worker heartbeats go to a file; keep it off disk-backed /tmp
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Access lines are already logged by RequestMiddleware
+accesslog = None
+errorlog = "-"
+
+
+def on_starting(server):
+    # Start from an empty directory: snapshots of a previous run are stale
+    shutil.rmtree(settings.METRICS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(settings.METRICS_MULTIPROC_DIR)
+
+
+def child_exit(server, worker):
+    from app.core.metrics import remove_snapshot
+
+    remove_snapshot(settings.METRICS_MULTIPROC_DIR, worker.pid)
+
+
+def on_exit(server):
+    shutil.rmtree(settings.METRICS_MULTIPROC_DIR, ignore_errors=True)
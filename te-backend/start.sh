@@ -5,12 +5,12 @@ set -e  # Exit on error
 
 echo "🚀 Starting TechElevate Backend..."
 
-# Run prestart script (database initialization)
-if [ -f ./prestart.sh ]; then
-    echo "⚙️ Running prestart tasks..."
-    bash ./prestart.sh
-fi
+# Database initialization (admin bootstrap, indexes, migrations) runs in the
+# app's startup hook. prestart.sh starts the development server, so it is not
+# run here.
 
-# Start the application
-echo "🌐 Starting Uvicorn server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-10000} --workers 1
+# Start the application: uvicorn workers under gunicorn, one per core by
+# default (see gunicorn.conf.py for the WEB_CONCURRENCY and SERVER_* knobs)
+echo "🌐 Starting Gunicorn server..."
+export PORT=${PORT:-10000}
+exec gunicorn app.main:app -c gunicorn.conf.py
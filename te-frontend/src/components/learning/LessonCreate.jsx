@@ -12,6 +12,7 @@ const lessonFormats = {
     "Video": "video", "Document (File)": "document", "Document (Link)": "document", "Web page": "html"
 };
 const initialLessonState = { category: "", subcategory: null, format: "", link: "" };
+const UPLOAD_POLL_INTERVAL_MS = 1000;
 
 const LessonCreate = ({ setAddLesson, lessonCategories }) => {
     const { accessToken } = useAuth();
@@ -67,7 +68,24 @@ const LessonCreate = ({ setAddLesson, lessonCategories }) => {
                     },
                 });
 
-                handleInputChange({ field: "link", value: response.data.file.link });
+                // The file is uploaded to Drive in the background; poll until it finishes
+                let job = response.data.job;
+                while (job.status === "queued" || job.status === "uploading") {
+                    await new Promise((resolve) => setTimeout(resolve, UPLOAD_POLL_INTERVAL_MS));
+                    const jobResponse = await axiosInstance.get(`/uploads/${job.id}`, {
+                        headers: {
+                            Authorization: `Bearer ${accessToken}`,
+                        },
+                    });
+                    job = jobResponse.data.job;
+                }
+
+                if (job.status === "failed") {
+                    setSubmitError(job.error || 'Failed to upload file. Please try again.');
+                    return;
+                }
+
+                handleInputChange({ field: "link", value: job.result.link });
             } catch (error) {
                 console.error('Error uploading file:', error);
                 setSubmitError(error.response?.data?.detail || 'Failed to upload file. Please try again.');
@@ -258,9 +258,23 @@ const Referrals = () => {
                 }
             );
 
-            if (response.data.sheet_url) {
+            // The export runs in the background; poll until the sheet is ready
+            let job = response.data.job;
+            while (job.status === 'queued' || job.status === 'running') {
+                await new Promise((resolve) => setTimeout(resolve, 2000));
+                const jobResponse = await axiosInstance.get(`/exports/${job.id}`, {
+                    headers: { Authorization: `Bearer ${accessToken}` }
+                });
+                job = jobResponse.data.job;
+            }
+
+            if (job.status === 'failed') {
+                throw new Error(job.error || 'Export failed');
+            }
+
+            if (job.url) {
                 // Open the sheet in a new tab
-                window.open(response.data.sheet_url, '_blank');
+                window.open(job.url, '_blank');
                 alert('Referrals exported successfully!');
             }
         } catch (error) {
@@ -133,19 +133,23 @@ const ResumesAndEssaysManagement = () => {
         localStorage.setItem('ResumesAndEssaysManagementActiveTab', activeTab);
     }, [activeTab]);
 
-    // Fetch all users with their files
+    // Fetch all users with their files (summary only; full essays load per user)
     const fetchAllUsersFiles = useCallback(async () => {
         setLoading(true);
         try {
-            console.log('Fetching all users files from /users/files/all...');
-            // This endpoint should return all users with their files
-            const response = await axiosInstance.get('/users/files/all', {
-                headers: {
-                    Authorization: `Bearer ${accessToken}`,
-                },
-            });
-            console.log('Users files response:', response.data);
-            setUsers(response.data.users || []);
+            const allUsers = [];
+            let cursor = null;
+            do {
+                const response = await axiosInstance.get('/users/files/all', {
+                    headers: {
+                        Authorization: `Bearer ${accessToken}`,
+                    },
+                    params: { summary: true, limit: 200, ...(cursor && { cursor }) },
+                });
+                allUsers.push(...(response.data.users || []));
+                cursor = response.data.next_cursor;
+            } while (cursor);
+            setUsers(allUsers);
         } catch (error) {
             console.error('Error fetching users files:', error);
             console.error('Error details:', error.response?.data || error.message);
@@ -271,9 +275,21 @@ const ResumesAndEssaysManagement = () => {
     };
 
     // Open user details modal
-    const handleUserClick = (user) => {
+    const handleUserClick = async (user) => {
         setSelectedUser(user);
         setShowUserDetailsModal(true);
+
+        // The listing only carries essay lengths; load the full text
+        try {
+            const response = await axiosInstance.get(`/users/${user.id}/files`, {
+                headers: { Authorization: `Bearer ${accessToken}` }
+            });
+            setSelectedUser(current =>
+                current?.id === user.id ? { ...current, ...response.data.user } : current
+            );
+        } catch (error) {
+            console.error('Error fetching user files:', error);
+        }
     };
 
     // Close user details modal
@@ -564,7 +580,7 @@ const ResumesAndEssaysManagement = () => {
     // Filtered and sorted Essays
     const filteredEssays = useMemo(() => {
         // Get users with essays
-        let usersWithEssays = users.filter(u => u.referral_essay || u.cover_letter);
+        let usersWithEssays = users.filter(u => u.referral_essay_length || u.cover_letter_length);
 
         // Apply search filter (name or email)
         if (essaysSearch) {